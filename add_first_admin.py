@@ -153,6 +153,7 @@ def main():
         if full_name:
             print(f"   Full name: {full_name}")
         print("\n🎉 You can now use /admin command in the bot!")
+        print("   (A running bot picks up new admins within ADMIN_CACHE_TTL_SECONDS, default 5 minutes.)")
     else:
         print("❌ Failed to add admin user")
         sys.exit(1)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Memory held per booking by each admin read shape.
+
+Usage:
+    python benchmarks/booking_memory.py [--rows 100000]
+
+Seeds one database with --rows recording bookings, then loads all of them as
+Booking entities (find_page), as BookingRecord tuples (find_records) and as
+history records from the bookings projection. Memory is measured with
+tracemalloc on the result list, so it is what a caller keeps alive.
+"""
+import argparse
+import asyncio
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+import domains  # noqa: F401  (resolves the domains <-> infrastructure import order)
+from infrastructure.database.sqlite_connection import SQLiteConnection
+from infrastructure.database.repositories.booking_history_repository import BookingHistoryRepository
+from infrastructure.database.repositories.recording_booking_repository import RecordingBookingRepository
+from pragma_profiles import make_booking
+
+SEED_BATCH = 5000
+
+
+async def measure(load) -> tuple:
+    """Run one loader, return (rows, bytes retained, seconds)."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = await load()
+    elapsed = time.perf_counter() - started
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(result), retained, elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100000, help="bookings to load")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SQLiteConnection(str(Path(tmp) / "memory.db"), pragma_profile="throughput")
+        db.initialize_schema()
+        repo = RecordingBookingRepository(db)
+        history = BookingHistoryRepository(db)
+        for start in range(0, args.rows, SEED_BATCH):
+            await repo.save_many([make_booking(i) for i in range(start, min(start + SEED_BATCH, args.rows))])
+        
+        loaders = (
+            ("Booking entities", lambda: repo.find_page(None, None, args.rows)),
+            ("BookingRecord", lambda: repo.find_records(None, None, args.rows)),
+            ("history records", lambda: history.find_page("recording", args.rows)),
+        )
+        print(f"{'shape':<18}{'rows':>9}{'bytes/booking':>15}{'load ms':>10}")
+        for name, load in loaders:
+            rows, retained, elapsed = await measure(load)
+            print(f"{name:<18}{rows:>9}{retained / max(rows, 1):>15,.0f}{elapsed * 1000:>10,.0f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Booking insert throughput with and without group commit.
+
+Usage:
+    python benchmarks/group_commit.py [--rows 1000] [--windows 0,5,20] [--profile durable]
+
+Each (window, concurrency) pair gets a fresh database file in a temporary
+directory. A completion persists one booking through
+RecordingBookingRepository.save, which is the database work done by
+CompleteBookingUseCase.execute; "concurrency" completions are in flight at
+any time. Window 0 is the default one-commit-per-save behaviour.
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+import domains  # noqa: F401  (resolves the domains <-> infrastructure import order)
+from infrastructure.database.pragmas import PRAGMA_PROFILES
+from infrastructure.database.sqlite_connection import SQLiteConnection
+from infrastructure.database.repositories.recording_booking_repository import RecordingBookingRepository
+from pragma_profiles import make_booking
+
+CONCURRENCY_LEVELS = (1, 10, 100)
+
+
+async def insert_concurrently(db: SQLiteConnection, rows: int, concurrency: int) -> float:
+    """Insert bookings with a fixed number in flight, return inserts/sec."""
+    repo = RecordingBookingRepository(db)
+    next_row = iter(range(rows))
+    
+    async def worker() -> None:
+        for i in next_row:
+            await repo.save(make_booking(i))
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return rows / (time.perf_counter() - started)
+
+
+async def bench(directory: Path, profile: str, window_ms: float, concurrency: int, rows: int) -> tuple:
+    """Benchmark one configuration, return (inserts/sec, average commit batch)."""
+    db = SQLiteConnection(
+        str(directory / f"w{window_ms:g}-c{concurrency}.db"),
+        pragma_profile=profile,
+        group_commit_window_ms=window_ms
+    )
+    db.initialize_schema()
+    inserts_per_sec = await insert_concurrently(db, rows, concurrency)
+    metrics = db.get_pool_metrics()
+    db.close()
+    return inserts_per_sec, metrics['group_commit_avg_batch'] or 1.0
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1000, help="bookings to insert per configuration")
+    parser.add_argument("--windows", default="0,5,20", help="comma-separated group commit windows (ms)")
+    parser.add_argument("--profile", default="durable", choices=list(PRAGMA_PROFILES), help="pragma profile")
+    args = parser.parse_args()
+    windows = [float(window) for window in args.windows.split(",")]
+    
+    print(f"{'window ms':>10}{'concurrency':>13}{'inserts/sec':>14}{'avg batch':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for window_ms in windows:
+            for concurrency in CONCURRENCY_LEVELS:
+                inserts, batch = await bench(Path(tmp), args.profile, window_ms, concurrency, args.rows)
+                print(f"{window_ms:>10g}{concurrency:>13}{inserts:>14,.0f}{batch:>11.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
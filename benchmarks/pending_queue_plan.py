@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Query plans and latency of the pending-order queries as history grows.
+
+Usage:
+    python benchmarks/pending_queue_plan.py [--steps 1000,10000,100000] [--pending 50]
+
+Grows the recording_bookings history to each step (every booking beyond the
+first --pending is confirmed), runs ANALYZE, then checks that every pending
+query of every booking table is planned on its partial idx_<table>_pending
+index without a temporary sort. Exits non-zero if a plan regresses, so it can
+run as a check after schema changes.
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+import domains  # noqa: F401  (resolves the domains <-> infrastructure import order)
+from infrastructure.database.booking_tables import BOOKING_TABLES, PENDING_STATUS, BookingTable
+from infrastructure.database.sqlite_connection import SQLiteConnection
+from infrastructure.database.repositories.recording_booking_repository import RecordingBookingRepository
+from pragma_profiles import make_booking
+
+SEED_BATCH = 5000
+PAGE_SIZE = 10
+
+
+def pending_queries(table: BookingTable) -> list:
+    """(name, sql, params) of every query that reads the pending queue."""
+    return [
+        ("find_by_status", table.find_pending_sql, ()),
+        ("find_page", table.find_page_sql(False, PENDING_STATUS), (PAGE_SIZE,)),
+        ("find_page cursor", table.find_page_sql(True, PENDING_STATUS), ("9999", "", PAGE_SIZE)),
+        ("find_records", table.find_page_sql(False, PENDING_STATUS, records=True), (PAGE_SIZE,)),
+    ]
+
+
+def check_plans(db: SQLiteConnection) -> list:
+    """Return a description of every pending query not planned on its partial index."""
+    conn = db.get_connection()
+    failures = []
+    for table in BOOKING_TABLES:
+        index = f"idx_{table.table}_pending"
+        for name, sql, params in pending_queries(table):
+            plan = " | ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+            if index not in plan or "TEMP B-TREE" in plan:
+                failures.append(f"{table.table} {name}: {plan}")
+    return failures
+
+
+async def grow(repo: RecordingBookingRepository, start: int, stop: int, pending: int) -> None:
+    """Insert bookings start..stop, all but the first `pending` of them confirmed."""
+    for batch_start in range(start, stop, SEED_BATCH):
+        bookings = []
+        for i in range(batch_start, min(batch_start + SEED_BATCH, stop)):
+            booking = make_booking(i)
+            if i >= pending:
+                booking.confirm()
+            bookings.append(booking)
+        await repo.save_many(bookings)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", default="1000,10000,100000", help="comma-separated history sizes")
+    parser.add_argument("--pending", type=int, default=50, help="pending bookings in the queue")
+    args = parser.parse_args()
+    steps = [int(step) for step in args.steps.split(",")]
+    
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db = SQLiteConnection(str(Path(tmp) / "pending.db"), pragma_profile="throughput")
+        db.initialize_schema()
+        repo = RecordingBookingRepository(db)
+        
+        print(f"{'bookings':>10}{'pending page ms':>17}{'plan':>7}")
+        seeded = 0
+        for step in steps:
+            await grow(repo, seeded, step, args.pending)
+            seeded = step
+            db.get_connection().execute("ANALYZE")
+            
+            started = time.perf_counter()
+            runs = 100
+            for _ in range(runs):
+                await repo.find_records(None, None, PAGE_SIZE, status=PENDING_STATUS)
+            elapsed_ms = (time.perf_counter() - started) * 1000 / runs
+            
+            step_failures = check_plans(db)
+            failures.extend(step_failures)
+            print(f"{step:>10,}{elapsed_ms:>17.3f}{'ok' if not step_failures else 'FAIL':>7}")
+        db.close()
+    
+    for failure in failures:
+        print(f"plan regression: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
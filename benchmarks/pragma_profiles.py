@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Booking insert/read throughput for each SQLite pragma profile.
+
+Usage:
+    python benchmarks/pragma_profiles.py [--rows 2000] [--reads 200]
+
+Each profile gets a fresh database file in a temporary directory. Inserts go
+through RecordingBookingRepository.save, one booking per transaction, the
+same way CompleteBookingUseCase persists them.
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from uuid import uuid4
+
+# Add project root and src to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+import domains  # noqa: F401  (resolves the domains <-> infrastructure import order)
+from domains.recording.entities.booking import Booking, BookingId
+from infrastructure.database.pragmas import PRAGMA_PROFILES
+from infrastructure.database.sqlite_connection import SQLiteConnection
+from infrastructure.database.repositories.recording_booking_repository import RecordingBookingRepository
+
+
+def make_booking(i: int) -> Booking:
+    """Build a pending recording booking."""
+    return Booking(
+        id=BookingId(str(uuid4())),
+        user_id=100000 + i,
+        user_name=f"user {i}",
+        user_contact=f"0912{i:07d}",
+        created_at=datetime.now(),
+        service_tier_id="basic",
+        service_option_id="basic_hourly",
+        tracking_code=f"B{i:05d}",
+        status="pending"
+    )
+
+
+async def insert_bookings(db: SQLiteConnection, rows: int) -> float:
+    """Insert bookings one transaction at a time, return inserts/sec."""
+    repo = RecordingBookingRepository(db)
+    started = time.perf_counter()
+    for i in range(rows):
+        await repo.save(make_booking(i))
+    return rows / (time.perf_counter() - started)
+
+
+async def read_bookings(db: SQLiteConnection, reads: int) -> float:
+    """Run pending-list and tracking-code lookups, return reads/sec."""
+    repo = RecordingBookingRepository(db)
+    started = time.perf_counter()
+    for i in range(reads):
+        if i % 2:
+            await repo.find_by_status("pending")
+        else:
+            await repo.find_by_tracking_code(f"B{i:05d}")
+    return reads / (time.perf_counter() - started)
+
+
+async def bench_profile(name: str, directory: Path, rows: int, reads: int) -> tuple:
+    """Benchmark a single profile, return (inserts/sec or None, reads/sec)."""
+    db_path = str(directory / f"{name}.db")
+    profile = PRAGMA_PROFILES[name]
+
+    if profile.query_only:
+        # Query-only profiles cannot insert; seed with the durable profile first
+        seed = SQLiteConnection(db_path, pragma_profile="durable")
+        seed.initialize_schema()
+        await insert_bookings(seed, rows)
+        seed.close()
+        inserts_per_sec = None
+        db = SQLiteConnection(db_path, pragma_profile=name)
+    else:
+        db = SQLiteConnection(db_path, pragma_profile=name)
+        db.initialize_schema()
+        inserts_per_sec = await insert_bookings(db, rows)
+
+    reads_per_sec = await read_bookings(db, reads)
+    db.close()
+    return inserts_per_sec, reads_per_sec
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=2000, help="bookings to insert per profile")
+    parser.add_argument("--reads", type=int, default=200, help="read queries per profile")
+    args = parser.parse_args()
+
+    print(f"{'profile':<18}{'inserts/sec':>14}{'reads/sec':>14}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in PRAGMA_PROFILES:
+            inserts, reads = await bench_profile(name, Path(tmp), args.rows, args.reads)
+            inserts_display = f"{inserts:,.0f}" if inserts is not None else "n/a"
+            print(f"{name:<18}{inserts_display:>14}{reads:>14,.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -15,6 +15,66 @@ class Settings:
     CHANNEL_ID: str = os.getenv('CHANNEL_ID', '')
     CHANNEL_USERNAME: str = os.getenv('CHANNEL_USERNAME', '')
     
+    # Database Configuration
+    # Pragma profile: "durable" (WAL, fsync per commit), "throughput" (WAL,
+    # synchronous=NORMAL, mmap) or "readonly-report" (query-only reporting)
+    DB_PRAGMA_PROFILE: str = os.getenv('DB_PRAGMA_PROFILE', 'durable')
+    # Read-only connections serving admin history/search alongside the writer
+    DB_READ_POOL_SIZE: int = int(os.getenv('DB_READ_POOL_SIZE', '4'))
+    # Writes arriving within this many ms share one commit (0 disables group commit)
+    DB_GROUP_COMMIT_WINDOW_MS: float = float(os.getenv('DB_GROUP_COMMIT_WINDOW_MS', '0'))
+    # Archive database attached for cold bookings (empty: <database>_archive.db alongside it)
+    DB_ARCHIVE_PATH: str = os.getenv('DB_ARCHIVE_PATH', '')
+    # Confirmed/cancelled bookings older than this many days move to the archive (0 disables)
+    ARCHIVE_AFTER_DAYS: int = int(os.getenv('ARCHIVE_AFTER_DAYS', '180'))
+    # Bookings moved per archive transaction, and hours between archive runs
+    ARCHIVE_BATCH_SIZE: int = int(os.getenv('ARCHIVE_BATCH_SIZE', '500'))
+    ARCHIVE_INTERVAL_HOURS: float = float(os.getenv('ARCHIVE_INTERVAL_HOURS', '24'))
+    # Online backups: snapshot directory (empty: data/backups), hours between runs
+    # (0 disables the scheduled job), snapshots kept per database file, and how
+    # many pages each backup step copies before pausing for BACKUP_STEP_SLEEP_MS;
+    # after BACKUP_MAX_RESTARTS write-induced restarts a file is copied in one step
+    BACKUP_DIR: str = os.getenv('BACKUP_DIR', '')
+    BACKUP_INTERVAL_HOURS: float = float(os.getenv('BACKUP_INTERVAL_HOURS', '24'))
+    BACKUP_RETENTION: int = int(os.getenv('BACKUP_RETENTION', '7'))
+    BACKUP_PAGES_PER_STEP: int = int(os.getenv('BACKUP_PAGES_PER_STEP', '256'))
+    BACKUP_STEP_SLEEP_MS: float = float(os.getenv('BACKUP_STEP_SLEEP_MS', '10'))
+    BACKUP_MAX_RESTARTS: int = int(os.getenv('BACKUP_MAX_RESTARTS', '5'))
+    
+    # Admin Configuration
+    # Seconds the in-memory admin set is trusted before it is reloaded (picks up
+    # admins added outside the bot, e.g. by add_first_admin.py)
+    ADMIN_CACHE_TTL_SECONDS: float = float(os.getenv('ADMIN_CACHE_TTL_SECONDS', '300'))
+    
+    # Channel Membership Cache
+    # Seconds a user's channel membership is trusted before get_chat_member is
+    # asked again; non-members are re-checked sooner so joining takes effect fast
+    CHANNEL_MEMBER_CACHE_TTL_SECONDS: float = float(os.getenv('CHANNEL_MEMBER_CACHE_TTL_SECONDS', '600'))
+    CHANNEL_NON_MEMBER_CACHE_TTL_SECONDS: float = float(os.getenv('CHANNEL_NON_MEMBER_CACHE_TTL_SECONDS', '10'))
+    # Seconds a membership learned from a chat_member update is trusted without
+    # re-checking (updates are missed while the bot is down or not a channel admin)
+    CHANNEL_MEMBER_UPDATE_MAX_AGE_SECONDS: float = float(os.getenv('CHANNEL_MEMBER_UPDATE_MAX_AGE_SECONDS', '86400'))
+    
+    # Notification Outbox
+    # Seconds between polls of the outbox when it is empty, notifications sent per
+    # poll, and retry policy for failed sends (exponential backoff from
+    # NOTIFICATION_RETRY_BASE_SECONDS, capped at NOTIFICATION_RETRY_MAX_SECONDS)
+    NOTIFICATION_POLL_INTERVAL_SECONDS: float = float(os.getenv('NOTIFICATION_POLL_INTERVAL_SECONDS', '1'))
+    NOTIFICATION_BATCH_SIZE: int = int(os.getenv('NOTIFICATION_BATCH_SIZE', '20'))
+    NOTIFICATION_MAX_ATTEMPTS: int = int(os.getenv('NOTIFICATION_MAX_ATTEMPTS', '10'))
+    NOTIFICATION_RETRY_BASE_SECONDS: float = float(os.getenv('NOTIFICATION_RETRY_BASE_SECONDS', '5'))
+    NOTIFICATION_RETRY_MAX_SECONDS: float = float(os.getenv('NOTIFICATION_RETRY_MAX_SECONDS', '3600'))
+    
+    # Outgoing Request Rate Limits
+    # Telegram allows about 30 messages per second overall, 1 per second to one
+    # private chat (short bursts tolerated) and 20 per minute to one group;
+    # requests that still hit flood control are retried RATE_LIMIT_MAX_RETRIES times
+    RATE_LIMIT_GLOBAL_PER_SECOND: float = float(os.getenv('RATE_LIMIT_GLOBAL_PER_SECOND', '30'))
+    RATE_LIMIT_CHAT_PER_SECOND: float = float(os.getenv('RATE_LIMIT_CHAT_PER_SECOND', '1'))
+    RATE_LIMIT_CHAT_BURST: int = int(os.getenv('RATE_LIMIT_CHAT_BURST', '3'))
+    RATE_LIMIT_GROUP_PER_MINUTE: float = float(os.getenv('RATE_LIMIT_GROUP_PER_MINUTE', '20'))
+    RATE_LIMIT_MAX_RETRIES: int = int(os.getenv('RATE_LIMIT_MAX_RETRIES', '1'))
+    
     @classmethod
     def validate(cls) -> None:
         """Validate required settings."""
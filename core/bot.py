@@ -2,7 +2,8 @@
 import logging
 from telegram.ext import Application
 from config import Settings
-from core.lifecycle import get_post_init_callback
+from core.lifecycle import get_post_init_callback, get_post_shutdown_callback
+from core.rate_limiter import PriorityRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,9 @@ def create_application() -> Application:
     application = (
         Application.builder()
         .token(Settings.BOT_TOKEN)
+        .rate_limiter(PriorityRateLimiter())
         .post_init(get_post_init_callback())
+        .post_shutdown(get_post_shutdown_callback())
         .build()
     )
     
@@ -0,0 +1,151 @@
+"""Application-scoped dependency container."""
+import logging
+from typing import Dict, Optional
+from shared.handlers.flow_manager import FlowManager
+from domains.recording import (
+    RecordingRepository,
+    GetServiceTiersUseCase,
+    GetServiceTierOptionsUseCase,
+    CompleteBookingUseCase,
+    RecordingFlowHandler,
+)
+from domains.music_production import (
+    MusicProductionRepository,
+    GetServiceTiersUseCase as MPGetServiceTiersUseCase,
+    GetServiceTierOptionsUseCase as MPGetServiceTierOptionsUseCase,
+    CompleteBookingUseCase as MPCompleteBookingUseCase,
+    MusicProductionFlowHandler,
+)
+from domains.mix_master import MixMasterFlowHandler
+from domains.consultation import ConsultationFlowHandler
+from domains.distribution import DistributionFlowHandler
+from domains.admin import AdminHandler
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from infrastructure.database.backup import DatabaseBackup
+from infrastructure.database.booking_archiver import BookingArchiver
+from infrastructure.database.repositories.admin_repository import AdminRepository
+from infrastructure.database.repositories.recording_booking_repository import RecordingBookingRepository
+from infrastructure.database.repositories.music_production_booking_repository import MusicProductionBookingRepository
+from infrastructure.database.repositories.mix_master_booking_repository import MixMasterBookingRepository
+from infrastructure.database.repositories.consultation_booking_repository import ConsultationBookingRepository
+from infrastructure.database.repositories.distribution_booking_repository import DistributionBookingRepository
+from infrastructure.database.repositories.booking_history_repository import BookingHistoryRepository
+from infrastructure.database.repositories.booking_stats_repository import BookingStatsRepository
+from infrastructure.database.repositories.channel_member_repository import ChannelMemberRepository
+from infrastructure.database.repositories.notification_outbox_repository import NotificationOutboxRepository
+from core.notification_dispatcher import NotificationDispatcher
+from shared.utils.construction_counts import get_construction_counts
+
+logger = logging.getLogger(__name__)
+
+
+class Container:
+    """
+    Builds every repository, use case and handler of the bot exactly once.
+    
+    Everything here has application lifetime: it is created when the
+    container is built at startup and shared by every update until the
+    process exits. Nothing is created per update; conversation state lives
+    in context.user_data, so the handlers themselves are stateless.
+    Components take all their dependencies as arguments, so the container
+    is the only place they are wired. Each component counts its own
+    constructions, so construction_counts() staying at one per class while
+    the bot serves updates shows there is no per-update allocation.
+    """
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Build all components on the given (or the shared) database connection."""
+        self.db = db or get_db_connection()
+        
+        # Repositories
+        self.admin_repository = AdminRepository(self.db)
+        self.recording_booking_repository = RecordingBookingRepository(self.db)
+        self.music_production_booking_repository = MusicProductionBookingRepository(self.db)
+        self.mix_master_booking_repository = MixMasterBookingRepository(self.db)
+        self.consultation_booking_repository = ConsultationBookingRepository(self.db)
+        self.distribution_booking_repository = DistributionBookingRepository(self.db)
+        self.booking_history_repository = BookingHistoryRepository(self.db)
+        self.booking_stats_repository = BookingStatsRepository(self.db)
+        self.channel_member_repository = ChannelMemberRepository(self.db)
+        self.notification_outbox_repository = NotificationOutboxRepository(self.db)
+        self.recording_repository = RecordingRepository()
+        self.music_production_repository = MusicProductionRepository()
+        
+        # Recording domain
+        self.recording_flow_handler = RecordingFlowHandler(
+            GetServiceTiersUseCase(self.recording_repository),
+            GetServiceTierOptionsUseCase(self.recording_repository),
+            CompleteBookingUseCase(self.recording_repository, self.recording_booking_repository),
+        )
+        
+        # Music Production domain
+        self.music_production_flow_handler = MusicProductionFlowHandler(
+            MPGetServiceTiersUseCase(self.music_production_repository),
+            MPGetServiceTierOptionsUseCase(self.music_production_repository),
+            MPCompleteBookingUseCase(self.music_production_repository, self.music_production_booking_repository),
+        )
+        
+        # Mix Master, Consultation and Distribution domains
+        self.mix_master_flow_handler = MixMasterFlowHandler(self.mix_master_booking_repository)
+        self.consultation_flow_handler = ConsultationFlowHandler(self.consultation_booking_repository)
+        self.distribution_flow_handler = DistributionFlowHandler(self.distribution_booking_repository)
+        
+        # Admin domain
+        self.admin_handler = AdminHandler(
+            self.admin_repository,
+            self.recording_booking_repository,
+            self.music_production_booking_repository,
+            self.mix_master_booking_repository,
+            self.consultation_booking_repository,
+            self.distribution_booking_repository,
+            self.booking_history_repository,
+            self.booking_stats_repository,
+        )
+        
+        # Database maintenance jobs
+        self.booking_archiver = BookingArchiver(self.db)
+        self.database_backup = DatabaseBackup(self.db)
+        
+        # Background delivery of queued notifications (started in post_init, stopped in post_shutdown)
+        self.notification_dispatcher = NotificationDispatcher(self.notification_outbox_repository)
+        
+        logger.info(f"Container built {sum(get_construction_counts().values())} components")
+    
+    @staticmethod
+    def construction_counts() -> Dict[str, int]:
+        """
+        Number of times each component class has been constructed in this process.
+        
+        Counted in the components' own __init__, so an instance built outside
+        the container (e.g. per update) shows up as a count above 1.
+        
+        Returns:
+            "<module>.<class>" -> constructions
+        """
+        return get_construction_counts()
+    
+    def register_flow_handlers(self) -> None:
+        """Register the flow handlers and keyboard creators with FlowManager."""
+        # Import here to avoid circular imports
+        from handlers.keyboard import create_reply_keyboard, create_cancel_keyboard
+        
+        FlowManager.set_reply_keyboard_creator(create_reply_keyboard)
+        FlowManager.set_cancel_keyboard_creator(create_cancel_keyboard)
+        
+        FlowManager.register_handler("recording", self.recording_flow_handler)
+        FlowManager.register_handler("music_production", self.music_production_flow_handler)
+        FlowManager.register_handler("mix_master", self.mix_master_flow_handler)
+        FlowManager.register_handler("consultation", self.consultation_flow_handler)
+        FlowManager.register_handler("distribution", self.distribution_flow_handler)
+
+
+# Singleton instance
+_container: Optional[Container] = None
+
+
+def get_container() -> Container:
+    """Get or build the application container."""
+    global _container
+    if _container is None:
+        _container = Container()
+    return _container
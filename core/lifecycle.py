@@ -1,18 +1,115 @@
 """Application lifecycle hooks."""
 import logging
-from telegram.ext import Application
+from datetime import datetime, timedelta
+from telegram.ext import Application, ContextTypes
 from config import Settings
 
 logger = logging.getLogger(__name__)
 
 
+async def archive_bookings(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Job: move old confirmed/cancelled bookings into the archive database."""
+    from core.container import get_container
+    
+    try:
+        await get_container().booking_archiver.run(Settings.ARCHIVE_AFTER_DAYS, Settings.ARCHIVE_BATCH_SIZE)
+    except Exception as e:
+        logger.error(f"Booking archive run failed: {e}", exc_info=True)
+
+
+async def backup_database(context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Job: write compressed snapshots of the database and its archive."""
+    from core.container import get_container
+    
+    try:
+        await get_container().database_backup.run()
+    except Exception as e:
+        logger.error(f"Database backup failed: {e}", exc_info=True)
+
+
+def schedule_database_jobs(application: Application) -> None:
+    """
+    Schedule periodic database maintenance on the application's JobQueue.
+    
+    Args:
+        application: The bot application instance.
+    """
+    if application.job_queue is None:
+        logger.warning(
+            "JobQueue not available, booking archiving and backups are not scheduled. "
+            'Install it with: pip install "python-telegram-bot[job-queue]"'
+        )
+        return
+    
+    if Settings.ARCHIVE_AFTER_DAYS > 0:
+        application.job_queue.run_repeating(
+            archive_bookings,
+            interval=timedelta(hours=Settings.ARCHIVE_INTERVAL_HOURS),
+            first=timedelta(minutes=1),
+            name="archive_bookings"
+        )
+        logger.info(
+            f"Booking archiving scheduled every {Settings.ARCHIVE_INTERVAL_HOURS:g}h "
+            f"(bookings older than {Settings.ARCHIVE_AFTER_DAYS} days)"
+        )
+    else:
+        logger.info("ARCHIVE_AFTER_DAYS is 0, booking archiving disabled")
+    
+    if Settings.BACKUP_INTERVAL_HOURS > 0:
+        application.job_queue.run_repeating(
+            backup_database,
+            interval=timedelta(hours=Settings.BACKUP_INTERVAL_HOURS),
+            first=timedelta(minutes=5),
+            name="backup_database"
+        )
+        logger.info(f"Database backups scheduled every {Settings.BACKUP_INTERVAL_HOURS:g}h")
+    else:
+        logger.info("BACKUP_INTERVAL_HOURS is 0, scheduled backups disabled")
+
+
+async def resolve_channel(application: Application) -> None:
+    """
+    Resolve the membership channel to its numeric chat id and load its known members before the first update.
+    
+    Args:
+        application: The bot application instance.
+    """
+    from shared.services.channel_validator import ChannelMembershipValidator
+    
+    if not Settings.get_channel_identifier_for_validation():
+        logger.info("No channel configured, membership checks are disabled")
+        return
+    
+    chat_id = await ChannelMembershipValidator.resolve_channel(application.bot)
+    if chat_id is None:
+        logger.warning("Channel could not be resolved at startup, it will be retried on the first membership check")
+        return
+    
+    # Recent memberships learned from earlier chat_member updates answer checks without an
+    # API call; older ones may miss a leave (updates are dropped while the bot is down)
+    from core.container import get_container
+    updated_since = datetime.now() - timedelta(seconds=Settings.CHANNEL_MEMBER_UPDATE_MAX_AGE_SECONDS)
+    try:
+        members = await get_container().channel_member_repository.find_memberships(chat_id, updated_since)
+        ChannelMembershipValidator.load_channel_members(members)
+    except Exception as e:
+        logger.error(f"Could not load channel memberships: {e}")
+
+
 async def post_init(application: Application) -> None:
     """
-    Send welcome message to the group when bot starts.
+    Schedule background jobs, resolve the channel, start the notification dispatcher
+    and send welcome message to the group when bot starts.
     
     Args:
         application: The bot application instance.
     """
+    schedule_database_jobs(application)
+    await resolve_channel(application)
+    
+    from core.container import get_container
+    get_container().notification_dispatcher.start(application.bot)
+    
     group_id = Settings.get_group_id()
     
     if not group_id:
@@ -29,6 +126,22 @@ async def post_init(application: Application) -> None:
         logger.error(f"Failed to send welcome message to group: {e}")
 
 
+async def post_shutdown(application: Application) -> None:
+    """
+    Stop the notification dispatcher; undelivered notifications stay in the outbox for the next start.
+    
+    Args:
+        application: The bot application instance.
+    """
+    from core.container import get_container
+    from shared.handlers.flow_manager import FlowManager
+    from shared.services.channel_validator import ChannelMembershipValidator
+    
+    await get_container().notification_dispatcher.stop()
+    logger.info(f"Flow metrics: {FlowManager.get_metrics()}")
+    logger.info(f"Channel membership cache metrics: {ChannelMembershipValidator.get_cache_metrics()}")
+
+
 def get_post_init_callback():
     """
     Get the post_init callback function.
@@ -38,3 +151,12 @@ def get_post_init_callback():
     """
     return post_init
 
+
+def get_post_shutdown_callback():
+    """
+    Get the post_shutdown callback function.
+    
+    Returns:
+        Callable: The post_shutdown callback function.
+    """
+    return post_shutdown
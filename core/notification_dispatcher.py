@@ -0,0 +1,160 @@
+"""Background delivery of the notification outbox."""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+from telegram import Bot
+from telegram.error import BadRequest, ChatMigrated, Forbidden, RetryAfter
+from config import Settings
+from core.rate_limiter import PRIORITY_NOTIFICATION
+from infrastructure.database.notification_outbox import OutboxEntry
+from infrastructure.database.repositories.notification_outbox_repository import NotificationOutboxRepository
+from shared.utils.construction_counts import count_construction
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationDispatcher:
+    """
+    Drains the notification outbox in the background.
+    
+    Notifications are queued in the same transaction as the change they
+    announce and sent from here, so handlers return to the user without
+    waiting on Telegram and nothing queued is lost across restarts.
+    Delivery is at least once: a crash between a send and its bookkeeping
+    sends that message again on the next start.
+    
+    - Delivered notifications are deleted.
+    - RetryAfter (flood control) pauses the whole dispatcher for the
+      requested time and retries the same notification, without using up
+      an attempt.
+    - ChatMigrated moves the notification to the new chat id.
+    - Forbidden (bot blocked) and BadRequest (chat not found, bad markup)
+      cannot succeed later, so the notification is marked failed at once.
+    - Anything else (network errors, timeouts) is retried with exponential
+      backoff until NOTIFICATION_MAX_ATTEMPTS, then marked failed.
+    """
+    
+    def __init__(self, repository: NotificationOutboxRepository):
+        """Initialize dispatcher with the outbox repository."""
+        count_construction(self)
+        self._repository = repository
+        self._bot: Optional[Bot] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._sent = 0
+        self._retried = 0
+        self._failed = 0
+        self._rate_limited = 0
+    
+    def start(self, bot: Bot) -> None:
+        """Start draining the outbox with the given bot."""
+        if self._task is not None and not self._task.done():
+            return
+        self._bot = bot
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="notification_dispatcher")
+        logger.info("Notification dispatcher started")
+    
+    async def stop(self) -> None:
+        """Stop after the notification being sent (if any); undelivered ones stay queued."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        try:
+            await asyncio.wait_for(self._task, timeout=Settings.NOTIFICATION_POLL_INTERVAL_SECONDS + 10)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        self._task = None
+        logger.info(f"Notification dispatcher stopped: {self.get_metrics()}")
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get delivery metrics.
+        
+        Returns:
+            Dictionary with sent, retried, failed and rate-limited counts
+        """
+        return {
+            'sent': self._sent,
+            'retried': self._retried,
+            'failed': self._failed,
+            'rate_limited': self._rate_limited,
+        }
+    
+    async def _run(self) -> None:
+        """Poll for due notifications until stopped."""
+        while not self._stopping.is_set():
+            try:
+                due = await self._repository.find_due(Settings.NOTIFICATION_BATCH_SIZE)
+                for entry in due:
+                    if self._stopping.is_set():
+                        break
+                    await self._deliver(entry)
+            except Exception as e:
+                due = []
+                logger.error(f"Notification dispatcher error: {e}", exc_info=True)
+            
+            # A full batch means more may be due right away
+            if len(due) < Settings.NOTIFICATION_BATCH_SIZE:
+                await self._wait(Settings.NOTIFICATION_POLL_INTERVAL_SECONDS)
+    
+    async def _deliver(self, entry: OutboxEntry) -> None:
+        """Send one notification and record the outcome."""
+        while True:
+            try:
+                await self._bot.send_message(
+                    chat_id=entry.chat_id,
+                    text=entry.text,
+                    parse_mode=entry.parse_mode,
+                    rate_limit_args=PRIORITY_NOTIFICATION
+                )
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                seconds = retry_after.total_seconds() if isinstance(retry_after, timedelta) else float(retry_after)
+                self._rate_limited += 1
+                logger.warning(f"Flood control on notification {entry.id}, pausing for {seconds:g}s")
+                if await self._wait(seconds):
+                    return
+                continue
+            except ChatMigrated as e:
+                self._retried += 1
+                logger.info(f"Chat {entry.chat_id} migrated to {e.new_chat_id}, redirecting notification {entry.id}")
+                await self._repository.schedule_retry(
+                    entry.id, entry.attempts, datetime.now(), str(e), chat_id=str(e.new_chat_id)
+                )
+                return
+            except (Forbidden, BadRequest) as e:
+                self._failed += 1
+                logger.error(f"Notification {entry.id} to {entry.chat_id} cannot be delivered: {e}")
+                await self._repository.mark_failed(entry.id, entry.attempts + 1, str(e))
+                return
+            except Exception as e:
+                attempts = entry.attempts + 1
+                if attempts >= Settings.NOTIFICATION_MAX_ATTEMPTS:
+                    self._failed += 1
+                    logger.error(f"Notification {entry.id} to {entry.chat_id} failed after {attempts} attempts: {e}")
+                    await self._repository.mark_failed(entry.id, attempts, str(e))
+                    return
+                delay = min(
+                    Settings.NOTIFICATION_RETRY_BASE_SECONDS * 2 ** (attempts - 1),
+                    Settings.NOTIFICATION_RETRY_MAX_SECONDS
+                )
+                self._retried += 1
+                logger.warning(f"Notification {entry.id} to {entry.chat_id} failed ({e}), retrying in {delay:g}s")
+                await self._repository.schedule_retry(
+                    entry.id, attempts, datetime.now() + timedelta(seconds=delay), str(e)
+                )
+                return
+            
+            self._sent += 1
+            await self._repository.mark_sent(entry.id)
+            return
+    
+    async def _wait(self, seconds: float) -> bool:
+        """Sleep for up to `seconds`; returns True if the dispatcher is stopping."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        return self._stopping.is_set()
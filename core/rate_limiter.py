@@ -0,0 +1,227 @@
+"""Priority-aware rate limiting of outgoing Bot API requests."""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, Union
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+from config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Priority lanes, passed to bot methods as rate_limit_args; lower goes first
+PRIORITY_INTERACTIVE = 0  # Replies to the user's own update (the default)
+PRIORITY_NOTIFICATION = 1  # Group and admin notifications sent by the dispatcher
+PRIORITY_BULK = 2  # Broadcasts and other mass sends
+
+LANES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_NOTIFICATION: "notification",
+    PRIORITY_BULK: "bulk",
+}
+
+# Endpoints that post into a chat and so count against its per-chat/per-group budget;
+# lookups such as getChatMember only use the global budget
+CHAT_LIMITED_PREFIXES = ("send", "forward", "copy", "edit")
+
+# Per-chat buckets kept before idle (full) ones are pruned
+MAX_CHAT_BUCKETS = 10000
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at `rate` tokens per second up to `capacity`."""
+    
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def delay(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is available now)."""
+        self._refill(now)
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+    
+    def reserve(self, now: float) -> float:
+        """Take a token, going into debt if needed; returns how long to wait before using it."""
+        self._refill(now)
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+    
+    def is_idle(self, now: float) -> bool:
+        """Whether the bucket has refilled completely (and can be dropped)."""
+        self._refill(now)
+        return self.tokens >= self.capacity
+
+
+class PriorityRateLimiter(BaseRateLimiter[int]):
+    """
+    Throttles outgoing requests with global, per-chat and per-group budgets.
+    
+    Every request takes a token from the global budget. Requests that post
+    into a chat first take one from that chat's budget: private chats and
+    groups have separate budgets, matching Telegram's limits. Chat budgets
+    are reserved in arrival order. The global budget goes to waiting
+    requests by priority lane, so a user's reply never queues behind
+    notifications or broadcasts. The lane comes from rate_limit_args
+    (PRIORITY_INTERACTIVE if omitted).
+    
+    A RetryAfter pauses every lane for the requested time, and the request
+    is then retried up to max_retries times.
+    """
+    
+    def __init__(
+        self,
+        global_per_second: Optional[float] = None,
+        chat_per_second: Optional[float] = None,
+        chat_burst: Optional[int] = None,
+        group_per_minute: Optional[float] = None,
+        max_retries: Optional[int] = None
+    ):
+        """
+        Initialize limiter; each None falls back to the matching Settings.RATE_LIMIT_* value.
+        
+        Args:
+            global_per_second: Requests per second across all chats
+            chat_per_second: Messages per second to one private chat
+            chat_burst: Messages a private chat may receive back to back
+            group_per_minute: Messages per minute to one group or channel (also its burst)
+            max_retries: Retries of a request that hit RetryAfter
+        """
+        global_per_second = global_per_second or Settings.RATE_LIMIT_GLOBAL_PER_SECOND
+        self._chat_per_second = chat_per_second or Settings.RATE_LIMIT_CHAT_PER_SECOND
+        self._chat_burst = chat_burst or Settings.RATE_LIMIT_CHAT_BURST
+        self._group_per_minute = group_per_minute or Settings.RATE_LIMIT_GROUP_PER_MINUTE
+        self._max_retries = Settings.RATE_LIMIT_MAX_RETRIES if max_retries is None else max_retries
+        
+        self._global = _TokenBucket(global_per_second, global_per_second)
+        self._chats: Dict[Union[int, str], _TokenBucket] = {}
+        self._paused_until = 0.0
+        
+        # Requests waiting for a global token: heap of (priority, arrival), the head goes next
+        self._waiting: List[Tuple[int, int]] = []
+        self._arrivals = itertools.count()
+        self._head_changed = asyncio.Event()
+        
+        self._queue_depth = {lane: 0 for lane in LANES}
+        self._requests = {lane: 0 for lane in LANES}
+        self._wait_total = {lane: 0.0 for lane in LANES}
+        self._wait_max = {lane: 0.0 for lane in LANES}
+        self._rate_limited = 0
+    
+    async def initialize(self) -> None:
+        """Nothing to set up; buckets are created lazily."""
+    
+    async def shutdown(self) -> None:
+        """Log the final metrics."""
+        logger.info(f"Rate limiter metrics: {self.get_metrics()}")
+    
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Union[bool, Dict[str, Any], List[Dict[str, Any]]]]],
+        args: Any,
+        kwargs: Dict[str, Any],
+        endpoint: str,
+        data: Dict[str, Any],
+        rate_limit_args: Optional[int],
+    ) -> Union[bool, Dict[str, Any], List[Dict[str, Any]]]:
+        """Wait for the request's budgets, then make it (retrying after flood control)."""
+        priority = rate_limit_args if rate_limit_args in LANES else PRIORITY_INTERACTIVE
+        chat_id = data.get("chat_id") if endpoint.startswith(CHAT_LIMITED_PREFIXES) else None
+        
+        for attempt in range(self._max_retries + 1):
+            started = time.monotonic()
+            self._queue_depth[priority] += 1
+            try:
+                if chat_id is not None:
+                    await asyncio.sleep(self._chat_bucket(chat_id).reserve(time.monotonic()))
+                await self._acquire_global(priority)
+            finally:
+                self._queue_depth[priority] -= 1
+            self._record_wait(priority, time.monotonic() - started)
+            
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                seconds = retry_after.total_seconds() if isinstance(retry_after, timedelta) else float(retry_after)
+                self._rate_limited += 1
+                self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+                logger.warning(f"Flood control on {endpoint}, pausing all requests for {seconds:g}s")
+                if attempt == self._max_retries:
+                    raise
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get rate limiter metrics.
+        
+        Returns:
+            Per lane: current queue depth, requests, average and maximum wait
+            (ms); plus the RetryAfter count and the number of tracked chats
+        """
+        return {
+            'lanes': {
+                name: {
+                    'queue_depth': self._queue_depth[lane],
+                    'requests': self._requests[lane],
+                    'wait_avg_ms': self._wait_total[lane] * 1000 / self._requests[lane] if self._requests[lane] else 0.0,
+                    'wait_max_ms': self._wait_max[lane] * 1000,
+                }
+                for lane, name in LANES.items()
+            },
+            'rate_limited': self._rate_limited,
+            'chats': len(self._chats),
+        }
+    
+    async def _acquire_global(self, priority: int) -> None:
+        """Wait until this request is the highest-priority waiter and a global token is free."""
+        entry = (priority, next(self._arrivals))
+        heapq.heappush(self._waiting, entry)
+        try:
+            while True:
+                if self._waiting[0] != entry:
+                    await self._head_changed.wait()
+                    continue
+                now = time.monotonic()
+                delay = max(self._paused_until - now, self._global.delay(now))
+                if delay > 0:
+                    # A higher-priority arrival may take the head meanwhile; re-checked after the sleep
+                    await asyncio.sleep(delay)
+                    continue
+                self._global.reserve(now)
+                return
+        finally:
+            self._waiting.remove(entry)
+            heapq.heapify(self._waiting)
+            self._head_changed.set()
+            self._head_changed = asyncio.Event()
+    
+    def _chat_bucket(self, chat_id: Union[int, str]) -> _TokenBucket:
+        """The budget of one chat, created on first use."""
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= MAX_CHAT_BUCKETS:
+                now = time.monotonic()
+                self._chats = {key: value for key, value in self._chats.items() if not value.is_idle(now)}
+            if str(chat_id).startswith(("-", "@")):
+                # Groups, supergroups and channels
+                bucket = _TokenBucket(self._group_per_minute / 60, self._group_per_minute)
+            else:
+                bucket = _TokenBucket(self._chat_per_second, self._chat_burst)
+            self._chats[chat_id] = bucket
+        return bucket
+    
+    def _record_wait(self, priority: int, waited: float) -> None:
+        """Account one request's time spent waiting for its budgets."""
+        self._requests[priority] += 1
+        self._wait_total[priority] += waited
+        self._wait_max[priority] = max(self._wait_max[priority], waited)
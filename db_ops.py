@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Database operations for a running (or stopped) bot.
+
+Usage:
+    python db_ops.py backup [--dir data/backups] [--retention 7] [--pages 256] [--sleep-ms 10] [--max-restarts 5]
+    python db_ops.py export <file.jsonl|file.csv|-> [--format jsonl|csv] [--batch 5000] [--with-archive]
+    python db_ops.py import <file.jsonl|file.csv|-> [--format jsonl|csv] [--batch 5000]
+
+Example:
+    python db_ops.py backup
+    python db_ops.py backup --dir /var/backups/dopium --retention 30
+    python db_ops.py export bookings.jsonl --with-archive
+    python db_ops.py import bookings.jsonl
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(project_root / "src"))
+
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+import domains  # noqa: F401  (resolves the domains <-> infrastructure import order)
+from infrastructure.database.sqlite_connection import get_db_connection
+
+
+async def backup(args: argparse.Namespace) -> None:
+    """Write compressed snapshots of the database and its archive."""
+    from infrastructure.database.backup import DatabaseBackup
+    
+    report = await DatabaseBackup().run(args.dir, args.retention, args.pages, args.sleep_ms, args.max_restarts)
+    for snapshot in report.snapshots:
+        print(
+            f"✅ {snapshot.path}\n"
+            f"   {snapshot.pages} pages in {snapshot.steps} steps ({snapshot.restarts} restarts"
+            f"{', finished in one step' if snapshot.single_step else ''}), "
+            f"{snapshot.size_bytes:,} -> {snapshot.compressed_bytes:,} bytes, "
+            f"{snapshot.duration_ms:.0f}ms"
+        )
+    for removed in report.removed:
+        print(f"🗑 {removed}")
+    print(f"⏱ {report.duration_ms:.0f}ms total")
+
+
+def _file_format(args: argparse.Namespace) -> str:
+    """Format from --format, else from the file extension."""
+    from infrastructure.database.booking_transfer import FORMATS
+    
+    file_format = args.format or Path(args.file).suffix.lstrip(".").lower()
+    if file_format not in FORMATS:
+        raise SystemExit(f"❌ Unknown format '{file_format}', use --format {' or '.join(FORMATS)}")
+    return file_format
+
+
+async def export_bookings(args: argparse.Namespace) -> None:
+    """Stream every booking table to a JSONL/CSV file."""
+    from infrastructure.database.booking_transfer import BookingTransfer
+    
+    file_format = _file_format(args) if args.file != "-" else (args.format or "jsonl")
+    started = time.perf_counter()
+    if args.file == "-":
+        exported = await BookingTransfer().export_to(sys.stdout, file_format, args.batch, args.with_archive)
+    else:
+        with open(args.file, "w", encoding="utf-8", newline="") as target:
+            exported = await BookingTransfer().export_to(target, file_format, args.batch, args.with_archive)
+    print(
+        f"✅ Exported {sum(exported.values()):,} bookings in {time.perf_counter() - started:.1f}s: {exported}",
+        file=sys.stderr
+    )
+
+
+async def import_bookings(args: argparse.Namespace) -> None:
+    """Bulk-load bookings from a JSONL/CSV export."""
+    from infrastructure.database.booking_transfer import BookingTransfer
+    
+    file_format = _file_format(args) if args.file != "-" else (args.format or "jsonl")
+    started = time.perf_counter()
+    if args.file == "-":
+        report = await BookingTransfer().import_from(sys.stdin, file_format, args.batch)
+    else:
+        with open(args.file, encoding="utf-8", newline="") as source:
+            report = await BookingTransfer().import_from(source, file_format, args.batch)
+    print(
+        f"✅ Imported {sum(report.imported.values()):,} bookings in {time.perf_counter() - started:.1f}s: "
+        f"{report.imported}"
+    )
+    if report.regenerated:
+        print(f"⚠️ {len(report.regenerated)} tracking codes were taken by older bookings and regenerated:")
+        for change in report.regenerated:
+            print(f"  {change.domain} {change.booking_id}: {change.old_code} -> {change.new_code}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Dopium bot database operations")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    backup_parser = commands.add_parser("backup", help="write compressed online snapshots")
+    backup_parser.add_argument("--dir", help="snapshot directory (default: BACKUP_DIR or data/backups)")
+    backup_parser.add_argument("--retention", type=int, help="snapshots kept per database file")
+    backup_parser.add_argument("--pages", type=int, help="pages copied per backup step")
+    backup_parser.add_argument("--sleep-ms", type=float, help="pause between backup steps")
+    backup_parser.add_argument("--max-restarts", type=int, help="restarts before copying in one step")
+    backup_parser.set_defaults(handler=backup)
+    
+    for name, handler, help_text in (
+        ("export", export_bookings, "stream all bookings to a JSONL/CSV file"),
+        ("import", import_bookings, "bulk-load bookings from a JSONL/CSV export"),
+    ):
+        transfer_parser = commands.add_parser(name, help=help_text)
+        transfer_parser.add_argument("file", help="JSONL or CSV file, - for stdout/stdin")
+        transfer_parser.add_argument("--format", choices=("jsonl", "csv"), help="default: from the file extension")
+        transfer_parser.add_argument("--batch", type=int, default=5000, help="rows per fetch / per transaction")
+        if name == "export":
+            transfer_parser.add_argument("--with-archive", action="store_true", help="include archived bookings")
+        transfer_parser.set_defaults(handler=handler)
+    
+    args = parser.parse_args()
+    try:
+        asyncio.run(args.handler(args))
+    finally:
+        get_db_connection().close()
+
+
+if __name__ == "__main__":
+    main()
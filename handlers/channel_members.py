@@ -0,0 +1,38 @@
+"""Channel member handlers."""
+import logging
+import sys
+from pathlib import Path
+from telegram import Update
+from telegram.ext import ChatMemberHandler, ContextTypes
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from shared.services.channel_validator import ChannelMembershipValidator
+
+logger = logging.getLogger(__name__)
+
+
+async def track_channel_member(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Keep the channel membership map current from the channel's join/leave updates."""
+    change = update.chat_member
+    channel_chat_id = ChannelMembershipValidator.get_channel_chat_id()
+    if change is None or channel_chat_id is None or change.chat.id != channel_chat_id:
+        return
+    
+    member = change.new_chat_member
+    is_member = ChannelMembershipValidator.is_member_status(member)
+    ChannelMembershipValidator.record_member_update(member.user.id, is_member)
+    
+    from core.container import get_container
+    try:
+        await get_container().channel_member_repository.save(channel_chat_id, member.user.id, member.status, is_member)
+    except Exception as e:
+        logger.error(f"Could not persist channel membership of user {member.user.id}: {e}")
+    logger.info(f"Channel member update: user {member.user.id} is now {member.status}")
+
+
+def register_channel_member_handlers(application) -> None:
+    """Register the channel member handler with the application."""
+    # chat_member updates only reach the bot while it is an administrator of the channel
+    application.add_handler(ChatMemberHandler(track_channel_member, ChatMemberHandler.CHAT_MEMBER))
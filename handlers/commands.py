@@ -8,7 +8,8 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from domains.admin.handlers.admin_handler import AdminHandler
+from core.container import get_container
+from shared.handlers.flow_manager import FlowManager, REPLY_KEYBOARD_MAIN
 
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -18,16 +19,17 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         return
     
     user = update.effective_user
-    admin_handler = AdminHandler()
+    admin_handler = get_container().admin_handler
     
     # Check if user is admin and show admin keyboard
-    if admin_handler.is_admin(user.id):
+    if await admin_handler.is_admin(user.id):
         reply_keyboard = admin_handler.create_admin_keyboard()
         await update.message.reply_text(
             f'👨‍💼 خوش آمدید {user.first_name}! 👋\n\n'
             f'شما به عنوان مدیر دسترسی دارید. از منوی زیر استفاده کنید.',
             reply_markup=reply_keyboard
         )
+        FlowManager.set_shown_reply_keyboard(context, None)
     else:
         reply_keyboard = create_reply_keyboard()
         # Send welcome message with reply keyboard
@@ -38,6 +40,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
             'برای دریافت خدمات یکی از گزینه‌‌هارو انتخاب کن و بریم تو کارش',
             reply_markup=reply_keyboard
         )
+        FlowManager.set_shown_reply_keyboard(context, REPLY_KEYBOARD_MAIN)
 
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -56,6 +59,7 @@ Use the menu buttons at the bottom to interact with the bot!
     """
     reply_keyboard = create_reply_keyboard()
     await update.message.reply_text(help_text, reply_markup=reply_keyboard)
+    FlowManager.set_shown_reply_keyboard(context, REPLY_KEYBOARD_MAIN)
 
 
 async def keyboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -69,6 +73,7 @@ async def keyboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         "📱 Showing keyboard menu:",
         reply_markup=reply_keyboard
     )
+    FlowManager.set_shown_reply_keyboard(context, REPLY_KEYBOARD_MAIN)
 
 
 async def admin_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -76,9 +81,9 @@ async def admin_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     if update.message.chat.type != "private":
         return
     
-    admin_handler = AdminHandler()
+    admin_handler = get_container().admin_handler
     
-    if admin_handler.is_admin(update.effective_user.id):
+    if await admin_handler.is_admin(update.effective_user.id):
         await admin_handler.show_admin_menu(update, context)
     else:
         await update.message.reply_text("❌ شما دسترسی مدیریت ندارید.")
@@ -89,11 +94,11 @@ async def addadmin_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     if update.message.chat.type != "private":
         return
     
-    admin_handler = AdminHandler()
+    admin_handler = get_container().admin_handler
     requester_id = update.effective_user.id
     
     # Check if requester is admin
-    if not admin_handler.is_admin(requester_id):
+    if not await admin_handler.is_admin(requester_id):
         await update.message.reply_text("❌ شما دسترسی مدیریت ندارید.")
         return
     
@@ -184,7 +189,7 @@ async def addadmin_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
                 return
     
     # Add admin
-    success = admin_handler.add_admin(user_id, username, full_name)
+    success = await admin_handler.add_admin(user_id, username, full_name)
     
     if success:
         message = f"✅ کاربر با شناسه `{user_id}` به عنوان ادمین اضافه شد."
@@ -202,11 +207,11 @@ async def removeadmin_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     if update.message.chat.type != "private":
         return
     
-    admin_handler = AdminHandler()
+    admin_handler = get_container().admin_handler
     requester_id = update.effective_user.id
     
     # Check if requester is admin
-    if not admin_handler.is_admin(requester_id):
+    if not await admin_handler.is_admin(requester_id):
         await update.message.reply_text("❌ شما دسترسی مدیریت ندارید.")
         return
     
@@ -230,7 +235,7 @@ async def removeadmin_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         return
     
     # Remove admin
-    success = admin_handler.remove_admin(user_id)
+    success = await admin_handler.remove_admin(user_id)
     
     if success:
         await update.message.reply_text(
@@ -246,15 +251,15 @@ async def listadmins_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     if update.message.chat.type != "private":
         return
     
-    admin_handler = AdminHandler()
+    admin_handler = get_container().admin_handler
     requester_id = update.effective_user.id
     
     # Check if requester is admin
-    if not admin_handler.is_admin(requester_id):
+    if not await admin_handler.is_admin(requester_id):
         await update.message.reply_text("❌ شما دسترسی مدیریت ندارید.")
         return
     
-    admins = admin_handler.get_all_admins()
+    admins = await admin_handler.get_all_admins()
     
     if not admins:
         await update.message.reply_text("📋 هیچ ادمینی در سیستم ثبت نشده است.")
@@ -13,7 +13,7 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from shared.handlers.flow_manager import FlowManager
+from shared.handlers.flow_manager import FlowManager, REPLY_KEYBOARD_MAIN
 
 
 def create_inline_keyboard() -> InlineKeyboardMarkup:
@@ -79,10 +79,10 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     # Check for admin confirm order callbacks
     if query.data.startswith("confirm_"):
-        from domains.admin.handlers.admin_handler import AdminHandler
-        admin_handler = AdminHandler()
+        from core.container import get_container
+        admin_handler = get_container().admin_handler
         
-        if admin_handler.is_admin(query.from_user.id):
+        if await admin_handler.is_admin(query.from_user.id):
             await admin_handler.confirm_order(update, context, query.data)
             return
         else:
@@ -91,17 +91,17 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     # Check for admin history callbacks
     if query.data.startswith("history_"):
-        from domains.admin.handlers.admin_handler import AdminHandler
-        admin_handler = AdminHandler()
+        from core.container import get_container
+        admin_handler = get_container().admin_handler
         
-        if admin_handler.is_admin(query.from_user.id):
+        if await admin_handler.is_admin(query.from_user.id):
             if query.data == "history_categories":
                 await query.answer()
                 await admin_handler.show_order_history_categories(update, context)
                 return
-            elif query.data.startswith("history_page_"):
-                # Pagination callback - handled in show_order_history
-                category = query.data.replace("history_page_", "").split("_")[0]
+            elif query.data.startswith(("history_next_", "history_prev_")):
+                # Cursor pagination callback - page and cursor are parsed in show_order_history
+                category = query.data[len("history_next_"):].rsplit("_", 2)[0]
                 await admin_handler.show_order_history(update, context, category)
                 return
             else:
@@ -155,10 +155,10 @@ async def handle_reply_keyboard(update: Update, context: ContextTypes.DEFAULT_TY
     text = update.message.text
     
     # Check for admin commands
-    from domains.admin.handlers.admin_handler import AdminHandler
-    admin_handler = AdminHandler()
+    from core.container import get_container
+    admin_handler = get_container().admin_handler
     
-    if admin_handler.is_admin(update.effective_user.id):
+    if await admin_handler.is_admin(update.effective_user.id):
         # Check if admin is in search mode
         if context.user_data.get("admin_search_mode"):
             # If admin clicks on an admin button, exit search mode and execute that action
@@ -174,6 +174,10 @@ async def handle_reply_keyboard(update: Update, context: ContextTypes.DEFAULT_TY
                 context.user_data["admin_search_mode"] = False
                 await admin_handler.show_order_history_categories(update, context)
                 return
+            elif text == "آمار سفارشات":
+                context.user_data["admin_search_mode"] = False
+                await admin_handler.show_booking_stats(update, context)
+                return
             else:
                 # In search mode, any other text input is treated as tracking code
                 await admin_handler.handle_search_input(update, context, text)
@@ -188,6 +192,9 @@ async def handle_reply_keyboard(update: Update, context: ContextTypes.DEFAULT_TY
         elif text == "تاریخچه سفارشات":
             await admin_handler.show_order_history_categories(update, context)
             return
+        elif text == "آمار سفارشات":
+            await admin_handler.show_booking_stats(update, context)
+            return
         else:
             # Unknown admin command - show admin menu
             await update.message.reply_text(
@@ -213,6 +220,7 @@ async def handle_reply_keyboard(update: Update, context: ContextTypes.DEFAULT_TY
                 "❌ عملیات لغو شد.\n\nلطفا گزینه مورد نظر خود را انتخاب کنید:",
                 reply_markup=main_keyboard
             )
+            FlowManager.set_shown_reply_keyboard(context, REPLY_KEYBOARD_MAIN)
             return
         
         # Process flow input (not cancel or back)
@@ -223,6 +231,7 @@ async def handle_reply_keyboard(update: Update, context: ContextTypes.DEFAULT_TY
         # Handle help button separately
         if text == "راهنما":
             await update.message.reply_text("📖 راهنما - راهنمای استفاده از ربات", reply_markup=create_reply_keyboard())
+            FlowManager.set_shown_reply_keyboard(context, REPLY_KEYBOARD_MAIN)
             return
         
         state = FlowManager.get_state_by_button(text)
@@ -230,6 +239,7 @@ async def handle_reply_keyboard(update: Update, context: ContextTypes.DEFAULT_TY
             await FlowManager.handle_start(update, context, state)
         else:
             await update.message.reply_text("لطفا یک گزینه معتبر انتخاب کنید.", reply_markup=create_reply_keyboard())
+            FlowManager.set_shown_reply_keyboard(context, REPLY_KEYBOARD_MAIN)
 
 
 def register_keyboard_handlers(application) -> None:
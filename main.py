@@ -3,29 +3,17 @@ import sys
 from pathlib import Path
 from telegram import Update
 from core import create_application
-from handlers import register_command_handlers, register_message_handlers, register_keyboard_handlers
+from handlers import (
+    register_command_handlers,
+    register_message_handlers,
+    register_keyboard_handlers,
+    register_channel_member_handlers,
+)
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from shared.handlers.flow_manager import FlowManager
-from domains.recording import (
-    RecordingRepository,
-    GetServiceTiersUseCase,
-    GetServiceTierOptionsUseCase,
-    CompleteBookingUseCase,
-    RecordingFlowHandler,
-)
-from domains.music_production import (
-    MusicProductionRepository,
-    GetServiceTiersUseCase as MPGetServiceTiersUseCase,
-    GetServiceTierOptionsUseCase as MPGetServiceTierOptionsUseCase,
-    CompleteBookingUseCase as MPCompleteBookingUseCase,
-    MusicProductionFlowHandler,
-)
-from domains.mix_master import MixMasterFlowHandler
-from domains.consultation import ConsultationFlowHandler
-from domains.distribution import DistributionFlowHandler
+from core.container import get_container
 
 # Configure logging
 # Create logs directory if it doesn't exist
@@ -44,52 +32,6 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def initialize_domain_handlers():
-    """Initialize and register domain handlers with FlowManager."""
-    # Import here to avoid circular imports
-    from handlers.keyboard import create_reply_keyboard, create_cancel_keyboard
-    
-    # Set the keyboard creators
-    FlowManager.set_reply_keyboard_creator(create_reply_keyboard)
-    FlowManager.set_cancel_keyboard_creator(create_cancel_keyboard)
-    
-    # Recording domain
-    recording_repo = RecordingRepository()
-    recording_get_tiers = GetServiceTiersUseCase(recording_repo)
-    recording_get_options = GetServiceTierOptionsUseCase(recording_repo)
-    recording_complete = CompleteBookingUseCase(recording_repo)
-    recording_handler = RecordingFlowHandler(
-        recording_get_tiers,
-        recording_get_options,
-        recording_complete
-    )
-    FlowManager.register_handler("recording", recording_handler)
-    
-    # Music Production domain
-    mp_repo = MusicProductionRepository()
-    mp_get_tiers = MPGetServiceTiersUseCase(mp_repo)
-    mp_get_options = MPGetServiceTierOptionsUseCase(mp_repo)
-    mp_complete = MPCompleteBookingUseCase(mp_repo)
-    mp_handler = MusicProductionFlowHandler(
-        mp_get_tiers,
-        mp_get_options,
-        mp_complete
-    )
-    FlowManager.register_handler("music_production", mp_handler)
-    
-    # Mix Master domain
-    mix_master_handler = MixMasterFlowHandler()
-    FlowManager.register_handler("mix_master", mix_master_handler)
-    
-    # Consultation domain
-    consultation_handler = ConsultationFlowHandler()
-    FlowManager.register_handler("consultation", consultation_handler)
-    
-    # Distribution domain
-    distribution_handler = DistributionFlowHandler()
-    FlowManager.register_handler("distribution", distribution_handler)
-
-
 def main() -> None:
     """Initialize and start the bot."""
     try:
@@ -98,8 +40,10 @@ def main() -> None:
         db = get_db_connection()
         logger.info("Database initialized successfully")
         
-        # Initialize domain handlers
-        initialize_domain_handlers()
+        # Build every repository, use case and handler once, before the first update arrives
+        container = get_container()
+        container.register_flow_handlers()
+        logger.info(f"Components built: {container.construction_counts()}")
         
         # Create application (lifecycle hooks are setup in create_application)
         application = create_application()
@@ -108,6 +52,7 @@ def main() -> None:
         register_command_handlers(application)
         register_message_handlers(application)
         register_keyboard_handlers(application)
+        register_channel_member_handlers(application)
         
         # Start the bot
         logger.info("Bot is starting...")
@@ -1,5 +1,5 @@
 """Admin handler for order confirmation."""
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton
 from telegram.ext import ContextTypes
 import sys
@@ -14,42 +14,75 @@ from infrastructure.database.repositories.music_production_booking_repository im
 from infrastructure.database.repositories.mix_master_booking_repository import MixMasterBookingRepository
 from infrastructure.database.repositories.consultation_booking_repository import ConsultationBookingRepository
 from infrastructure.database.repositories.distribution_booking_repository import DistributionBookingRepository
+from infrastructure.database.repositories.booking_history_repository import BookingHistoryRepository
+from infrastructure.database.repositories.booking_stats_repository import BookingStatsRepository
+from infrastructure.database.notification_outbox import Notification
+from shared.utils.construction_counts import count_construction
+
+# Sent to the user after a recording booking is confirmed
+RECORDING_INSTRUCTIONS = (
+    "خیلی ممنون که مجموعه مارو برای ضبط آهنگت انتخاب کردی\n\n"
+    "برای اینکه بتونیم پروسه کار رو به بهترین نحو ممکن ببریم جلو و یه ضبط خفن داشته باشیم چندتا نکته هست که ممنون میشم بخونی\n\n"
+    "۱ - قبل از ضبطت سعی کن استرس و اینارو از خودت دور کنی و برای یه رکورد مشتی و جون دار آماده باش🤝✅\n\n"
+    "۲ - حتما سر ساعت مقرر بیا استودیو چون قطعا قبل و بعد شما رفقا تایم دارن برای ضبط و باید به حقوق اونا احترام بذاریم 😅\n\n"
+    "۳ - از آوردن همراه خودداری کن و خودت تنها بیا پیشمون که بتونی با صدابردار بیشترین تمرکز رو روی ضبط داشته باشی🤓\n\n"
+    "۴ - قبل ضبط یه لیوان آب بزن و گلو رو صاف و صوف کن 🫖\n\n"
+    "۵ - ما از خدامونه که بشینیم ساعت ها گپ بزنیم راجب موزیک و عشق و حال کنیم ؛\n"
+    "ولی چون اینجا هرروز پر از رفیقایی میشه که باید به کارشون رسیدگی بشه\n"
+    "و ما هم یه مجموعه‌ی نقلی ایم\n"
+    "ضبطت که تموم شد استودیو رو برای نفر بعدی بذار\n\n"
+    "تشکر زیاد ❤️🥃🙏🏼"
+)
 
 
 class AdminHandler:
     """Handler for admin operations."""
     
-    def __init__(self):
-        """Initialize admin handler."""
-        self._admin_repo = AdminRepository()
-        self._recording_booking_repo = RecordingBookingRepository()
-        self._music_production_booking_repo = MusicProductionBookingRepository()
-        self._mix_master_booking_repo = MixMasterBookingRepository()
-        self._consultation_booking_repo = ConsultationBookingRepository()
-        self._distribution_booking_repo = DistributionBookingRepository()
+    def __init__(
+        self,
+        admin_repo: AdminRepository,
+        recording_booking_repo: RecordingBookingRepository,
+        music_production_booking_repo: MusicProductionBookingRepository,
+        mix_master_booking_repo: MixMasterBookingRepository,
+        consultation_booking_repo: ConsultationBookingRepository,
+        distribution_booking_repo: DistributionBookingRepository,
+        booking_history_repo: BookingHistoryRepository,
+        booking_stats_repo: BookingStatsRepository
+    ):
+        """Initialize admin handler with its repositories."""
+        count_construction(self)
+        self._admin_repo = admin_repo
+        self._recording_booking_repo = recording_booking_repo
+        self._music_production_booking_repo = music_production_booking_repo
+        self._mix_master_booking_repo = mix_master_booking_repo
+        self._consultation_booking_repo = consultation_booking_repo
+        self._distribution_booking_repo = distribution_booking_repo
+        self._booking_history_repo = booking_history_repo
+        self._booking_stats_repo = booking_stats_repo
     
-    def is_admin(self, user_id: int) -> bool:
+    async def is_admin(self, user_id: int) -> bool:
         """Check if user is admin."""
-        return self._admin_repo.is_admin(user_id)
+        return await self._admin_repo.is_admin(user_id)
     
-    def add_admin(self, user_id: int, username: str = None, full_name: str = None) -> bool:
+    async def add_admin(self, user_id: int, username: str = None, full_name: str = None) -> bool:
         """Add a new admin user."""
-        return self._admin_repo.add_admin(user_id, username, full_name)
+        return await self._admin_repo.add_admin(user_id, username, full_name)
     
-    def remove_admin(self, user_id: int) -> bool:
+    async def remove_admin(self, user_id: int) -> bool:
         """Remove an admin user."""
-        return self._admin_repo.remove_admin(user_id)
+        return await self._admin_repo.remove_admin(user_id)
     
-    def get_all_admins(self) -> list:
+    async def get_all_admins(self) -> list:
         """Get all active admin users."""
-        return self._admin_repo.get_all_admins()
+        return await self._admin_repo.get_all_admins()
     
     def create_admin_keyboard(self) -> ReplyKeyboardMarkup:
         """Create admin reply keyboard."""
         keyboard = [
             [KeyboardButton("تایید سفارش")],
             [KeyboardButton("جستجوی سفارش")],
-            [KeyboardButton("تاریخچه سفارشات")]
+            [KeyboardButton("تاریخچه سفارشات")],
+            [KeyboardButton("آمار سفارشات")]
         ]
         return ReplyKeyboardMarkup(
             keyboard,
@@ -82,72 +115,49 @@ class AdminHandler:
         tracking_code: str
     ) -> None:
         """Handle search input and show order if found."""
-        # Create BookingId class for repository
-        class BookingId:
-            def __init__(self, value):
-                self.value = value
+        from datetime import datetime
         
-        # Search in recording bookings
-        recording_booking = self._recording_booking_repo.find_by_tracking_code(tracking_code)
-        if recording_booking:
-            # Parse created_at from string if needed
-            if isinstance(recording_booking.created_at, str):
-                from datetime import datetime
-                created_at = datetime.fromisoformat(recording_booking.created_at)
-            else:
-                created_at = recording_booking.created_at
+        # One indexed lookup in the tracking-code registry covers every domain
+        booking = await self._booking_history_repo.find_by_tracking_code(tracking_code)
+        if booking:
+            domain_titles = {
+                "recording": "📋 سفارش ضبط",
+                "music_production": "📋 سفارش آهنگسازی",
+                "mix_master": "🎛 سفارش میکس و مستر",
+                "consultation": "💡 سفارش مشاوره",
+                "distribution": "📦 سفارش دیستریبیوشن"
+            }
+            # Domains whose orders can be confirmed from the admin panel
+            confirm_prefixes = {
+                "recording": "confirm_recording_",
+                "music_production": "confirm_music_"
+            }
             
-            booking_info = (
-                f"📋 سفارش ضبط\n\n"
-                f"🔖 کد رهگیری: `{recording_booking.tracking_code or 'N/A'}`\n"
-                f"👤 {recording_booking.user_name}\n"
-                f"📞 {recording_booking.user_contact}\n"
-                f"📅 {created_at.strftime('%Y-%m-%d %H:%M')}\n"
-                f"📊 وضعیت: {recording_booking.status}\n"
-            )
-            
-            keyboard = None
-            if recording_booking.status == "pending":
-                keyboard = InlineKeyboardMarkup([
-                    [InlineKeyboardButton(
-                        f"✅ تایید {recording_booking.tracking_code or recording_booking.id.value[:8]}",
-                        callback_data=f"confirm_recording_{recording_booking.id.value}"
-                    )]
-                ])
-            
-            await update.message.reply_text(
-                booking_info,
-                reply_markup=keyboard,
-                parse_mode='Markdown'
-            )
-            context.user_data["admin_search_mode"] = False
-            return
-        
-        # Search in music production bookings
-        music_booking = self._music_production_booking_repo.find_by_tracking_code(tracking_code)
-        if music_booking:
-            # Parse created_at from string if needed
-            if isinstance(music_booking.created_at, str):
-                from datetime import datetime
-                created_at = datetime.fromisoformat(music_booking.created_at)
-            else:
-                created_at = music_booking.created_at
+            try:
+                created_at = datetime.fromisoformat(booking.created_at)
+            except ValueError:
+                created_at = datetime.now()
             
             booking_info = (
-                f"📋 سفارش آهنگسازی\n\n"
-                f"🔖 کد رهگیری: `{music_booking.tracking_code or 'N/A'}`\n"
-                f"👤 {music_booking.user_name}\n"
-                f"📞 {music_booking.user_contact}\n"
+                f"{domain_titles.get(booking.domain, booking.domain)}\n\n"
+                f"🔖 کد رهگیری: `{booking.tracking_code or 'N/A'}`\n"
+            )
+            if booking.domain == "distribution" and booking.pricing_name:
+                booking_info += f"💰 تعرفه: {booking.pricing_name} ({booking.pricing_price or ''})\n"
+            booking_info += (
+                f"👤 {booking.user_name}\n"
+                f"📞 {booking.user_contact}\n"
                 f"📅 {created_at.strftime('%Y-%m-%d %H:%M')}\n"
-                f"📊 وضعیت: {music_booking.status}\n"
+                f"📊 وضعیت: {booking.status}\n"
             )
             
             keyboard = None
-            if music_booking.status == "pending":
+            confirm_prefix = confirm_prefixes.get(booking.domain)
+            if confirm_prefix and booking.status == "pending":
                 keyboard = InlineKeyboardMarkup([
                     [InlineKeyboardButton(
-                        f"✅ تایید {music_booking.tracking_code or music_booking.id.value[:8]}",
-                        callback_data=f"confirm_music_{music_booking.id.value}"
+                        f"✅ تایید {booking.tracking_code or booking.id[:8]}",
+                        callback_data=f"{confirm_prefix}{booking.id}"
                     )]
                 ])
             
@@ -209,90 +219,24 @@ class AdminHandler:
         if not message_obj:
             return
         
-        # Handle pagination callbacks
-        if update.callback_query and update.callback_query.data.startswith("history_page_"):
-            # Extract category and page from callback data
-            parts = update.callback_query.data.replace("history_page_", "").split("_")
-            if len(parts) >= 2:
-                category = parts[0]
-                try:
-                    page = int(parts[1])
-                except ValueError:
-                    page = 0
-        
-        # Get all bookings from all categories
-        all_bookings = []
-        
-        # Recording bookings
-        recording_bookings = self._recording_booking_repo.find_all()
-        for booking in recording_bookings:
-            all_bookings.append(("recording", booking))
-        
-        # Music production bookings
-        music_bookings = self._music_production_booking_repo.find_all()
-        for booking in music_bookings:
-            all_bookings.append(("music_production", booking))
-        
-        # Mix master bookings
-        mix_master_bookings = self._mix_master_booking_repo.find_all()
-        for booking in mix_master_bookings:
-            all_bookings.append(("mix_master", booking))
-        
-        # Consultation bookings
-        consultation_bookings = self._consultation_booking_repo.find_all()
-        for booking in consultation_bookings:
-            all_bookings.append(("consultation", booking))
-        
-        # Distribution bookings
-        distribution_bookings = self._distribution_booking_repo.find_all()
-        for booking in distribution_bookings:
-            all_bookings.append(("distribution", booking))
-        
-        # Sort by created_at (newest first)
-        def get_created_at(booking_item):
-            booking = booking_item[1]
-            if isinstance(booking, dict):
-                created_at_str = booking.get('created_at', '')
-            else:
-                created_at_str = booking.created_at if hasattr(booking, 'created_at') else ''
-            
-            if isinstance(created_at_str, datetime):
-                return created_at_str
+        # Handle pagination callbacks: history_{next|prev}_<category>_<page>_<cursor>
+        after_id = None
+        before_id = None
+        callback_data = update.callback_query.data if update.callback_query else ""
+        if callback_data.startswith(("history_next_", "history_prev_")):
+            direction = callback_data[len("history_"):len("history_next")]
+            # Categories contain "_", so split the numeric fields off the right
+            category, page_str, cursor_str = callback_data[len("history_next_"):].rsplit("_", 2)
             try:
-                return datetime.fromisoformat(created_at_str)
-            except:
-                return datetime.min
-        
-        all_bookings.sort(key=get_created_at, reverse=True)
-        
-        # Filter by category if needed
-        if category == "recording":
-            all_bookings = [b for b in all_bookings if b[0] == "recording"]
-        elif category == "music_production":
-            all_bookings = [b for b in all_bookings if b[0] == "music_production"]
-        elif category == "mix_master":
-            all_bookings = [b for b in all_bookings if b[0] == "mix_master"]
-        elif category == "consultation":
-            all_bookings = [b for b in all_bookings if b[0] == "consultation"]
-        elif category == "distribution":
-            all_bookings = [b for b in all_bookings if b[0] == "distribution"]
-        # "all" shows everything (already combined)
-        
-        if not all_bookings:
-            await message_obj.reply_text(
-                "✅ هیچ سفارشی در تاریخچه وجود ندارد.",
-                reply_markup=self.create_admin_keyboard()
-            )
-            return
-        
-        # Pagination: 5 items per page
-        items_per_page = 5
-        total_pages = (len(all_bookings) + items_per_page - 1) // items_per_page
-        page = max(0, min(page, total_pages - 1))
-        
-        start_idx = page * items_per_page
-        end_idx = start_idx + items_per_page
-        page_bookings = all_bookings[start_idx:end_idx]
+                page = int(page_str)
+                cursor = int(cursor_str)
+            except ValueError:
+                page, cursor = 0, None
+            if cursor is not None:
+                if direction == "next":
+                    after_id = cursor
+                else:
+                    before_id = cursor
         
         # Category labels
         cat_labels = {
@@ -303,29 +247,56 @@ class AdminHandler:
             "distribution": "📦 دیستریبیوشن"
         }
         
+        # "all" (or anything unknown) reads across every domain
+        domain = category if category in cat_labels else None
+        
+        # Pagination: 5 items per page, one extra row tells whether another page follows
+        items_per_page = 5
+        page_bookings = await self._booking_history_repo.find_page(
+            domain, items_per_page + 1, after_id=after_id, before_id=before_id
+        )
+        
+        if not page_bookings and (after_id is not None or before_id is not None):
+            # The cursor row is gone (or nothing is left past it); start over from the newest
+            page, after_id, before_id = 0, None, None
+            page_bookings = await self._booking_history_repo.find_page(domain, items_per_page + 1)
+        
+        if not page_bookings:
+            await message_obj.reply_text(
+                "✅ هیچ سفارشی در تاریخچه وجود ندارد.",
+                reply_markup=self.create_admin_keyboard()
+            )
+            return
+        
+        has_more = len(page_bookings) > items_per_page
+        if before_id is not None:
+            # Walking back: the extra row is the newest one, beyond this page
+            has_newer = has_more
+            has_older = True
+            page_bookings = page_bookings[-items_per_page:]
+            page = max(page, 1) if has_newer else 0
+        else:
+            has_newer = page > 0
+            has_older = has_more
+            page_bookings = page_bookings[:items_per_page]
+        
+        total_count = await self._booking_stats_repo.count(domain)
+        total_pages = max(page + 1, (total_count + items_per_page - 1) // items_per_page)
+        
         # Build message
         category_name = cat_labels.get(category, "همه")
         message = f"📊 تاریخچه سفارشات {category_name}\n\n"
         
-        for cat, booking in page_bookings:
-            # Handle both dict and object bookings
-            if isinstance(booking, dict):
-                created_at_str = booking.get('created_at', '')
-                tracking_code = booking.get('tracking_code')
-                user_name = booking.get('user_name', 'نامشخص')
-                user_contact = booking.get('user_contact', 'نامشخص')
-                status = booking.get('status', 'pending')
-                # Get pricing info for distribution
-                pricing_name = booking.get('pricing_name')
-                pricing_price = booking.get('pricing_price')
-            else:
-                created_at_str = booking.created_at if hasattr(booking, 'created_at') else ''
-                tracking_code = booking.tracking_code if hasattr(booking, 'tracking_code') else None
-                user_name = booking.user_name if hasattr(booking, 'user_name') else 'نامشخص'
-                user_contact = booking.user_contact if hasattr(booking, 'user_contact') else 'نامشخص'
-                status = booking.status if hasattr(booking, 'status') else 'pending'
-                pricing_name = getattr(booking, 'pricing_name', None) if hasattr(booking, 'pricing_name') else None
-                pricing_price = getattr(booking, 'pricing_price', None) if hasattr(booking, 'pricing_price') else None
+        for booking in page_bookings:
+            cat = booking.domain
+            created_at_str = booking.created_at
+            tracking_code = booking.tracking_code
+            user_name = booking.user_name
+            user_contact = booking.user_contact
+            status = booking.status
+            # Pricing info is only projected for distribution
+            pricing_name = booking.pricing_name
+            pricing_price = booking.pricing_price
             
             # Parse created_at
             if isinstance(created_at_str, datetime):
@@ -356,22 +327,22 @@ class AdminHandler:
             )
             message += f"{booking_info}\n{'='*20}\n"
         
-        message += f"\n📄 صفحه {page + 1} از {total_pages} ({len(all_bookings)} سفارش)"
+        message += f"\n📄 صفحه {page + 1} از {total_pages} ({total_count} سفارش)"
         
         # Create navigation keyboard
         keyboard_buttons = []
         nav_row = []
         
-        if page > 0:
+        if has_newer:
             nav_row.append(InlineKeyboardButton(
                 "◀️ قبلی",
-                callback_data=f"history_page_{category}_{page - 1}"
+                callback_data=f"history_prev_{category}_{page - 1}_{page_bookings[0].row_id}"
             ))
         
-        if page < total_pages - 1:
+        if has_older:
             nav_row.append(InlineKeyboardButton(
                 "▶️ بعدی",
-                callback_data=f"history_page_{category}_{page + 1}"
+                callback_data=f"history_next_{category}_{page + 1}_{page_bookings[-1].row_id}"
             ))
         
         if nav_row:
@@ -399,11 +370,47 @@ class AdminHandler:
                 reply_markup=keyboard
             )
     
+    async def show_booking_stats(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        """Show booking counts per domain and status, plus today's bookings."""
+        status_counts = await self._booking_stats_repo.get_status_counts()
+        today_counts = await self._booking_stats_repo.get_daily_counts()
+        
+        cat_labels = {
+            "recording": "📋 ضبط",
+            "music_production": "🎵 آهنگسازی",
+            "mix_master": "🎛 میکس و مستر",
+            "consultation": "💡 مشاوره",
+            "distribution": "📦 دیستریبیوشن"
+        }
+        
+        message = "📈 آمار سفارشات\n\n"
+        totals = {"pending": 0, "confirmed": 0, "cancelled": 0}
+        for domain, label in cat_labels.items():
+            counts = status_counts.get(domain, {})
+            for status, count in counts.items():
+                totals[status] = totals.get(status, 0) + count
+            message += (
+                f"{label}\n"
+                f"⏳ در انتظار: {counts.get('pending', 0)} | "
+                f"✅ تایید شده: {counts.get('confirmed', 0)} | "
+                f"❌ لغو شده: {counts.get('cancelled', 0)}\n"
+                f"📅 امروز: {today_counts.get(domain, 0)}\n\n"
+            )
+        
+        message += (
+            f"{'='*20}\n"
+            f"📊 مجموع: {sum(totals.values())} سفارش\n"
+            f"⏳ در انتظار: {totals['pending']}\n"
+            f"📅 سفارشات امروز: {sum(today_counts.values())}"
+        )
+        
+        await update.message.reply_text(message, reply_markup=self.create_admin_keyboard())
+    
     async def show_pending_orders(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Show list of pending orders."""
-        # Get pending recording bookings
-        recording_bookings = self._recording_booking_repo.find_by_status("pending")
-        music_production_bookings = self._music_production_booking_repo.find_by_status("pending")
+        # Get the newest pending bookings (max 10 at a time per domain)
+        recording_bookings = await self._recording_booking_repo.find_records(None, None, 10, status="pending")
+        music_production_bookings = await self._music_production_booking_repo.find_records(None, None, 10, status="pending")
         
         # Debug: Log the number of orders found
         import logging
@@ -422,7 +429,7 @@ class AdminHandler:
             message = "📋 سفارشات ضبط در انتظار تایید:\n\n"
             buttons = []
             
-            for booking in recording_bookings[:10]:  # Show max 10 at a time
+            for booking in recording_bookings:
                 # Parse created_at from string if needed
                 if isinstance(booking.created_at, str):
                     from datetime import datetime
@@ -440,8 +447,8 @@ class AdminHandler:
                 
                 buttons.append([
                     InlineKeyboardButton(
-                        f"✅ تایید {booking.tracking_code or booking.id.value[:8]}",
-                        callback_data=f"confirm_recording_{booking.id.value}"
+                        f"✅ تایید {booking.tracking_code or booking.id[:8]}",
+                        callback_data=f"confirm_recording_{booking.id}"
                     )
                 ])
             
@@ -453,7 +460,7 @@ class AdminHandler:
             message = "📋 سفارشات آهنگسازی در انتظار تایید:\n\n"
             buttons = []
             
-            for booking in music_production_bookings[:10]:
+            for booking in music_production_bookings:
                 # Parse created_at from string if needed
                 if isinstance(booking.created_at, str):
                     from datetime import datetime
@@ -471,8 +478,8 @@ class AdminHandler:
                 
                 buttons.append([
                     InlineKeyboardButton(
-                        f"✅ تایید {booking.tracking_code or booking.id.value[:8]}",
-                        callback_data=f"confirm_music_{booking.id.value}"
+                        f"✅ تایید {booking.tracking_code or booking.id[:8]}",
+                        callback_data=f"confirm_music_{booking.id}"
                     )
                 ])
             
@@ -495,79 +502,56 @@ class AdminHandler:
         
         if callback_data.startswith("confirm_recording_"):
             booking_id = callback_data.replace("confirm_recording_", "")
-            booking = self._recording_booking_repo.find_by_id(BookingId(booking_id))
+            booking = await self._recording_booking_repo.find_by_id(BookingId(booking_id))
             
             if booking and booking.status == "pending":
                 booking.confirm()
-                self._recording_booking_repo.save(booking)
+                # The user is notified by the dispatcher once the confirmation commits
+                await self._recording_booking_repo.save(
+                    booking,
+                    lambda saved: [
+                        self._confirmation_notification(saved),
+                        Notification(saved.user_id, RECORDING_INSTRUCTIONS),
+                    ]
+                )
                 
                 await query.edit_message_text(
                     f"✅ سفارش با کد رهگیری `{booking.tracking_code}` تایید شد!",
                     parse_mode='Markdown'
                 )
-                
-                # Notify user
-                try:
-                    await context.bot.send_message(
-                        chat_id=booking.user_id,
-                        text=(
-                            f"✅ سفارش شما تایید شد!\n\n"
-                            f"🔖 کد رهگیری: `{booking.tracking_code}`\n"
-                            f"📞 به زودی با شما تماس گرفته خواهد شد."
-                        ),
-                        parse_mode='Markdown'
-                    )
-                    
-                    # Send additional instructions for recording
-                    await context.bot.send_message(
-                        chat_id=booking.user_id,
-                        text=(
-                            "خیلی ممنون که مجموعه مارو برای ضبط آهنگت انتخاب کردی\n\n"
-                            "برای اینکه بتونیم پروسه کار رو به بهترین نحو ممکن ببریم جلو و یه ضبط خفن داشته باشیم چندتا نکته هست که ممنون میشم بخونی\n\n"
-                            "۱ - قبل از ضبطت سعی کن استرس و اینارو از خودت دور کنی و برای یه رکورد مشتی و جون دار آماده باش🤝✅\n\n"
-                            "۲ - حتما سر ساعت مقرر بیا استودیو چون قطعا قبل و بعد شما رفقا تایم دارن برای ضبط و باید به حقوق اونا احترام بذاریم 😅\n\n"
-                            "۳ - از آوردن همراه خودداری کن و خودت تنها بیا پیشمون که بتونی با صدابردار بیشترین تمرکز رو روی ضبط داشته باشی🤓\n\n"
-                            "۴ - قبل ضبط یه لیوان آب بزن و گلو رو صاف و صوف کن 🫖\n\n"
-                            "۵ - ما از خدامونه که بشینیم ساعت ها گپ بزنیم راجب موزیک و عشق و حال کنیم ؛\n"
-                            "ولی چون اینجا هرروز پر از رفیقایی میشه که باید به کارشون رسیدگی بشه\n"
-                            "و ما هم یه مجموعه‌ی نقلی ایم\n"
-                            "ضبطت که تموم شد استودیو رو برای نفر بعدی بذار\n\n"
-                            "تشکر زیاد ❤️🥃🙏🏼"
-                        )
-                    )
-                except Exception as e:
-                    print(f"Could not notify user: {e}")
             else:
                 await query.answer("❌ سفارش یافت نشد یا قبلا تایید شده است.")
         
         elif callback_data.startswith("confirm_music_"):
             booking_id = callback_data.replace("confirm_music_", "")
-            booking = self._music_production_booking_repo.find_by_id(BookingId(booking_id))
+            booking = await self._music_production_booking_repo.find_by_id(BookingId(booking_id))
             
             if booking and booking.status == "pending":
                 booking.confirm()
-                self._music_production_booking_repo.save(booking)
+                # The user is notified by the dispatcher once the confirmation commits
+                await self._music_production_booking_repo.save(
+                    booking,
+                    lambda saved: [self._confirmation_notification(saved)]
+                )
                 
                 await query.edit_message_text(
                     f"✅ سفارش با کد رهگیری `{booking.tracking_code}` تایید شد!",
                     parse_mode='Markdown'
                 )
-                
-                # Notify user
-                try:
-                    await context.bot.send_message(
-                        chat_id=booking.user_id,
-                        text=(
-                            f"✅ سفارش شما تایید شد!\n\n"
-                            f"🔖 کد رهگیری: `{booking.tracking_code}`\n"
-                            f"📞 به زودی با شما تماس گرفته خواهد شد."
-                        ),
-                        parse_mode='Markdown'
-                    )
-                except Exception as e:
-                    print(f"Could not notify user: {e}")
             else:
                 await query.answer("❌ سفارش یافت نشد یا قبلا تایید شده است.")
         
         await query.answer()
-
+    
+    @staticmethod
+    def _confirmation_notification(booking: Any) -> Notification:
+        """Message telling the user their order was confirmed."""
+        return Notification(
+            booking.user_id,
+            (
+                f"✅ سفارش شما تایید شد!\n\n"
+                f"🔖 کد رهگیری: `{booking.tracking_code}`\n"
+                f"📞 به زودی با شما تماس گرفته خواهد شد."
+            ),
+            'Markdown'
+        )
@@ -2,11 +2,18 @@
 from typing import Dict, Any
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
+from infrastructure.database.repositories.consultation_booking_repository import ConsultationBookingRepository
+from shared.utils.construction_counts import count_construction
 
 
 class ConsultationFlowHandler:
     """Handler for consultation service flow."""
     
+    def __init__(self, booking_repository: ConsultationBookingRepository):
+        """Initialize handler with the repository bookings are saved to."""
+        count_construction(self)
+        self._booking_repository = booking_repository
+    
     async def start_flow(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> Dict[str, Any]:
         """Start the consultation service flow."""
         context.user_data["flow_state"] = "consultation"
@@ -118,13 +125,11 @@ class ConsultationFlowHandler:
             # Save booking to database
             from datetime import datetime
             from shared.utils.tracking_code import generate_tracking_code
-            from infrastructure.database.repositories.consultation_booking_repository import ConsultationBookingRepository
             import uuid
             
             user = update.effective_user
             tracking_code = generate_tracking_code(5)
             
-            booking_repo = ConsultationBookingRepository()
             booking_data = {
                 'id': str(uuid.uuid4()),
                 'user_id': user.id if user else 0,
@@ -136,8 +141,8 @@ class ConsultationFlowHandler:
                 'created_at': datetime.now().isoformat(),
                 'status': 'pending'
             }
-            booking_repo.save(booking_data)
-            flow_data['tracking_code'] = tracking_code
+            await self._booking_repository.save(booking_data)
+            flow_data['tracking_code'] = booking_data['tracking_code']
             
             completion_msg = (
                 f"✅ درخواست مشاوره شما با موفقیت ثبت شد!\n\n"
@@ -2,11 +2,18 @@
 from typing import Dict, Any
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
+from infrastructure.database.repositories.distribution_booking_repository import DistributionBookingRepository
+from shared.utils.construction_counts import count_construction
 
 
 class DistributionFlowHandler:
     """Handler for distribution service flow."""
     
+    def __init__(self, booking_repository: DistributionBookingRepository):
+        """Initialize handler with the repository bookings are saved to."""
+        count_construction(self)
+        self._booking_repository = booking_repository
+    
     async def start_flow(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> Dict[str, Any]:
         """Start the distribution service flow."""
         context.user_data["flow_state"] = "distribution"
@@ -123,13 +130,11 @@ class DistributionFlowHandler:
             # Save booking to database
             from datetime import datetime
             from shared.utils.tracking_code import generate_tracking_code
-            from infrastructure.database.repositories.distribution_booking_repository import DistributionBookingRepository
             import uuid
             
             user = update.effective_user
             tracking_code = generate_tracking_code(5)
             
-            booking_repo = DistributionBookingRepository()
             booking_data = {
                 'id': str(uuid.uuid4()),
                 'user_id': user.id if user else 0,
@@ -145,8 +150,8 @@ class DistributionFlowHandler:
                 'status': 'pending'
             }
             flow_data['user_contact'] = flow_data.get('contact_info', 'نامشخص')
-            booking_repo.save(booking_data)
-            flow_data['tracking_code'] = tracking_code
+            await self._booking_repository.save(booking_data)
+            flow_data['tracking_code'] = booking_data['tracking_code']
             
             completion_msg = (
                 f"✅ درخواست دیستریبیوشن شما با موفقیت ثبت شد!\n\n"
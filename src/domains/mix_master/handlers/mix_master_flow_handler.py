@@ -1,13 +1,21 @@
 """Mix and Master flow handler."""
-from typing import Dict, Any
+from typing import Dict, Any, List
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
+from infrastructure.database.notification_outbox import Notification
+from infrastructure.database.repositories.mix_master_booking_repository import MixMasterBookingRepository
 from config import Settings
+from shared.utils.construction_counts import count_construction
 
 
 class MixMasterFlowHandler:
     """Handler for mix and master service flow."""
     
+    def __init__(self, booking_repository: MixMasterBookingRepository):
+        """Initialize handler with the repository bookings are saved to."""
+        count_construction(self)
+        self._booking_repository = booking_repository
+    
     async def start_flow(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> Dict[str, Any]:
         """Start the mix and master service flow."""
         context.user_data["flow_state"] = "mix_master"
@@ -116,13 +124,11 @@ class MixMasterFlowHandler:
             # Save booking to database
             from datetime import datetime
             from shared.utils.tracking_code import generate_tracking_code
-            from infrastructure.database.repositories.mix_master_booking_repository import MixMasterBookingRepository
             import uuid
             
             user = update.effective_user
             tracking_code = generate_tracking_code(5)
             
-            booking_repo = MixMasterBookingRepository()
             booking_data = {
                 'id': str(uuid.uuid4()),
                 'user_id': user.id if user else 0,
@@ -135,11 +141,12 @@ class MixMasterFlowHandler:
                 'created_at': datetime.now().isoformat(),
                 'status': 'pending'
             }
-            booking_repo.save(booking_data)
-            flow_data['tracking_code'] = tracking_code
-            
-            # Send notification to group
-            await self._send_booking_notification(update, context, flow_data)
+            # The group notification is queued in the save transaction and sent by the dispatcher
+            await self._booking_repository.save(
+                booking_data,
+                lambda saved: self._booking_notifications(update, flow_data)
+            )
+            flow_data['tracking_code'] = booking_data['tracking_code']
             
             completion_msg = (
                 f"✅ درخواست میکس و مستر شما با موفقیت ثبت شد!\n\n"
@@ -161,13 +168,8 @@ class MixMasterFlowHandler:
         
         return {"message": "لطفا دوباره تلاش کنید.", "next_state": None}
     
-    async def _send_booking_notification(
-        self,
-        update: Update,
-        context: ContextTypes.DEFAULT_TYPE,
-        flow_data: Dict[str, Any]
-    ) -> None:
-        """Send booking notification to group."""
+    def _booking_notifications(self, update: Update, flow_data: Dict[str, Any]) -> List[Notification]:
+        """Build the group notification for a new booking."""
         user = update.effective_user
         user_name = flow_data.get('user_name', user.first_name if user else 'نامشخص')
         user_contact = flow_data.get('user_contact', 'نامشخص')
@@ -185,13 +187,7 @@ class MixMasterFlowHandler:
         
         # Send to group if configured
         group_id = Settings.get_group_id()
-        if group_id:
-            try:
-                await context.bot.send_message(
-                    chat_id=group_id,
-                    text=booking_message,
-                    parse_mode='Markdown'
-                )
-            except Exception as e:
-                print(f"Failed to send mix master notification to group: {e}")
+        if not group_id:
+            return []
+        return [Notification(group_id, booking_message, 'Markdown')]
 
@@ -7,7 +7,7 @@ from domains.music_production.use_cases import (
     GetServiceTierOptionsUseCase,
     CompleteBookingUseCase,
 )
-from config import Settings
+from shared.utils.construction_counts import count_construction
 
 
 class MusicProductionFlowHandler:
@@ -20,6 +20,7 @@ class MusicProductionFlowHandler:
         complete_booking_use_case: CompleteBookingUseCase,
     ):
         """Initialize handler with use cases."""
+        count_construction(self)
         self._get_tiers = get_service_tiers_use_case
         self._get_tier_options = get_service_tier_options_use_case
         self._complete_booking = complete_booking_use_case
@@ -132,10 +133,8 @@ class MusicProductionFlowHandler:
                     service_option_id=flow_data["service_option_id"]
                 )
                 
-                booking_response = self._complete_booking.execute(booking_request)
-                completion_msg = await self._send_booking_notification(
-                    update, context, booking_response
-                )
+                booking_response = await self._complete_booking.execute(booking_request)
+                completion_msg = self._completion_message(booking_response)
                 
                 context.user_data["current_step"] = None
                 context.user_data["flow_state"] = None
@@ -152,26 +151,8 @@ class MusicProductionFlowHandler:
         
         return {"message": "لطفا دوباره تلاش کنید.", "next_state": None}
     
-    async def _send_booking_notification(
-        self,
-        update: Update,
-        context: ContextTypes.DEFAULT_TYPE,
-        booking_response: "BookingResponseDTO"
-    ) -> str:
-        """Send booking notification to group."""
-        booking_message = booking_response.to_message()
-        
-        group_id = Settings.get_group_id()
-        if group_id:
-            try:
-                await context.bot.send_message(
-                    chat_id=group_id,
-                    text=booking_message,
-                    parse_mode='Markdown'
-                )
-            except Exception as e:
-                print(f"Failed to send message to group: {e}")
-        
+    def _completion_message(self, booking_response: "BookingResponseDTO") -> str:
+        """Build the confirmation shown to the user (the group is notified through the outbox)."""
         return (
             "✅ رزرو شما با موفقیت ثبت شد!\n\n"
             f"📋 خلاصه رزرو:\n"
@@ -2,6 +2,7 @@
 from typing import List, Optional
 from domains.music_production.repositories.music_production_repository_interface import IMusicProductionRepository
 from domains.music_production.entities.service_tier import ServiceTier, ServiceOption, ServiceOptionId
+from shared.utils.construction_counts import count_construction
 
 
 class MusicProductionRepository(IMusicProductionRepository):
@@ -69,6 +70,10 @@ class MusicProductionRepository(IMusicProductionRepository):
         ),
     ]
     
+    def __init__(self):
+        """Initialize repository; the tiers and options are class-level constants."""
+        count_construction(self)
+    
     def get_service_tiers(self) -> List[ServiceTier]:
         """Get all service tiers."""
         return self.SERVICE_TIERS.copy()
@@ -10,19 +10,27 @@ from pathlib import Path
 # Add src to path for infrastructure imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from config import Settings
+from infrastructure.database.notification_outbox import Notification
 from infrastructure.database.repositories.music_production_booking_repository import MusicProductionBookingRepository
 from shared.utils.tracking_code import generate_tracking_code
+from shared.utils.construction_counts import count_construction
 
 
 class CompleteBookingUseCase:
     """Use case to complete a booking."""
     
-    def __init__(self, repository: IMusicProductionRepository):
+    def __init__(
+        self,
+        repository: IMusicProductionRepository,
+        booking_repository: MusicProductionBookingRepository
+    ):
         """Initialize use case."""
+        count_construction(self)
         self._repository = repository
-        self._booking_repository = MusicProductionBookingRepository()
+        self._booking_repository = booking_repository
     
-    def execute(self, request: BookingRequestDTO) -> BookingResponseDTO:
+    async def execute(self, request: BookingRequestDTO) -> BookingResponseDTO:
         """
         Execute use case - complete booking.
         
@@ -58,16 +66,26 @@ class CompleteBookingUseCase:
             status="pending"
         )
         
-        saved_booking = self._booking_repository.save(booking)
+        def to_response(saved_booking: Booking) -> BookingResponseDTO:
+            return BookingResponseDTO(
+                booking_id=saved_booking.id.value,
+                user_name=saved_booking.user_name,
+                user_contact=saved_booking.user_contact,
+                service_tier_name=tier.name,
+                service_option_name=option.name,
+                service_option_price=option.price,
+                tracking_code=saved_booking.tracking_code or tracking_code,
+                status=saved_booking.status
+            )
         
-        return BookingResponseDTO(
-            booking_id=saved_booking.id.value,
-            user_name=saved_booking.user_name,
-            user_contact=saved_booking.user_contact,
-            service_tier_name=tier.name,
-            service_option_name=option.name,
-            service_option_price=option.price,
-            tracking_code=saved_booking.tracking_code or tracking_code,
-            status=saved_booking.status
-        )
+        def notify_group(saved_booking: Booking) -> list:
+            group_id = Settings.get_group_id()
+            if not group_id:
+                return []
+            return [Notification(group_id, to_response(saved_booking).to_message(), 'Markdown')]
+        
+        # The group notification is queued in the save transaction and sent by the dispatcher
+        saved_booking = await self._booking_repository.save(booking, notify_group)
+        
+        return to_response(saved_booking)
 
@@ -1,6 +1,7 @@
 """Get service tier options use case."""
 from domains.music_production.repositories import IMusicProductionRepository
 from domains.music_production.dto import ServiceTierDTO, ServiceOptionDTO
+from shared.utils.construction_counts import count_construction
 
 
 class GetServiceTierOptionsUseCase:
@@ -8,6 +9,7 @@ class GetServiceTierOptionsUseCase:
     
     def __init__(self, repository: IMusicProductionRepository):
         """Initialize use case."""
+        count_construction(self)
         self._repository = repository
     
     def execute(self, tier_id: str) -> ServiceTierDTO:
@@ -2,6 +2,7 @@
 from typing import List
 from domains.music_production.repositories import IMusicProductionRepository
 from domains.music_production.dto import ServiceTierDTO, ServiceOptionDTO
+from shared.utils.construction_counts import count_construction
 
 
 class GetServiceTiersUseCase:
@@ -9,6 +10,7 @@ class GetServiceTiersUseCase:
     
     def __init__(self, repository: IMusicProductionRepository):
         """Initialize use case."""
+        count_construction(self)
         self._repository = repository
     
     def execute(self) -> List[ServiceTierDTO]:
@@ -2,6 +2,7 @@
 from typing import List, Optional
 from domains.recording.repositories.recording_repository_interface import IRecordingRepository
 from domains.recording.entities.service_tier import ServiceTier, ServiceOption, ServiceOptionId
+from shared.utils.construction_counts import count_construction
 
 
 class RecordingRepository(IRecordingRepository):
@@ -70,6 +71,10 @@ class RecordingRepository(IRecordingRepository):
         ),
     ]
     
+    def __init__(self):
+        """Initialize repository; the tiers and options are class-level constants."""
+        count_construction(self)
+    
     def get_service_tiers(self) -> List[ServiceTier]:
         """Get all service tiers."""
         return self.SERVICE_TIERS.copy()
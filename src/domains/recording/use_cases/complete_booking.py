@@ -11,23 +11,32 @@ from pathlib import Path
 # Add src to path for infrastructure imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
+from config import Settings
+from infrastructure.database.notification_outbox import Notification
 from infrastructure.database.repositories.recording_booking_repository import RecordingBookingRepository
 from shared.utils.tracking_code import generate_tracking_code
+from shared.utils.construction_counts import count_construction
 
 
 class CompleteBookingUseCase:
     """
     Use case to complete a booking.
     
-    Single Responsibility: Create and persist booking.
+    Single Responsibility: Create and persist booking, queueing the group
+    notification in the same transaction.
     """
     
-    def __init__(self, recording_repository: IRecordingRepository):
-        """Initialize use case with repository."""
+    def __init__(
+        self,
+        recording_repository: IRecordingRepository,
+        booking_repository: RecordingBookingRepository
+    ):
+        """Initialize use case with repositories."""
+        count_construction(self)
         self._recording_repository = recording_repository
-        self._booking_repository = RecordingBookingRepository()
+        self._booking_repository = booking_repository
     
-    def execute(self, request: BookingRequestDTO) -> BookingResponseDTO:
+    async def execute(self, request: BookingRequestDTO) -> BookingResponseDTO:
         """
         Execute use case - complete booking.
         
@@ -66,19 +75,28 @@ class CompleteBookingUseCase:
             status="pending"
         )
         
-        # Persist booking to database
-        saved_booking = self._booking_repository.save(booking)
+        def to_response(saved_booking: Booking) -> BookingResponseDTO:
+            return BookingResponseDTO(
+                booking_id=saved_booking.id.value,
+                user_name=saved_booking.user_name,
+                user_contact=saved_booking.user_contact,
+                service_tier_name=tier.name,
+                service_option_name=option.name,
+                service_option_price=option.price,
+                is_hourly=option.is_hourly,
+                tracking_code=saved_booking.tracking_code or tracking_code,
+                status=saved_booking.status
+            )
+        
+        def notify_group(saved_booking: Booking) -> list:
+            group_id = Settings.get_group_id()
+            if not group_id:
+                return []
+            return [Notification(group_id, to_response(saved_booking).to_message(), 'Markdown')]
+        
+        # Persist booking to database; the group notification is sent by the dispatcher once committed
+        saved_booking = await self._booking_repository.save(booking, notify_group)
         
         # Return response DTO
-        return BookingResponseDTO(
-            booking_id=saved_booking.id.value,
-            user_name=saved_booking.user_name,
-            user_contact=saved_booking.user_contact,
-            service_tier_name=tier.name,
-            service_option_name=option.name,
-            service_option_price=option.price,
-            is_hourly=option.is_hourly,
-            tracking_code=saved_booking.tracking_code or tracking_code,
-            status=saved_booking.status
-        )
+        return to_response(saved_booking)
 
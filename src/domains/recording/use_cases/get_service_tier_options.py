@@ -1,6 +1,7 @@
 """Get service tier options use case."""
 from domains.recording.repositories import IRecordingRepository
 from domains.recording.dto import ServiceTierDTO, ServiceOptionDTO
+from shared.utils.construction_counts import count_construction
 
 
 class GetServiceTierOptionsUseCase:
@@ -8,6 +9,7 @@ class GetServiceTierOptionsUseCase:
     
     def __init__(self, recording_repository: IRecordingRepository):
         """Initialize use case."""
+        count_construction(self)
         self._repository = recording_repository
     
     def execute(self, tier_id: str) -> ServiceTierDTO:
@@ -2,6 +2,7 @@
 from typing import List
 from domains.recording.repositories import IRecordingRepository
 from domains.recording.dto import ServiceTierDTO, ServiceOptionDTO
+from shared.utils.construction_counts import count_construction
 
 
 class GetServiceTiersUseCase:
@@ -9,6 +10,7 @@ class GetServiceTiersUseCase:
     
     def __init__(self, recording_repository: IRecordingRepository):
         """Initialize use case."""
+        count_construction(self)
         self._repository = recording_repository
     
     def execute(self) -> List[ServiceTierDTO]:
@@ -0,0 +1,211 @@
+"""Online, compressed database snapshots using the SQLite backup API."""
+import asyncio
+import gzip
+import shutil
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import quote
+from config import Settings
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from shared.utils.construction_counts import count_construction
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Snapshot file names: <database stem>-<timestamp>.db.gz, so names sort by age
+SNAPSHOT_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
+class _TooManyRestarts(Exception):
+    """Aborts a stepped copy that writes keep restarting."""
+
+
+@dataclass
+class SnapshotReport:
+    """Outcome of backing up one database file."""
+    
+    source: str
+    path: str
+    pages: int
+    steps: int
+    restarts: int  # Copy restarted because another connection wrote mid-step
+    single_step: bool  # Restarts hit max_restarts, so the copy was redone in one step
+    size_bytes: int
+    compressed_bytes: int
+    duration_ms: float
+
+
+@dataclass
+class BackupReport:
+    """Outcome of one backup run."""
+    
+    snapshots: List[SnapshotReport] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)  # Snapshots dropped by retention
+    duration_ms: float = 0.0
+    writes: int = 0  # Writes committed while the backup ran
+    write_latency_avg_ms: float = 0.0  # ... and their average latency
+    baseline_write_latency_avg_ms: float = 0.0  # Average write latency before the backup
+
+
+class DatabaseBackup:
+    """Writes timestamped, gzip-compressed snapshots of the live database and its archive."""
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Initialize backup with database connection."""
+        count_construction(self)
+        self._db = db or get_db_connection()
+    
+    async def run(
+        self,
+        directory: Optional[str] = None,
+        retention: Optional[int] = None,
+        pages_per_step: Optional[int] = None,
+        step_sleep_ms: Optional[float] = None,
+        max_restarts: Optional[int] = None
+    ) -> BackupReport:
+        """
+        Snapshot the database and its archive without pausing the bot.
+        
+        Each file is copied pages_per_step pages at a time from a dedicated read
+        connection. After every step that leaves pages to copy, the copy sleeps
+        step_sleep_ms (also the wait before retrying a step that found the
+        database busy), so the writer gets regular gaps. The copy runs on a
+        worker thread, so the event loop keeps serving updates meanwhile. A
+        write committed between two steps makes SQLite restart the copy; the
+        report counts these restarts, and a larger pages_per_step keeps them
+        down on a busy bot. After max_restarts restarts the stepped copy is
+        abandoned and the file is copied in a single step instead, which
+        writes cannot restart (in WAL mode they are not blocked either, but
+        checkpoints wait until the copy ends), so a backup always finishes.
+        
+        Args:
+            directory: Directory the snapshots are written to. If None, uses
+                Settings.BACKUP_DIR, or a backups directory next to the database.
+            retention: Snapshots kept per database file (older ones are
+                deleted). If None, uses Settings.BACKUP_RETENTION.
+            pages_per_step: Pages copied per backup step. If None, uses
+                Settings.BACKUP_PAGES_PER_STEP.
+            step_sleep_ms: Pause between steps. If None, uses
+                Settings.BACKUP_STEP_SLEEP_MS.
+            max_restarts: Restarts tolerated before copying in one step. If
+                None, uses Settings.BACKUP_MAX_RESTARTS.
+                
+        Returns:
+            Sizes, timings and the write latency seen while the backup ran
+        """
+        directory = directory or Settings.BACKUP_DIR or str(Path(self._db.db_path).parent / "backups")
+        retention = Settings.BACKUP_RETENTION if retention is None else retention
+        pages_per_step = pages_per_step or Settings.BACKUP_PAGES_PER_STEP
+        step_sleep_ms = Settings.BACKUP_STEP_SLEEP_MS if step_sleep_ms is None else step_sleep_ms
+        max_restarts = Settings.BACKUP_MAX_RESTARTS if max_restarts is None else max_restarts
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        before = self._db.get_pool_metrics()
+        started = time.perf_counter()
+        report = BackupReport(baseline_write_latency_avg_ms=before['write_latency_avg_ms'])
+        
+        for source in (self._db.db_path, self._db.archive_path):
+            snapshot = await asyncio.to_thread(
+                self._snapshot, source, directory, pages_per_step, step_sleep_ms / 1000, max_restarts
+            )
+            report.snapshots.append(snapshot)
+            report.removed.extend(self._apply_retention(directory, Path(source).stem, retention))
+        
+        report.duration_ms = (time.perf_counter() - started) * 1000
+        after = self._db.get_pool_metrics()
+        report.writes = after['writes'] - before['writes']
+        if report.writes:
+            report.write_latency_avg_ms = (
+                after['write_latency_total_ms'] - before['write_latency_total_ms']
+            ) / report.writes
+        
+        logger.info(
+            f"Backup finished in {report.duration_ms:.0f}ms: "
+            + ", ".join(
+                f"{Path(s.path).name} ({s.size_bytes} -> {s.compressed_bytes} bytes, "
+                f"{s.steps} steps, {s.restarts} restarts{', finished in one step' if s.single_step else ''})"
+                for s in report.snapshots
+            )
+            + f"; {report.writes} writes at {report.write_latency_avg_ms:.1f}ms avg "
+            f"(baseline {report.baseline_write_latency_avg_ms:.1f}ms)"
+        )
+        return report
+    
+    def _snapshot(
+        self,
+        source: str,
+        directory: str,
+        pages_per_step: int,
+        step_sleep: float,
+        max_restarts: int
+    ) -> SnapshotReport:
+        """Copy one database file and compress the copy (runs on a worker thread)."""
+        started = time.perf_counter()
+        stem = Path(source).stem
+        timestamp = datetime.now().strftime(SNAPSHOT_TIMESTAMP_FORMAT)
+        copy_path = Path(directory) / f"{stem}-{timestamp}.db"
+        snapshot_path = copy_path.with_name(f"{copy_path.name}.gz")
+        
+        progress = {'steps': 0, 'restarts': 0, 'remaining': None, 'pages': 0}
+        
+        def on_step(status: int, remaining: int, total: int) -> None:
+            progress['steps'] += 1
+            progress['pages'] = total
+            if progress['remaining'] is not None and remaining > progress['remaining']:
+                progress['restarts'] += 1
+                if progress['restarts'] > max_restarts:
+                    raise _TooManyRestarts()
+            progress['remaining'] = remaining
+            # sqlite3's own `sleep` only applies after a BUSY/LOCKED step, so yield here
+            if remaining and step_sleep > 0:
+                time.sleep(step_sleep)
+        
+        source_conn = sqlite3.connect(f"file:{quote(source)}?mode=ro", uri=True)
+        copy_conn = sqlite3.connect(str(copy_path))
+        single_step = False
+        try:
+            try:
+                source_conn.backup(copy_conn, pages=pages_per_step, progress=on_step, sleep=step_sleep)
+            except _TooManyRestarts:
+                logger.warning(
+                    f"Backup of {Path(source).name} restarted {progress['restarts']} times, copying in one step"
+                )
+                single_step = True
+                source_conn.backup(copy_conn, pages=-1, sleep=step_sleep)
+                progress['steps'] += 1
+        finally:
+            copy_conn.close()
+            source_conn.close()
+        
+        try:
+            with open(copy_path, 'rb') as copy_file, gzip.open(snapshot_path, 'wb') as snapshot_file:
+                shutil.copyfileobj(copy_file, snapshot_file)
+            size_bytes = copy_path.stat().st_size
+        finally:
+            copy_path.unlink(missing_ok=True)
+        
+        return SnapshotReport(
+            source=source,
+            path=str(snapshot_path),
+            pages=progress['pages'],
+            steps=progress['steps'],
+            restarts=progress['restarts'],
+            single_step=single_step,
+            size_bytes=size_bytes,
+            compressed_bytes=snapshot_path.stat().st_size,
+            duration_ms=(time.perf_counter() - started) * 1000,
+        )
+    
+    def _apply_retention(self, directory: str, stem: str, retention: int) -> List[str]:
+        """Delete all but the newest `retention` snapshots of one database file."""
+        snapshots = sorted(Path(directory).glob(f"{stem}-*.db.gz"), reverse=True)
+        removed = []
+        for snapshot in snapshots[max(retention, 1):]:
+            snapshot.unlink()
+            removed.append(str(snapshot))
+        if removed:
+            logger.info(f"Removed {len(removed)} old {stem} snapshots")
+        return removed
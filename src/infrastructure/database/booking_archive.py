@@ -0,0 +1,138 @@
+"""Cold storage for old confirmed/cancelled bookings in an attached archive database."""
+import sqlite3
+import logging
+from typing import List
+from infrastructure.database.booking_counters import create_counters_delete_trigger, rebuild_booking_counters
+from infrastructure.database.booking_projection import (
+    PROJECTED_TABLES,
+    PROJECTION_COLUMNS,
+    _projected_values,
+    create_projection_delete_trigger,
+)
+from infrastructure.database.booking_tables import ARCHIVE_SCHEMA, BOOKING_TABLES, BookingTable
+
+logger = logging.getLogger(__name__)
+
+# Only settled bookings leave the hot tables; pending ones stay until confirmed or cancelled
+ARCHIVED_STATUSES = ("confirmed", "cancelled")
+
+# Holds a row only while archive_batch deletes moved bookings from the hot tables; the
+# counter and projection delete triggers skip those deletes (triggers in the main
+# schema cannot read temp tables, so the flag lives in main)
+ARCHIVAL_GUARD = "NOT EXISTS (SELECT 1 FROM booking_archival)"
+
+
+def _table_columns(cursor: sqlite3.Cursor, schema: str, table: str) -> List[str]:
+    """Column names of a table in the given schema."""
+    cursor.execute(f"PRAGMA {schema}.table_info({table})")
+    return [row[1] for row in cursor.fetchall()]
+
+
+def create_archive_tables(conn: sqlite3.Connection) -> None:
+    """
+    Mirror every booking table into the archive database.
+    
+    The archive tables copy the hot table definitions, pick up columns added to
+    the hot tables since, and index the columns lookups fall through on
+    (tracking_code and user_id). Idempotent; run after migrations and for a
+    new archive file.
+    """
+    cursor = conn.cursor()
+    for table in BOOKING_TABLES:
+        cursor.execute("SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?", (table.table,))
+        ddl = cursor.fetchone()[0]
+        cursor.execute(ddl.replace(
+            f"CREATE TABLE {table.table}",
+            f"CREATE TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.{table.table}",
+            1
+        ))
+        
+        archived_columns = set(_table_columns(cursor, ARCHIVE_SCHEMA, table.table))
+        cursor.execute(f"PRAGMA main.table_info({table.table})")
+        for _, column, column_type, *_ in cursor.fetchall():
+            if column not in archived_columns:
+                cursor.execute(f"ALTER TABLE {ARCHIVE_SCHEMA}.{table.table} ADD COLUMN {column} {column_type}")
+                logger.info(f"Added column {ARCHIVE_SCHEMA}.{table.table}.{column}")
+        
+        for column in ("tracking_code", "user_id"):
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {ARCHIVE_SCHEMA}.idx_{table.table}_{column} "
+                f"ON {table.table}({column})"
+            )
+    conn.commit()
+
+
+def keep_archived_bookings_visible(cursor: sqlite3.Cursor) -> None:
+    """
+    Make archival leave the booking counters and the bookings projection alone.
+    
+    Archiving moves a booking, it does not cancel it: stats keep counting it,
+    and the history view keeps listing it (archived bookings are settled, so
+    their projection rows never change again). The counter and projection
+    delete triggers are recreated to skip deletes made by archive_batch.
+    Bookings archived before this change are put back into the projection,
+    and the counters are recounted from it.
+    """
+    cursor.execute("CREATE TABLE IF NOT EXISTS booking_archival (active INTEGER PRIMARY KEY)")
+    
+    for domain, (table, _, _) in PROJECTED_TABLES.items():
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_counters_delete")
+        create_counters_delete_trigger(cursor, domain, ARCHIVAL_GUARD)
+        cursor.execute(f"DROP TRIGGER IF EXISTS trg_{table}_projection_delete")
+        create_projection_delete_trigger(cursor, domain, ARCHIVAL_GUARD)
+    
+    restored = 0
+    for domain, (table, _, _) in PROJECTED_TABLES.items():
+        cursor.execute(
+            f"SELECT 1 FROM {ARCHIVE_SCHEMA}.sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        )
+        if cursor.fetchone() is None:
+            continue
+        cursor.execute(
+            f"INSERT OR IGNORE INTO bookings ({PROJECTION_COLUMNS}) "
+            f"SELECT {_projected_values(domain, 't')} FROM {ARCHIVE_SCHEMA}.{table} t ORDER BY t.created_at"
+        )
+        restored += cursor.rowcount
+    if restored:
+        logger.info(f"Restored {restored} archived bookings to the bookings projection")
+        rebuild_booking_counters(cursor)
+
+
+def archive_batch(conn: sqlite3.Connection, table: BookingTable, cutoff: str, batch_size: int) -> int:
+    """
+    Move one batch of settled bookings created before cutoff into the archive.
+    
+    Copy and delete happen in the caller's transaction. SQLite does not make a
+    WAL transaction atomic across attached files, so after a crash a booking may
+    be left in both places; the copy is an upsert and hot rows win on lookup,
+    so the next run simply finishes the move. The delete is flagged in
+    booking_archival, so moved bookings stay in the stats counters and in the
+    bookings projection (and therefore in the history view).
+    
+    Returns:
+        Number of bookings moved
+    """
+    cursor = conn.cursor()
+    cursor.execute("CREATE TEMP TABLE IF NOT EXISTS archive_batch (id TEXT PRIMARY KEY)")
+    cursor.execute("DELETE FROM temp.archive_batch")
+    cursor.execute(
+        f"INSERT INTO temp.archive_batch (id) "
+        f"SELECT id FROM main.{table.table} "
+        f"WHERE status IN ({', '.join('?' * len(ARCHIVED_STATUSES))}) AND created_at < ? "
+        f"ORDER BY created_at LIMIT ?",
+        (*ARCHIVED_STATUSES, cutoff, batch_size)
+    )
+    moved = cursor.rowcount
+    if not moved:
+        return 0
+    
+    columns = ", ".join(_table_columns(cursor, "main", table.table))
+    cursor.execute(
+        f"INSERT OR REPLACE INTO {ARCHIVE_SCHEMA}.{table.table} ({columns}) "
+        f"SELECT {columns} FROM main.{table.table} WHERE id IN (SELECT id FROM temp.archive_batch)"
+    )
+    cursor.execute("INSERT OR REPLACE INTO main.booking_archival (active) VALUES (1)")
+    cursor.execute(f"DELETE FROM main.{table.table} WHERE id IN (SELECT id FROM temp.archive_batch)")
+    cursor.execute("DELETE FROM main.booking_archival")
+    return moved
+
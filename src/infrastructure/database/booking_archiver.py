@@ -0,0 +1,48 @@
+"""Scheduled archiving of old bookings into the attached archive database."""
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from infrastructure.database.booking_archive import archive_batch
+from infrastructure.database.booking_tables import BOOKING_TABLES
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from shared.utils.construction_counts import count_construction
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BookingArchiver:
+    """Moves old confirmed/cancelled bookings from the hot tables into the archive."""
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Initialize archiver with database connection."""
+        count_construction(self)
+        self._db = db or get_db_connection()
+    
+    async def run(self, older_than_days: int, batch_size: int) -> Dict[str, int]:
+        """
+        Archive every settled booking older than the given age.
+        
+        Each batch is its own write transaction, so bookings being saved are
+        never held up for longer than one batch. Archived bookings still count
+        in the booking stats and still appear in the history view.
+        
+        Args:
+            older_than_days: Minimum booking age in days
+            batch_size: Bookings moved per transaction
+            
+        Returns:
+            Number of bookings archived per domain
+        """
+        cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat()
+        archived = {}
+        for table in BOOKING_TABLES:
+            total = 0
+            while True:
+                moved = await self._db.run(archive_batch, table, cutoff, batch_size)
+                total += moved
+                if moved < batch_size:
+                    break
+            archived[table.domain] = total
+        
+        logger.info(f"Archived bookings older than {older_than_days} days: {archived}")
+        return archived
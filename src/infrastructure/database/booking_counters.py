@@ -0,0 +1,113 @@
+"""Booking statistics rollups maintained by triggers on the domain tables."""
+import sqlite3
+import logging
+from typing import Optional
+from infrastructure.database.booking_projection import PROJECTED_TABLES
+
+logger = logging.getLogger(__name__)
+
+# Calendar day (YYYY-MM-DD) of an ISO created_at value
+DAY_OF = "substr({}, 1, 10)"
+
+
+def _adjust_status(domain: str, status: str, delta: int) -> str:
+    """Statement adding delta to one (domain, status) counter."""
+    return (
+        f"INSERT INTO booking_status_counts (domain, status, count) VALUES ('{domain}', {status}, {delta}) "
+        f"ON CONFLICT (domain, status) DO UPDATE SET count = count + ({delta});"
+    )
+
+
+def _adjust_day(domain: str, created_at: str, delta: int) -> str:
+    """Statement adding delta to one (day, domain) counter."""
+    return (
+        f"INSERT INTO booking_daily_counts (day, domain, count) "
+        f"VALUES ({DAY_OF.format(created_at)}, '{domain}', {delta}) "
+        f"ON CONFLICT (day, domain) DO UPDATE SET count = count + ({delta});"
+    )
+
+
+def create_counters_delete_trigger(cursor: sqlite3.Cursor, domain: str, when: Optional[str] = None) -> None:
+    """Create the trigger uncounting a deleted booking, optionally only WHEN a condition holds."""
+    table = PROJECTED_TABLES[domain][0]
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_counters_delete
+        AFTER DELETE ON {table}
+        {f'WHEN {when}' if when else ''}
+        BEGIN
+            {_adjust_status(domain, 'OLD.status', -1)}
+            {_adjust_day(domain, 'OLD.created_at', -1)}
+        END
+    """)
+
+
+def rebuild_booking_counters(cursor: sqlite3.Cursor) -> None:
+    """Recount every counter from the bookings projection."""
+    cursor.execute("DELETE FROM booking_status_counts")
+    cursor.execute("DELETE FROM booking_daily_counts")
+    cursor.execute("""
+        INSERT INTO booking_status_counts (domain, status, count)
+        SELECT domain, status, COUNT(*) FROM bookings GROUP BY domain, status
+    """)
+    cursor.execute(f"""
+        INSERT INTO booking_daily_counts (day, domain, count)
+        SELECT {DAY_OF.format('created_at')}, domain, COUNT(*) FROM bookings GROUP BY 1, 2
+    """)
+    logger.info(f"Booking counters rebuilt ({cursor.rowcount} day/domain rows)")
+
+
+def create_booking_counters(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the booking counter tables and the triggers that keep them current.
+    
+    booking_status_counts holds one row per (domain, status) and
+    booking_daily_counts one row per (day, domain) of created_at, so stats are
+    read from a handful of rows regardless of how many bookings exist. The
+    counters are backfilled from the bookings projection the first time they
+    are created.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'booking_status_counts'")
+    exists = cursor.fetchone() is not None
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS booking_status_counts (
+            domain TEXT NOT NULL,
+            status TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (domain, status)
+        ) WITHOUT ROWID
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS booking_daily_counts (
+            day TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (day, domain)
+        ) WITHOUT ROWID
+    """)
+    
+    for domain, (table, _, _) in PROJECTED_TABLES.items():
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_counters_insert
+            AFTER INSERT ON {table}
+            BEGIN
+                {_adjust_status(domain, 'NEW.status', 1)}
+                {_adjust_day(domain, 'NEW.created_at', 1)}
+            END
+        """)
+        
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_counters_status
+            AFTER UPDATE OF status ON {table}
+            WHEN OLD.status IS NOT NEW.status
+            BEGIN
+                {_adjust_status(domain, 'OLD.status', -1)}
+                {_adjust_status(domain, 'NEW.status', 1)}
+            END
+        """)
+        
+        create_counters_delete_trigger(cursor, domain)
+    
+    if not exists:
+        rebuild_booking_counters(cursor)
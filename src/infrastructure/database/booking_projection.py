@@ -0,0 +1,122 @@
+"""Unified bookings read model maintained by triggers on the domain tables."""
+import sqlite3
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Domain -> (booking table, column projected as pricing_name, column projected as pricing_price)
+PROJECTED_TABLES = {
+    "recording": ("recording_bookings", None, None),
+    "music_production": ("music_production_bookings", None, None),
+    "mix_master": ("mix_master_bookings", None, None),
+    "consultation": ("consultation_bookings", None, None),
+    "distribution": ("distribution_bookings", "pricing_name", "pricing_price"),
+}
+
+PROJECTION_COLUMNS = (
+    "domain, booking_id, user_id, user_name, user_contact, "
+    "tracking_code, status, created_at, pricing_name, pricing_price"
+)
+
+
+def _projected_values(domain: str, row: str) -> str:
+    """SQL value list projecting a domain row (NEW/OLD or a table alias) into bookings."""
+    _, pricing_name, pricing_price = PROJECTED_TABLES[domain]
+    return (
+        f"'{domain}', {row}.id, {row}.user_id, {row}.user_name, {row}.user_contact, "
+        f"{row}.tracking_code, {row}.status, {row}.created_at, "
+        f"{f'{row}.{pricing_name}' if pricing_name else 'NULL'}, "
+        f"{f'{row}.{pricing_price}' if pricing_price else 'NULL'}"
+    )
+
+
+def create_projection_delete_trigger(cursor: sqlite3.Cursor, domain: str, when: Optional[str] = None) -> None:
+    """Create the trigger dropping a deleted booking from the projection, optionally only WHEN a condition holds."""
+    table = PROJECTED_TABLES[domain][0]
+    cursor.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{table}_projection_delete
+        AFTER DELETE ON {table}
+        {f'WHEN {when}' if when else ''}
+        BEGIN
+            DELETE FROM bookings WHERE domain = '{domain}' AND booking_id = OLD.id;
+        END
+    """)
+
+
+def create_booking_projection(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the unified bookings table, its indexes and sync triggers.
+    
+    The table is backfilled from the domain tables the first time it is created;
+    afterwards the triggers keep it current inside each booking transaction.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bookings'")
+    exists = cursor.fetchone() is not None
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS bookings (
+            id INTEGER PRIMARY KEY,
+            domain TEXT NOT NULL,
+            booking_id TEXT NOT NULL,
+            user_id INTEGER NOT NULL,
+            user_name TEXT NOT NULL,
+            user_contact TEXT NOT NULL,
+            tracking_code TEXT,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            pricing_name TEXT,
+            pricing_price TEXT,
+            UNIQUE (domain, booking_id)
+        )
+    """)
+    
+    # History pages walk one of these indexes newest-first
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_bookings_created_at
+        ON bookings(created_at DESC, id DESC)
+    """)
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_bookings_domain_created_at
+        ON bookings(domain, created_at DESC, id DESC)
+    """)
+    
+    for domain, (table, pricing_name, pricing_price) in PROJECTED_TABLES.items():
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_projection_insert
+            AFTER INSERT ON {table}
+            BEGIN
+                INSERT OR REPLACE INTO bookings ({PROJECTION_COLUMNS})
+                VALUES ({_projected_values(domain, 'NEW')});
+            END
+        """)
+        
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_projection_update
+            AFTER UPDATE ON {table}
+            BEGIN
+                UPDATE bookings
+                SET user_name = NEW.user_name,
+                    user_contact = NEW.user_contact,
+                    tracking_code = NEW.tracking_code,
+                    status = NEW.status,
+                    pricing_name = {f'NEW.{pricing_name}' if pricing_name else 'NULL'},
+                    pricing_price = {f'NEW.{pricing_price}' if pricing_price else 'NULL'}
+                WHERE domain = '{domain}' AND booking_id = OLD.id;
+            END
+        """)
+        
+        create_projection_delete_trigger(cursor, domain)
+    
+    if not exists:
+        # Oldest first so projection ids follow booking creation order
+        cursor.execute(
+            f"INSERT OR IGNORE INTO bookings ({PROJECTION_COLUMNS}) "
+            + " UNION ALL ".join(
+                f"SELECT {_projected_values(domain, 't')} FROM {table} t"
+                for domain, (table, _, _) in PROJECTED_TABLES.items()
+            )
+            + " ORDER BY 8"
+        )
+        logger.info(f"Unified bookings projection backfilled with {cursor.rowcount} bookings")
@@ -0,0 +1,30 @@
+"""Lightweight read-only booking record for list and scan paths."""
+from typing import NamedTuple, Optional
+
+# SELECT list producing BookingRecord fields from the unified bookings projection
+PROJECTION_RECORD_COLUMNS = (
+    "domain, booking_id, user_id, user_name, user_contact, tracking_code, "
+    "status, created_at, pricing_name, pricing_price, id"
+)
+
+
+class BookingRecord(NamedTuple):
+    """
+    One booking of any domain, as stored.
+    
+    A plain tuple: no per-instance dict and no entity validation, so large
+    admin lists cost little memory and CPU. Use the domain entities (or
+    find_by_id) when a booking is going to be changed.
+    """
+    
+    domain: str
+    id: str
+    user_id: int
+    user_name: str
+    user_contact: str
+    tracking_code: Optional[str]
+    status: str
+    created_at: str  # ISO format, as stored
+    pricing_name: Optional[str] = None  # Distribution only
+    pricing_price: Optional[str] = None  # Distribution only
+    row_id: Optional[int] = None  # bookings projection row, used as a pagination cursor
@@ -0,0 +1,207 @@
+"""Declarative descriptors for the booking tables and the SQL generated from them."""
+from dataclasses import dataclass, replace
+from functools import cached_property
+from typing import Dict, Optional, Tuple
+
+# Set once on insert, never touched by a save of an existing booking
+IMMUTABLE_COLUMNS = ("id", "user_id", "created_at")
+
+# Status served by the partial idx_<table>_pending indexes. Queries must spell it
+# as a literal: SQLite only uses a partial index when the WHERE clause matches
+# its condition at prepare time, which a bound parameter never does.
+PENDING_STATUS = "pending"
+
+# Schema name of the attached cold-storage database holding archived bookings
+ARCHIVE_SCHEMA = "archive"
+
+
+@dataclass(frozen=True)
+class BookingTable:
+    """
+    One booking table: its name and the columns a repository reads and writes.
+    
+    Columns are listed in SELECT/INSERT order; rows are decoded positionally in
+    that order. updated_at is managed by the mapper and is not listed.
+    """
+    
+    domain: str
+    table: str
+    columns: Tuple[str, ...]
+    
+    @cached_property
+    def select_sql(self) -> str:
+        """SELECT ... FROM prefix shared by every finder."""
+        return f"SELECT {', '.join(self.columns)} FROM {self.table}"
+    
+    @cached_property
+    def upsert_sql(self) -> str:
+        """Single-statement save: insert, or update the mutable columns of an existing booking."""
+        assignments = ", ".join(
+            f"{column} = excluded.{column}"
+            for column in self.columns
+            if column not in IMMUTABLE_COLUMNS
+        )
+        return (
+            f"INSERT INTO {self.table} ({', '.join(self.columns)}) "
+            f"VALUES ({', '.join('?' * len(self.columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {assignments}, updated_at = ?"
+        )
+    
+    @cached_property
+    def import_sql(self) -> str:
+        """Bulk-import upsert: like upsert_sql, but updated_at is a column taken from the row."""
+        columns = self.columns + ("updated_at",)
+        assignments = ", ".join(
+            f"{column} = excluded.{column}"
+            for column in columns
+            if column not in IMMUTABLE_COLUMNS
+        )
+        return (
+            f"INSERT INTO {self.table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {assignments}"
+        )
+    
+    @cached_property
+    def find_by_id_sql(self) -> str:
+        """Single booking by primary key."""
+        return f"{self.select_sql} WHERE id = ?"
+    
+    @cached_property
+    def find_by_user_id_sql(self) -> str:
+        """A user's bookings, newest first."""
+        return f"{self.select_sql} WHERE user_id = ? ORDER BY created_at DESC"
+    
+    @cached_property
+    def find_by_user_id_with_archive_sql(self) -> str:
+        """A user's bookings from the hot and archive tables, newest first (user_id bound twice)."""
+        return (
+            f"{self.select_sql} WHERE user_id = ? UNION ALL "
+            f"{self.archive.select_sql} WHERE user_id = ? ORDER BY created_at DESC"
+        )
+    
+    @cached_property
+    def find_by_status_sql(self) -> str:
+        """Bookings with a status, newest first."""
+        return f"{self.select_sql} WHERE status = ? ORDER BY created_at DESC, id DESC"
+    
+    @cached_property
+    def find_pending_sql(self) -> str:
+        """Pending bookings, newest first, read through the partial pending index."""
+        return f"{self.select_sql} WHERE status = '{PENDING_STATUS}' ORDER BY created_at DESC, id DESC"
+    
+    @cached_property
+    def find_by_tracking_code_sql(self) -> str:
+        """Newest booking with a tracking code."""
+        return f"{self.select_sql} WHERE tracking_code = ? ORDER BY created_at DESC LIMIT 1"
+    
+    @cached_property
+    def find_all_sql(self) -> str:
+        """Every booking, newest first."""
+        return f"{self.select_sql} ORDER BY created_at DESC"
+    
+    @cached_property
+    def archive(self) -> "BookingTable":
+        """The same table in the attached archive database."""
+        return replace(self, table=f"{ARCHIVE_SCHEMA}.{self.table}")
+    
+    @cached_property
+    def record_select_sql(self) -> str:
+        """SELECT ... FROM prefix producing BookingRecord fields in order."""
+        pricing = [
+            column if column in self.columns else "NULL"
+            for column in ("pricing_name", "pricing_price")
+        ]
+        return (
+            f"SELECT '{self.domain}', id, user_id, user_name, user_contact, tracking_code, "
+            f"status, created_at, {', '.join(pricing)}, NULL FROM {self.table}"
+        )
+    
+    def find_page_sql(self, after_cursor: bool, status: Optional[str], records: bool = False) -> str:
+        """
+        Keyset page query, newest first, for the given optional filters and output (rows or records).
+        
+        The pending status is inlined (see PENDING_STATUS); any other status is a
+        parameter following the cursor parameters.
+        """
+        if status is None:
+            status_filter = None
+        elif status == PENDING_STATUS:
+            status_filter = PENDING_STATUS
+        else:
+            status_filter = "?"
+        return self._find_page_sql[(after_cursor, status_filter, records)]
+    
+    @cached_property
+    def _find_page_sql(self) -> Dict[Tuple[bool, Optional[str], bool], str]:
+        """Every filter/output combination of the keyset page query, built once."""
+        queries = {}
+        for after_cursor in (False, True):
+            for status_filter in (None, PENDING_STATUS, "?"):
+                conditions = []
+                if after_cursor:
+                    conditions.append("(created_at, id) < (?, ?)")
+                if status_filter == PENDING_STATUS:
+                    conditions.append(f"status = '{PENDING_STATUS}'")
+                elif status_filter:
+                    conditions.append("status = ?")
+                where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+                for records, select in ((False, self.select_sql), (True, self.record_select_sql)):
+                    queries[(after_cursor, status_filter, records)] = (
+                        f"{select}{where} ORDER BY created_at DESC, id DESC LIMIT ?"
+                    )
+        return queries
+
+
+RECORDING_BOOKINGS = BookingTable(
+    domain="recording",
+    table="recording_bookings",
+    columns=(
+        "id", "user_id", "user_name", "user_contact", "service_tier_id",
+        "service_option_id", "tracking_code", "created_at", "status",
+    ),
+)
+
+MUSIC_PRODUCTION_BOOKINGS = BookingTable(
+    domain="music_production",
+    table="music_production_bookings",
+    columns=(
+        "id", "user_id", "user_name", "user_contact", "service_tier_id",
+        "service_option_id", "tracking_code", "created_at", "status",
+    ),
+)
+
+MIX_MASTER_BOOKINGS = BookingTable(
+    domain="mix_master",
+    table="mix_master_bookings",
+    columns=(
+        "id", "user_id", "user_name", "user_contact", "plan_id", "plan_name",
+        "plan_price", "tracking_code", "created_at", "status",
+    ),
+)
+
+CONSULTATION_BOOKINGS = BookingTable(
+    domain="consultation",
+    table="consultation_bookings",
+    columns=(
+        "id", "user_id", "user_name", "user_contact", "consultant_id",
+        "consultant_name", "tracking_code", "created_at", "status",
+    ),
+)
+
+DISTRIBUTION_BOOKINGS = BookingTable(
+    domain="distribution",
+    table="distribution_bookings",
+    columns=(
+        "id", "user_id", "user_name", "user_contact", "pricing_id", "pricing_name",
+        "pricing_price", "platforms", "release_date", "tracking_code", "created_at", "status",
+    ),
+)
+
+BOOKING_TABLES: Tuple[BookingTable, ...] = (
+    RECORDING_BOOKINGS,
+    MUSIC_PRODUCTION_BOOKINGS,
+    MIX_MASTER_BOOKINGS,
+    CONSULTATION_BOOKINGS,
+    DISTRIBUTION_BOOKINGS,
+)
@@ -0,0 +1,245 @@
+"""Streaming export and bulk import of bookings as JSONL or CSV."""
+import csv
+import json
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+from infrastructure.database.booking_tables import BOOKING_TABLES, BookingTable
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from infrastructure.database.tracking_codes import insert_with_unique_tracking_code, is_tracking_code_conflict
+from shared.utils.tracking_code import generate_tracking_code
+import logging
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("jsonl", "csv")
+
+# Rows pulled per fetchmany and rows written per import transaction
+DEFAULT_BATCH_SIZE = 5000
+
+# Every exported field, in CSV column order: the domain, then the union of all table columns
+EXPORT_FIELDS: Tuple[str, ...] = ("domain",) + tuple(dict.fromkeys(
+    column for table in BOOKING_TABLES for column in table.columns + ("updated_at",)
+))
+
+_TABLES_BY_DOMAIN = {table.domain: table for table in BOOKING_TABLES}
+
+
+@dataclass
+class TrackingCodeChange:
+    """A booking given a fresh tracking code because an older booking holds its code."""
+    
+    domain: str
+    booking_id: str
+    old_code: str
+    new_code: str
+
+
+@dataclass
+class ImportReport:
+    """Outcome of one import."""
+    
+    imported: Dict[str, int] = field(default_factory=dict)  # Bookings written per domain
+    regenerated: List[TrackingCodeChange] = field(default_factory=list)
+
+
+def iter_rows(conn: sqlite3.Connection, table: BookingTable, batch_size: int) -> Iterator[Dict[str, Any]]:
+    """Yield a table's bookings as dicts, holding at most one fetchmany batch in memory."""
+    columns = table.columns + ("updated_at",)
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(f"SELECT {', '.join(columns)} FROM {table.table} ORDER BY created_at, id")
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        for row in rows:
+            yield dict(zip(columns, row), domain=table.domain)
+
+
+def read_bookings(source: TextIO, file_format: str) -> Iterator[Dict[str, Any]]:
+    """Parse exported bookings one at a time."""
+    if file_format == "jsonl":
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        for row in csv.DictReader(source):
+            # CSV has no NULL; exported None values come back as empty strings
+            yield {field: value if value != "" else None for field, value in row.items()}
+
+
+class BookingTransfer:
+    """Moves every booking table to and from a JSONL/CSV file."""
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Initialize transfer with database connection."""
+        self._db = db or get_db_connection()
+    
+    async def export_to(
+        self,
+        target: TextIO,
+        file_format: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        with_archive: bool = False
+    ) -> Dict[str, int]:
+        """
+        Stream all bookings to a file.
+        
+        Args:
+            target: Open text file to write to
+            file_format: "jsonl" or "csv"
+            batch_size: Rows fetched per fetchmany
+            with_archive: Also export the archived bookings
+            
+        Returns:
+            Number of bookings exported per domain
+        """
+        return await self._db.run_read(self._export, target, file_format, batch_size, with_archive)
+    
+    async def import_from(
+        self,
+        source: TextIO,
+        file_format: str,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> ImportReport:
+        """
+        Bulk-load bookings exported by export_to.
+        
+        Rows are upserted by ID in batches of batch_size, one transaction per
+        batch, so importing the same file twice leaves a single copy. A
+        tracking code held by another booking does not stop the import: as in
+        the registry backfill, the older booking keeps the code and the newer
+        one gets a fresh code (an archived holder always keeps its code).
+        Every such change is listed in the report.
+        
+        Args:
+            source: Open text file to read from
+            file_format: "jsonl" or "csv"
+            batch_size: Rows written per transaction
+            
+        Returns:
+            ImportReport with the bookings imported per domain and the regenerated codes
+            
+        Raises:
+            ValueError: If a row names an unknown domain
+        """
+        started = time.perf_counter()
+        report = ImportReport(imported={table.domain: 0 for table in BOOKING_TABLES})
+        batches: Dict[str, List[tuple]] = {table.domain: [] for table in BOOKING_TABLES}
+        
+        for booking in read_bookings(source, file_format):
+            table = _TABLES_BY_DOMAIN.get(booking.get("domain"))
+            if table is None:
+                raise ValueError(f"Unknown booking domain: {booking.get('domain')!r}")
+            batch = batches[table.domain]
+            batch.append(tuple(booking.get(column) for column in table.columns) + (booking.get("updated_at"),))
+            if len(batch) >= batch_size:
+                report.regenerated += await self._db.run(self._import_batch, table, batch)
+                report.imported[table.domain] += len(batch)
+                batches[table.domain] = []
+        
+        for domain, batch in batches.items():
+            if batch:
+                report.regenerated += await self._db.run(self._import_batch, _TABLES_BY_DOMAIN[domain], batch)
+                report.imported[domain] += len(batch)
+        
+        for change in report.regenerated:
+            logger.warning(
+                f"Tracking code {change.old_code} of {change.domain} booking {change.booking_id} "
+                f"was taken by an older booking, replaced with {change.new_code}"
+            )
+        logger.info(
+            f"Imported {sum(report.imported.values())} bookings in {time.perf_counter() - started:.1f}s: "
+            f"{report.imported}, {len(report.regenerated)} tracking codes regenerated"
+        )
+        return report
+    
+    def _export(self, conn: sqlite3.Connection, target: TextIO, file_format: str, batch_size: int, with_archive: bool) -> Dict[str, int]:
+        """Write every table to target (runs on a read connection)."""
+        started = time.perf_counter()
+        writer = None
+        if file_format == "csv":
+            writer = csv.DictWriter(target, fieldnames=EXPORT_FIELDS)
+            writer.writeheader()
+        
+        tables = BOOKING_TABLES + (tuple(table.archive for table in BOOKING_TABLES) if with_archive else ())
+        exported = {table.domain: 0 for table in BOOKING_TABLES}
+        for table in tables:
+            for booking in iter_rows(conn, table, batch_size):
+                if writer:
+                    writer.writerow(booking)
+                else:
+                    target.write(json.dumps(booking, ensure_ascii=False) + "\n")
+                exported[table.domain] += 1
+        
+        logger.info(f"Exported {sum(exported.values())} bookings in {time.perf_counter() - started:.1f}s: {exported}")
+        return exported
+    
+    def _import_batch(self, conn: sqlite3.Connection, table: BookingTable, rows: List[tuple]) -> List[TrackingCodeChange]:
+        """
+        Upsert one batch with a single executemany (runs on the database executor).
+        
+        On a tracking-code collision the batch is replayed row by row; the
+        upsert is idempotent, so rows written before the collision are simply
+        written again.
+        
+        Returns:
+            Tracking codes regenerated while writing the batch
+        """
+        try:
+            conn.executemany(table.import_sql, rows)
+            return []
+        except sqlite3.IntegrityError as e:
+            if not is_tracking_code_conflict(e):
+                raise
+        
+        cursor = conn.cursor()
+        changes = []
+        for row in rows:
+            changes += self._import_row(cursor, table, row)
+        return changes
+    
+    def _import_row(self, cursor: sqlite3.Cursor, table: BookingTable, row: tuple) -> List[TrackingCodeChange]:
+        """Upsert one booking, regenerating the newer booking's code if its code is taken."""
+        try:
+            cursor.execute(table.import_sql, row)
+            return []
+        except sqlite3.IntegrityError as e:
+            if not is_tracking_code_conflict(e):
+                raise
+        
+        booking = dict(zip(table.columns, row))
+        code = booking["tracking_code"]
+        cursor.execute("SELECT domain, booking_id, created_at FROM tracking_codes WHERE code = ?", (code,))
+        holder_domain, holder_id, holder_created_at = cursor.fetchone()
+        holder_table = _TABLES_BY_DOMAIN[holder_domain]
+        cursor.execute(f"SELECT 1 FROM {holder_table.table} WHERE id = ?", (holder_id,))
+        holder_is_hot = cursor.fetchone() is not None
+        
+        code_index = table.columns.index("tracking_code")
+        if not holder_is_hot or holder_created_at <= booking["created_at"]:
+            # A booking regenerated by an earlier import of the same file keeps that code
+            cursor.execute(f"SELECT tracking_code FROM {table.table} WHERE id = ?", (booking["id"],))
+            stored = cursor.fetchone()
+            stored_code = stored[0] if stored else None
+            new_code = insert_with_unique_tracking_code(
+                cursor,
+                table.import_sql,
+                lambda tracking_code: row[:code_index] + (tracking_code,) + row[code_index + 1:],
+                stored_code or generate_tracking_code(len(code))
+            )
+            if new_code == stored_code:
+                return []
+            return [TrackingCodeChange(table.domain, booking["id"], code, new_code)]
+        
+        # The incoming booking is older: the hot holder gives up the code
+        new_code = insert_with_unique_tracking_code(
+            cursor,
+            f"UPDATE {holder_table.table} SET tracking_code = ? WHERE id = ?",
+            lambda tracking_code: (tracking_code, holder_id),
+            generate_tracking_code(len(code))
+        )
+        cursor.execute(table.import_sql, row)
+        return [TrackingCodeChange(holder_domain, holder_id, code, new_code)]
@@ -0,0 +1,327 @@
+"""Versioned schema migrations for the SQLite database."""
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+from infrastructure.database.booking_archive import keep_archived_bookings_visible
+from infrastructure.database.booking_counters import create_booking_counters
+from infrastructure.database.booking_projection import create_booking_projection
+from infrastructure.database.tracking_codes import create_tracking_code_registry, create_tracking_code_update_triggers
+import logging
+
+logger = logging.getLogger(__name__)
+
+BOOKING_TABLES = (
+    "recording_bookings",
+    "music_production_bookings",
+    "mix_master_bookings",
+    "consultation_bookings",
+    "distribution_bookings",
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema change, applied at most once per database."""
+    
+    version: int
+    name: str
+    statements: Tuple[str, ...] = ()
+    apply: Optional[Callable[[sqlite3.Cursor], None]] = None  # Runs after statements
+
+
+def _add_missing_columns(cursor: sqlite3.Cursor, table: str, columns: Tuple[Tuple[str, str], ...]) -> None:
+    """Add columns that databases created by older releases do not have yet."""
+    cursor.execute(f"PRAGMA table_info({table})")
+    existing = {row[1] for row in cursor.fetchall()}
+    for column, column_type in columns:
+        if column not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            logger.info(f"Added column {table}.{column}")
+
+
+def _add_legacy_columns(cursor: sqlite3.Cursor) -> None:
+    """Columns added to the booking tables after their first release."""
+    _add_missing_columns(cursor, "recording_bookings", (("tracking_code", "TEXT"),))
+    _add_missing_columns(cursor, "music_production_bookings", (("tracking_code", "TEXT"),))
+    _add_missing_columns(cursor, "distribution_bookings", (
+        ("pricing_id", "TEXT"),
+        ("pricing_name", "TEXT"),
+        ("pricing_price", "TEXT"),
+    ))
+
+
+# Append new migrations at the end; never edit or reorder one that has shipped.
+# Version 1 uses IF NOT EXISTS because it adopts databases created before versioning.
+MIGRATIONS: List[Migration] = [
+    Migration(
+        version=1,
+        name="booking tables",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS recording_bookings (
+                id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                user_contact TEXT NOT NULL,
+                service_tier_id TEXT,
+                service_option_id TEXT,
+                tracking_code TEXT,
+                created_at TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                updated_at TEXT
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS music_production_bookings (
+                id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                user_contact TEXT NOT NULL,
+                service_tier_id TEXT NOT NULL,
+                service_option_id TEXT NOT NULL,
+                tracking_code TEXT,
+                created_at TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                updated_at TEXT
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS mix_master_bookings (
+                id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                user_contact TEXT NOT NULL,
+                plan_id TEXT,
+                plan_name TEXT,
+                plan_price TEXT,
+                tracking_code TEXT,
+                created_at TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                updated_at TEXT
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS consultation_bookings (
+                id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                user_contact TEXT NOT NULL,
+                consultant_id TEXT,
+                consultant_name TEXT,
+                tracking_code TEXT,
+                created_at TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                updated_at TEXT
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS distribution_bookings (
+                id TEXT PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                user_name TEXT NOT NULL,
+                user_contact TEXT NOT NULL,
+                pricing_id TEXT,
+                pricing_name TEXT,
+                pricing_price TEXT,
+                platforms TEXT,
+                release_date TEXT,
+                tracking_code TEXT,
+                created_at TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                updated_at TEXT
+            )
+            """,
+        ),
+    ),
+    Migration(
+        version=2,
+        name="legacy booking columns",
+        apply=_add_legacy_columns,
+    ),
+    Migration(
+        version=3,
+        name="booking user_id and status indexes",
+        statements=tuple(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table}({column})"
+            for table in BOOKING_TABLES
+            for column in ("user_id", "status")
+        ),
+    ),
+    Migration(
+        version=4,
+        name="keyset pagination indexes",
+        statements=tuple(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_created_at ON {table}(created_at DESC, id DESC)"
+            for table in BOOKING_TABLES
+        ),
+    ),
+    Migration(
+        version=5,
+        name="unified bookings projection",
+        apply=create_booking_projection,
+    ),
+    Migration(
+        version=6,
+        name="tracking code registry",
+        apply=create_tracking_code_registry,
+    ),
+    Migration(
+        version=7,
+        name="booking counters",
+        apply=create_booking_counters,
+    ),
+    Migration(
+        version=8,
+        name="pending partial indexes",
+        statements=tuple(
+            statement
+            for table in BOOKING_TABLES
+            for statement in (
+                # Only pending rows, so the queue stays small however much history accumulates
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_pending ON {table}(created_at DESC, id DESC) "
+                f"WHERE status = 'pending'",
+                # Mostly confirmed rows; other status filters ride idx_{table}_created_at instead
+                f"DROP INDEX IF EXISTS idx_{table}_status",
+            )
+        ),
+    ),
+    Migration(
+        version=9,
+        name="admin users",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS admin_users (
+                user_id INTEGER PRIMARY KEY,
+                username TEXT,
+                full_name TEXT,
+                created_at TEXT NOT NULL,
+                is_active INTEGER DEFAULT 1
+            )
+            """,
+            # Duplicated the primary key; left behind by databases that predate versioning
+            "DROP INDEX IF EXISTS idx_admin_users_user_id",
+        ),
+    ),
+    Migration(
+        version=10,
+        name="channel members",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS channel_members (
+                chat_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                is_member INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (chat_id, user_id)
+            ) WITHOUT ROWID
+            """,
+        ),
+    ),
+    Migration(
+        version=11,
+        name="notification outbox",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS notification_outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chat_id TEXT NOT NULL,
+                text TEXT NOT NULL,
+                parse_mode TEXT,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at TEXT NOT NULL,
+                last_error TEXT,
+                created_at TEXT NOT NULL
+            )
+            """,
+            # Delivered rows are deleted and failed ones are rare, so the dispatcher's poll stays tiny
+            "CREATE INDEX IF NOT EXISTS idx_notification_outbox_due ON notification_outbox(next_attempt_at, id) "
+            "WHERE status = 'pending'",
+        ),
+    ),
+    Migration(
+        version=12,
+        name="tracking code update triggers",
+        apply=create_tracking_code_update_triggers,
+    ),
+    Migration(
+        version=13,
+        name="archival keeps bookings counted",
+        apply=keep_archived_bookings_visible,
+    ),
+]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the newest applied migration version (0 for an unversioned database)."""
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        # schema_version does not exist yet
+        return 0
+    return row[0] or 0
+
+
+def migrate(conn: sqlite3.Connection, migrations: Optional[List[Migration]] = None) -> List[Migration]:
+    """
+    Apply every pending migration in a single transaction.
+    
+    When the schema is current this costs one SELECT. Otherwise the write lock
+    is taken up front (BEGIN IMMEDIATE), the version is re-read so concurrent
+    processes do not apply the same migration twice, and either all pending
+    migrations are committed or none are.
+    
+    Args:
+        conn: Writer connection, not inside a transaction
+        migrations: Migrations to consider, defaults to MIGRATIONS
+        
+    Returns:
+        The migrations that were applied
+    """
+    migrations = sorted(migrations or MIGRATIONS, key=lambda migration: migration.version)
+    latest = migrations[-1].version if migrations else 0
+    
+    if get_schema_version(conn) >= latest:
+        return []
+    
+    started = time.perf_counter()
+    current = 0
+    cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TEXT NOT NULL
+            )
+        """)
+        current = get_schema_version(conn)
+        pending = [migration for migration in migrations if migration.version > current]
+        
+        for migration in pending:
+            for statement in migration.statements:
+                cursor.execute(statement)
+            if migration.apply:
+                migration.apply(cursor)
+            cursor.execute(
+                "INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                (migration.version, migration.name, datetime.now().isoformat())
+            )
+            logger.info(f"Applied schema migration {migration.version}: {migration.name}")
+        
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        logger.error(f"Schema migration failed, rolled back to version {current}")
+        raise
+    
+    if pending:
+        logger.info(
+            f"Schema migrated from version {current} to {pending[-1].version} "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+    return pending
@@ -0,0 +1,56 @@
+"""Notification outbox: Telegram messages persisted alongside the change they announce."""
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Sequence, Union
+
+# Outbox row statuses; delivered rows are deleted rather than marked
+OUTBOX_PENDING = "pending"
+OUTBOX_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class Notification:
+    """A message to send once the surrounding transaction commits."""
+    
+    chat_id: Union[int, str]
+    text: str
+    parse_mode: Optional[str] = None
+
+
+# Builds the notifications for a saved booking; runs inside the save transaction,
+# after the booking's final tracking code is known
+NotificationBuilder = Callable[[Any], Iterable[Notification]]
+
+
+class OutboxEntry(NamedTuple):
+    """A queued notification, as read by the dispatcher."""
+    
+    id: int
+    chat_id: str
+    text: str
+    parse_mode: Optional[str]
+    attempts: int
+
+
+def enqueue_notifications(conn: sqlite3.Connection, notifications: Sequence[Notification]) -> int:
+    """
+    Queue notifications in the caller's transaction.
+    
+    They become visible to the dispatcher only if that transaction commits,
+    so a message is never sent for a change that was rolled back, and never
+    lost for one that was committed.
+    
+    Returns:
+        Number of notifications queued
+    """
+    now = datetime.now().isoformat()
+    conn.executemany(
+        "INSERT INTO notification_outbox (chat_id, text, parse_mode, status, next_attempt_at, created_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (str(notification.chat_id), notification.text, notification.parse_mode, OUTBOX_PENDING, now, now)
+            for notification in notifications
+        ]
+    )
+    return len(notifications)
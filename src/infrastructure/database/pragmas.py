@@ -0,0 +1,123 @@
+"""SQLite pragma profiles applied to every new connection."""
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# PRAGMA synchronous / temp_store report numeric values when read back
+_SYNCHRONOUS_VALUES = {'off': 0, 'normal': 1, 'full': 2, 'extra': 3}
+_TEMP_STORE_VALUES = {'default': 0, 'file': 1, 'memory': 2}
+
+
+@dataclass(frozen=True)
+class PragmaProfile:
+    """Named set of connection pragmas."""
+    
+    name: str
+    journal_mode: Optional[str]  # None leaves the (persistent) journal mode untouched
+    synchronous: str
+    mmap_size: int  # Bytes, 0 disables memory-mapped I/O
+    cache_size: int  # Negative values are KiB, positive values are pages
+    temp_store: str
+    busy_timeout: int  # Milliseconds
+    query_only: bool = False
+
+
+PRAGMA_PROFILES: Dict[str, PragmaProfile] = {
+    # Every commit is fsynced, but readers no longer block the writer
+    "durable": PragmaProfile(
+        name="durable",
+        journal_mode="wal",
+        synchronous="full",
+        mmap_size=0,
+        cache_size=-8000,
+        temp_store="default",
+        busy_timeout=5000,
+    ),
+    # WAL + synchronous=NORMAL only fsyncs at checkpoints; a power loss can
+    # drop the last few commits but never corrupts the database
+    "throughput": PragmaProfile(
+        name="throughput",
+        journal_mode="wal",
+        synchronous="normal",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64000,
+        temp_store="memory",
+        busy_timeout=5000,
+    ),
+    # Large caches for admin scans and exports; refuses to write
+    "readonly-report": PragmaProfile(
+        name="readonly-report",
+        journal_mode=None,
+        synchronous="normal",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64000,
+        temp_store="memory",
+        busy_timeout=10000,
+        query_only=True,
+    ),
+}
+
+
+def get_pragma_profile(name: str) -> PragmaProfile:
+    """
+    Look up a pragma profile by name.
+    
+    Raises:
+        ValueError: If the profile does not exist
+    """
+    profile = PRAGMA_PROFILES.get(name)
+    if not profile:
+        raise ValueError(
+            f"Unknown SQLite pragma profile '{name}'. "
+            f"Available profiles: {', '.join(PRAGMA_PROFILES)}"
+        )
+    return profile
+
+
+def apply_pragma_profile(conn: sqlite3.Connection, profile: PragmaProfile) -> Dict[str, object]:
+    """
+    Apply a pragma profile to a connection and verify it took effect.
+    
+    Args:
+        conn: Open SQLite connection (must not be inside a transaction)
+        profile: Profile to apply
+        
+    Returns:
+        The effective pragma values as reported back by SQLite
+    """
+    # busy_timeout first so a journal mode switch waits for other connections
+    expected = {'busy_timeout': profile.busy_timeout}
+    if profile.journal_mode:
+        expected['journal_mode'] = profile.journal_mode
+    expected.update({
+        'synchronous': _SYNCHRONOUS_VALUES[profile.synchronous],
+        'cache_size': profile.cache_size,
+        'mmap_size': profile.mmap_size,
+        'temp_store': _TEMP_STORE_VALUES[profile.temp_store],
+        'query_only': int(profile.query_only),
+    })
+    
+    effective = {}
+    for pragma, value in expected.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+        row = conn.execute(f"PRAGMA {pragma}").fetchone()
+        effective[pragma] = row[0] if row else None
+    
+    mismatched = {
+        pragma: effective[pragma]
+        for pragma, value in expected.items()
+        if str(effective[pragma]).lower() != str(value).lower()
+    }
+    if mismatched:
+        # e.g. in-memory databases report journal_mode=memory, and builds
+        # without mmap support cap mmap_size
+        logger.warning(f"SQLite pragma profile '{profile.name}' partially applied, effective values differ: {mismatched}")
+    
+    logger.info(
+        f"SQLite pragma profile '{profile.name}' applied: "
+        + ", ".join(f"{pragma}={value}" for pragma, value in effective.items())
+    )
+    return effective
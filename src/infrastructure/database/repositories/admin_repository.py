@@ -1,5 +1,11 @@
 """Admin repository for managing admin users."""
-from infrastructure.database.sqlite_connection import get_db_connection
+import sqlite3
+import time
+from datetime import datetime
+from typing import FrozenSet, Optional
+from config import Settings
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from shared.utils.construction_counts import count_construction
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,87 +14,92 @@ logger = logging.getLogger(__name__)
 class AdminRepository:
     """Repository for admin user management."""
     
-    def __init__(self):
+    def __init__(self, db: Optional[SQLiteConnection] = None):
         """Initialize repository with database connection."""
-        self._db = get_db_connection()
-        self._initialize_table()
+        count_construction(self)
+        self._db = db or get_db_connection()
+        # Active admin ids, loaded on first use; dropped by add/remove and reloaded once stale
+        self._admin_ids: Optional[FrozenSet[int]] = None
+        self._admin_ids_loaded_at = 0.0
     
-    def _initialize_table(self):
-        """Initialize admin users table."""
-        conn = self._db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS admin_users (
-                user_id INTEGER PRIMARY KEY,
-                username TEXT,
-                full_name TEXT,
-                created_at TEXT NOT NULL,
-                is_active INTEGER DEFAULT 1
-            )
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_admin_users_user_id 
-            ON admin_users(user_id)
-        """)
+    async def is_admin(self, user_id: int) -> bool:
+        """
+        Check if user is an admin.
         
-        conn.commit()
-        logger.info("Admin users table initialized")
+        Answered from the in-memory admin set; SQL only runs when the set is
+        first loaded, after add_admin/remove_admin, and every
+        Settings.ADMIN_CACHE_TTL_SECONDS (to see admins added by other
+        processes, e.g. add_first_admin.py).
+        """
+        admin_ids = self._admin_ids
+        if admin_ids is None or time.monotonic() - self._admin_ids_loaded_at > Settings.ADMIN_CACHE_TTL_SECONDS:
+            admin_ids = await self._load_admin_ids()
+        return user_id in admin_ids
     
-    def is_admin(self, user_id: int) -> bool:
-        """Check if user is an admin."""
-        conn = self._db.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT user_id FROM admin_users 
-            WHERE user_id = ? AND is_active = 1
-        """, (user_id,))
-        
-        return cursor.fetchone() is not None
-    
-    def add_admin(self, user_id: int, username: str = None, full_name: str = None) -> bool:
+    async def add_admin(self, user_id: int, username: str = None, full_name: str = None) -> bool:
         """Add a new admin user."""
-        conn = self._db.get_connection()
-        cursor = conn.cursor()
-        
-        from datetime import datetime
-        
         try:
-            cursor.execute("""
-                INSERT OR REPLACE INTO admin_users 
-                (user_id, username, full_name, created_at, is_active)
-                VALUES (?, ?, ?, ?, 1)
-            """, (user_id, username, full_name, datetime.now().isoformat()))
-            
-            conn.commit()
+            await self._db.run(self._add_admin, user_id, username, full_name)
+            self._admin_ids = None
             logger.info(f"Admin user added: {user_id}")
             return True
         except Exception as e:
             logger.error(f"Error adding admin: {e}")
             return False
     
-    def remove_admin(self, user_id: int) -> bool:
+    async def remove_admin(self, user_id: int) -> bool:
         """Remove admin (set inactive)."""
-        conn = self._db.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute("""
-                UPDATE admin_users SET is_active = 0 WHERE user_id = ?
-            """, (user_id,))
-            
-            conn.commit()
+            await self._db.run(self._remove_admin, user_id)
+            self._admin_ids = None
             logger.info(f"Admin user removed: {user_id}")
             return True
         except Exception as e:
             logger.error(f"Error removing admin: {e}")
             return False
     
-    def get_all_admins(self) -> list:
+    async def get_all_admins(self) -> list:
         """Get all active admin users."""
-        conn = self._db.get_connection()
+        return await self._db.run_read(self._get_all_admins)
+    
+    async def _load_admin_ids(self) -> FrozenSet[int]:
+        """Reload the in-memory admin set."""
+        loaded_at = time.monotonic()
+        admin_ids = await self._db.run_read(self._get_admin_ids)
+        self._admin_ids = admin_ids
+        self._admin_ids_loaded_at = loaded_at
+        logger.info(f"Admin set loaded ({len(admin_ids)} admins)")
+        return admin_ids
+    
+    def _get_admin_ids(self, conn: sqlite3.Connection) -> FrozenSet[int]:
+        """Get the ids of all active admins (runs on the database executor)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        
+        cursor.execute("SELECT user_id FROM admin_users WHERE is_active = 1")
+        
+        return frozenset(user_id for user_id, in cursor.fetchall())
+    
+    def _add_admin(self, conn: sqlite3.Connection, user_id: int, username: str, full_name: str) -> None:
+        """Insert or re-activate an admin user (runs on the database executor)."""
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT OR REPLACE INTO admin_users 
+            (user_id, username, full_name, created_at, is_active)
+            VALUES (?, ?, ?, ?, 1)
+        """, (user_id, username, full_name, datetime.now().isoformat()))
+    
+    def _remove_admin(self, conn: sqlite3.Connection, user_id: int) -> None:
+        """Set an admin user inactive (runs on the database executor)."""
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            UPDATE admin_users SET is_active = 0 WHERE user_id = ?
+        """, (user_id,))
+    
+    def _get_all_admins(self, conn: sqlite3.Connection) -> list:
+        """Get all active admin users (runs on the database executor)."""
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -98,8 +109,4 @@ class AdminRepository:
             ORDER BY created_at DESC
         """)
         
-        return cursor.fetchall()
-
-
-
-
+        return cursor.fetchall()
\ No newline at end of file
@@ -0,0 +1,164 @@
+"""Booking history repository over the unified bookings read model."""
+import sqlite3
+import time
+from typing import Dict, Optional
+from infrastructure.database.booking_record import PROJECTION_RECORD_COLUMNS, BookingRecord
+from infrastructure.database.booking_tables import BOOKING_TABLES
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from shared.utils.construction_counts import count_construction
+
+
+class BookingHistoryRepository:
+    """Read-only access to bookings of every domain, newest first."""
+    
+    # Tracking codes recently searched for and not found (code -> expiry), shared by all instances
+    MISSING_CODE_TTL = 60.0
+    MISSING_CODE_CACHE_SIZE = 1024
+    _missing_codes: Dict[str, float] = {}
+    
+    # Booking table descriptors by domain, for archive fall-through
+    _tables = {table.domain: table for table in BOOKING_TABLES}
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Initialize repository with database connection."""
+        count_construction(self)
+        self._db = db or get_db_connection()
+    
+    async def find_page(
+        self,
+        domain: Optional[str],
+        limit: int,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None
+    ) -> list[BookingRecord]:
+        """
+        Find one page of bookings using keyset pagination.
+        
+        Cursors are projection row ids; the (created_at, id) position of the
+        cursor row is resolved in SQL, so every page is one index range scan
+        no matter how deep it is.
+        
+        Args:
+            domain: Booking domain (e.g. "recording"), or None for all domains
+            limit: Page size
+            after_id: Return bookings older than this row (next page)
+            before_id: Return bookings newer than this row (previous page)
+            
+        Returns:
+            List of BookingRecord (row_id is the cursor), sorted by created_at DESC
+        """
+        return await self._db.run_read(self._find_page, domain, limit, after_id, before_id)
+    
+    async def find_by_tracking_code(self, tracking_code: str) -> Optional[BookingRecord]:
+        """
+        Find a booking of any domain by tracking code, archived ones included.
+        
+        Args:
+            tracking_code: Tracking code as typed (surrounding spaces and case are ignored)
+            
+        Returns:
+            BookingRecord or None if not found
+        """
+        code = tracking_code.strip().upper()
+        now = time.monotonic()
+        
+        expires_at = self._missing_codes.get(code)
+        if expires_at is not None:
+            if expires_at > now:
+                return None
+            self._missing_codes.pop(code, None)
+        
+        booking = await self._db.run_read(self._find_by_tracking_code, code)
+        if booking is None:
+            self._remember_missing(code, now)
+        return booking
+    
+    def _find_page(
+        self,
+        conn: sqlite3.Connection,
+        domain: Optional[str],
+        limit: int,
+        after_id: Optional[int],
+        before_id: Optional[int]
+    ) -> list[BookingRecord]:
+        """Find one page of bookings (runs on a read connection)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        
+        conditions = []
+        params = []
+        if domain:
+            conditions.append("domain = ?")
+            params.append(domain)
+        
+        # Walking backwards reads the newer rows oldest-first, then flips them
+        newest_first = before_id is None
+        if after_id is not None:
+            conditions.append("(created_at, id) < (SELECT created_at, id FROM bookings WHERE id = ?)")
+            params.append(after_id)
+        elif before_id is not None:
+            conditions.append("(created_at, id) > (SELECT created_at, id FROM bookings WHERE id = ?)")
+            params.append(before_id)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        order = "created_at DESC, id DESC" if newest_first else "created_at ASC, id ASC"
+        
+        cursor.execute(f"""
+            SELECT {PROJECTION_RECORD_COLUMNS}
+            FROM bookings
+            {where}
+            ORDER BY {order}
+            LIMIT ?
+        """, (*params, limit))
+        
+        rows = [BookingRecord._make(row) for row in cursor.fetchall()]
+        if not newest_first:
+            rows.reverse()
+        return rows
+    
+    def _find_by_tracking_code(self, conn: sqlite3.Connection, code: str) -> Optional[BookingRecord]:
+        """Resolve a tracking code through the registry (runs on a read connection)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        
+        cursor.execute(f"""
+            SELECT {PROJECTION_RECORD_COLUMNS}
+            FROM bookings
+            WHERE id = (
+                SELECT b.id
+                FROM tracking_codes t
+                JOIN bookings b ON b.domain = t.domain AND b.booking_id = t.booking_id
+                WHERE t.code = ?
+            )
+        """, (code,))
+        
+        row = cursor.fetchone()
+        if row:
+            return BookingRecord._make(row)
+        
+        # Not in the hot tables: the registry still knows where an archived booking lives
+        cursor.execute("SELECT domain, booking_id FROM tracking_codes WHERE code = ?", (code,))
+        registered = cursor.fetchone()
+        if registered is None:
+            return None
+        domain, booking_id = registered
+        table = self._tables[domain]
+        cursor.execute(f"{table.archive.record_select_sql} WHERE id = ?", (booking_id,))
+        row = cursor.fetchone()
+        if row:
+            return BookingRecord._make(row)
+        return None
+    
+    @classmethod
+    def _remember_missing(cls, code: str, now: float) -> None:
+        """Cache a tracking code that was not found."""
+        if len(cls._missing_codes) >= cls.MISSING_CODE_CACHE_SIZE:
+            # Drop expired entries first; if the cache is still full, start over
+            cls._missing_codes = {
+                cached: expires_at
+                for cached, expires_at in cls._missing_codes.items()
+                if expires_at > now
+            }
+            if len(cls._missing_codes) >= cls.MISSING_CODE_CACHE_SIZE:
+                cls._missing_codes.clear()
+        cls._missing_codes[code] = now + cls.MISSING_CODE_TTL
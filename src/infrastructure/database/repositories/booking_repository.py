@@ -0,0 +1,308 @@
+"""Generic SQLite booking repository driven by a BookingTable descriptor."""
+import sqlite3
+import uuid
+from datetime import datetime
+from typing import Any, Optional
+from infrastructure.database.booking_record import BookingRecord
+from infrastructure.database.booking_tables import PENDING_STATUS, BookingTable
+from infrastructure.database.notification_outbox import NotificationBuilder, enqueue_notifications
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from infrastructure.database.tracking_codes import insert_with_unique_tracking_code, raise_if_tracking_code_conflict
+from shared.utils.construction_counts import count_construction
+
+# Keys a booking dict must carry; every other column is optional
+REQUIRED_COLUMNS = ("user_id", "user_name", "user_contact")
+
+
+class SQLiteBookingRepository:
+    """
+    Booking repository for one table, described by the `table` class attribute.
+    
+    Bookings are plain dicts keyed by column name. Repositories that work with
+    domain entities override the mapping hooks (_from_row, _to_params, _id_value
+    and the tracking-code accessors). Rows are fetched as plain tuples and
+    decoded positionally in table.columns order.
+    """
+    
+    table: BookingTable
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Initialize repository with database connection."""
+        count_construction(self)
+        self._db = db or get_db_connection()
+    
+    async def save(self, booking: Any, notify: Optional[NotificationBuilder] = None) -> Any:
+        """
+        Save or update a booking.
+        
+        A tracking code already used by another booking is replaced with a
+        fresh one, which is written back to the booking.
+        
+        Args:
+            booking: Booking to save
+            notify: Builds the notifications announcing the saved booking;
+                they are queued in the notification outbox in the same
+                transaction, so they are sent if and only if the save commits
+            
+        Returns:
+            Saved booking
+        """
+        return await self._db.run(self._save, booking, notify)
+    
+    async def save_many(self, bookings: list) -> list:
+        """
+        Save or update several bookings in one transaction.
+        
+        Unlike save, a tracking code that is already taken is not replaced;
+        the whole batch is rolled back instead.
+        
+        Args:
+            bookings: Bookings to save
+            
+        Returns:
+            Saved bookings
+            
+        Raises:
+            DuplicateTrackingCodeError: If a tracking code is already in use
+        """
+        return await self._db.run(self._save_many, bookings)
+    
+    async def find_by_id(self, booking_id: Any) -> Optional[Any]:
+        """
+        Find booking by ID, falling through to the archive.
+        
+        Args:
+            booking_id: Booking ID
+            
+        Returns:
+            Booking or None if not found
+        """
+        return await self._db.run_read(
+            self._fetch_one_or_archived,
+            self.table.find_by_id_sql,
+            self.table.archive.find_by_id_sql,
+            (self._id_value(booking_id),)
+        )
+    
+    async def find_by_user_id(self, user_id: int) -> list:
+        """
+        Find all bookings for a user, archived ones included.
+        
+        Args:
+            user_id: Telegram user ID
+            
+        Returns:
+            List of bookings, sorted by created_at DESC
+        """
+        return await self._db.run_read(
+            self._fetch_all, self.table.find_by_user_id_with_archive_sql, (user_id, user_id)
+        )
+    
+    async def find_by_status(self, status: str) -> list:
+        """
+        Find bookings by status.
+        
+        Args:
+            status: Booking status (pending, confirmed, cancelled)
+            
+        Returns:
+            List of bookings, sorted by created_at DESC
+        """
+        if status == PENDING_STATUS:
+            return await self._db.run_read(self._fetch_all, self.table.find_pending_sql, ())
+        return await self._db.run_read(self._fetch_all, self.table.find_by_status_sql, (status,))
+    
+    async def find_by_tracking_code(self, tracking_code: str) -> Optional[Any]:
+        """
+        Find booking by tracking code, falling through to the archive.
+        
+        Args:
+            tracking_code: Tracking code
+            
+        Returns:
+            Booking or None if not found
+        """
+        return await self._db.run_read(
+            self._fetch_one_or_archived,
+            self.table.find_by_tracking_code_sql,
+            self.table.archive.find_by_tracking_code_sql,
+            (tracking_code,)
+        )
+    
+    async def find_all(self) -> list:
+        """
+        Find all bookings regardless of status.
+        
+        Returns:
+            List of all bookings, sorted by created_at DESC (newest first)
+        """
+        return await self._db.run_read(self._fetch_all, self.table.find_all_sql, ())
+    
+    async def find_page(
+        self,
+        after_created_at: Optional[str],
+        after_id: Optional[str],
+        limit: int,
+        status: Optional[str] = None
+    ) -> list:
+        """
+        Find one page of bookings, newest first, using keyset pagination.
+        
+        Args:
+            after_created_at: created_at (ISO string) of the last booking on the
+                previous page, or None for the first page
+            after_id: ID of the last booking on the previous page
+            limit: Page size
+            status: Optional status filter (pending, confirmed, cancelled)
+            
+        Returns:
+            List of bookings strictly older than the cursor
+        """
+        sql = self.table.find_page_sql(after_created_at is not None, status)
+        return await self._db.run_read(
+            self._fetch_all, sql, self._page_params(after_created_at, after_id, limit, status)
+        )
+    
+    async def find_records(
+        self,
+        after_created_at: Optional[str],
+        after_id: Optional[str],
+        limit: int,
+        status: Optional[str] = None
+    ) -> list[BookingRecord]:
+        """
+        Same page as find_page, as lightweight read-only records.
+        
+        Use this for lists and scans; no entity is built or validated.
+        
+        Returns:
+            List of BookingRecord strictly older than the cursor
+        """
+        sql = self.table.find_page_sql(after_created_at is not None, status, records=True)
+        return await self._db.run_read(
+            self._fetch_records, sql, self._page_params(after_created_at, after_id, limit, status)
+        )
+    
+    def _page_params(
+        self,
+        after_created_at: Optional[str],
+        after_id: Optional[str],
+        limit: int,
+        status: Optional[str]
+    ) -> tuple:
+        """Parameters for table.find_page_sql."""
+        params = []
+        if after_created_at is not None:
+            params.extend([after_created_at, after_id or ""])
+        if status is not None and status != PENDING_STATUS:
+            params.append(status)
+        params.append(limit)
+        return tuple(params)
+    
+    def _save(self, conn: sqlite3.Connection, booking: Any, notify: Optional[NotificationBuilder] = None) -> Any:
+        """Insert or update a booking and queue its notifications (runs on the database executor)."""
+        self._prepare(booking)
+        updated_at = datetime.now().isoformat()
+        
+        # A tracking code already in use by another booking is replaced
+        self._set_tracking_code(booking, insert_with_unique_tracking_code(
+            conn.cursor(),
+            self.table.upsert_sql,
+            lambda tracking_code: self._to_params(booking, tracking_code, updated_at),
+            self._get_tracking_code(booking)
+        ))
+        if notify:
+            enqueue_notifications(conn, list(notify(booking)))
+        return booking
+    
+    def _save_many(self, conn: sqlite3.Connection, bookings: list) -> list:
+        """Insert or update several bookings with one executemany (runs on the database executor)."""
+        updated_at = datetime.now().isoformat()
+        for booking in bookings:
+            self._prepare(booking)
+        try:
+            conn.executemany(self.table.upsert_sql, [
+                self._to_params(booking, self._get_tracking_code(booking), updated_at)
+                for booking in bookings
+            ])
+        except sqlite3.IntegrityError as e:
+            raise_if_tracking_code_conflict(e)
+            raise
+        return bookings
+    
+    def _fetch_all(self, conn: sqlite3.Connection, sql: str, params: tuple) -> list:
+        """Run a finder and decode every row (runs on the database executor)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None  # Plain tuples; decoded positionally by _from_row
+        cursor.execute(sql, params)
+        return [self._from_row(row) for row in cursor.fetchall()]
+    
+    def _fetch_one(self, conn: sqlite3.Connection, sql: str, params: tuple) -> Optional[Any]:
+        """Run a finder and decode the first row (runs on the database executor)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+        if row:
+            return self._from_row(row)
+        return None
+    
+    def _fetch_one_or_archived(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        archived_sql: str,
+        params: tuple
+    ) -> Optional[Any]:
+        """Run a finder on the hot table, then on the archive if nothing matched (runs on the database executor)."""
+        booking = self._fetch_one(conn, sql, params)
+        if booking is None:
+            booking = self._fetch_one(conn, archived_sql, params)
+        return booking
+    
+    def _fetch_records(self, conn: sqlite3.Connection, sql: str, params: tuple) -> list[BookingRecord]:
+        """Run a record query (runs on the database executor)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params)
+        return [BookingRecord._make(row) for row in cursor.fetchall()]
+    
+    # Mapping hooks (dict bookings)
+    
+    def _prepare(self, booking: dict) -> None:
+        """Assign an ID to a new booking."""
+        if 'id' not in booking:
+            booking['id'] = str(uuid.uuid4())
+    
+    def _from_row(self, row: tuple) -> dict:
+        """Convert a selected row to a booking."""
+        return dict(zip(self.table.columns, row))
+    
+    def _to_params(self, booking: dict, tracking_code: Optional[str], updated_at: str) -> tuple:
+        """Parameters for table.upsert_sql, in column order followed by updated_at."""
+        params = []
+        for column in self.table.columns:
+            if column == 'tracking_code':
+                params.append(tracking_code)
+            elif column in REQUIRED_COLUMNS or column == 'id':
+                params.append(booking[column])
+            elif column == 'created_at':
+                params.append(booking.get('created_at', updated_at))
+            elif column == 'status':
+                params.append(booking.get('status', 'pending'))
+            else:
+                params.append(booking.get(column))
+        params.append(updated_at)
+        return tuple(params)
+    
+    def _id_value(self, booking_id: Any) -> str:
+        """Primary key value of a booking ID argument."""
+        return booking_id
+    
+    def _get_tracking_code(self, booking: dict) -> Optional[str]:
+        """Tracking code of a booking."""
+        return booking.get('tracking_code')
+    
+    def _set_tracking_code(self, booking: dict, tracking_code: Optional[str]) -> None:
+        """Store the tracking code actually saved back on the booking."""
+        booking['tracking_code'] = tracking_code
@@ -0,0 +1,76 @@
+"""Booking statistics repository over the trigger-maintained counters."""
+import sqlite3
+from datetime import date
+from typing import Dict, Optional
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from shared.utils.construction_counts import count_construction
+
+
+class BookingStatsRepository:
+    """Read-only booking counts; every query reads a few counter rows, never the bookings."""
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Initialize repository with database connection."""
+        count_construction(self)
+        self._db = db or get_db_connection()
+    
+    async def get_status_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count bookings per domain and status.
+        
+        Returns:
+            Mapping of domain -> status -> count (zero counts omitted)
+        """
+        return await self._db.run_read(self._get_status_counts)
+    
+    async def get_daily_counts(self, day: Optional[date] = None) -> Dict[str, int]:
+        """
+        Count bookings created on a day, per domain.
+        
+        Args:
+            day: Calendar day, defaults to today
+            
+        Returns:
+            Mapping of domain -> count (zero counts omitted)
+        """
+        day = day or date.today()
+        return await self._db.run_read(self._get_daily_counts, day.isoformat())
+    
+    async def count(self, domain: Optional[str] = None, status: Optional[str] = None) -> int:
+        """Count bookings, optionally of one domain and/or status."""
+        return await self._db.run_read(self._count, domain, status)
+    
+    def _get_status_counts(self, conn: sqlite3.Connection) -> Dict[str, Dict[str, int]]:
+        """Read the status counters (runs on a read connection)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute("SELECT domain, status, count FROM booking_status_counts WHERE count > 0")
+        
+        counts: Dict[str, Dict[str, int]] = {}
+        for domain, status, count in cursor.fetchall():
+            counts.setdefault(domain, {})[status] = count
+        return counts
+    
+    def _get_daily_counts(self, conn: sqlite3.Connection, day: str) -> Dict[str, int]:
+        """Read one day's counters (runs on a read connection)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute("SELECT domain, count FROM booking_daily_counts WHERE day = ? AND count > 0", (day,))
+        return dict(cursor.fetchall())
+    
+    def _count(self, conn: sqlite3.Connection, domain: Optional[str], status: Optional[str]) -> int:
+        """Sum the matching status counters (runs on a read connection)."""
+        cursor = conn.cursor()
+        
+        conditions = []
+        params = []
+        if domain:
+            conditions.append("domain = ?")
+            params.append(domain)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        cursor.execute(f"SELECT COALESCE(SUM(count), 0) FROM booking_status_counts {where}", params)
+        return cursor.fetchone()[0]
@@ -0,0 +1,68 @@
+"""Channel member repository for membership learned from chat_member updates."""
+import sqlite3
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from shared.utils.construction_counts import count_construction
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelMemberRepository:
+    """Repository for the persistent user -> channel membership map."""
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Initialize repository with database connection."""
+        count_construction(self)
+        self._db = db or get_db_connection()
+    
+    async def save(self, chat_id: int, user_id: int, status: str, is_member: bool) -> None:
+        """Record a user's latest membership status in a channel."""
+        await self._db.run(self._save, chat_id, user_id, status, is_member)
+    
+    async def find_memberships(self, chat_id: int, updated_since: datetime) -> Dict[int, Tuple[bool, float]]:
+        """
+        Get the last known membership of every user seen in a channel since a point in time.
+        
+        Args:
+            chat_id: Channel chat id
+            updated_since: Oldest membership update to return
+            
+        Returns:
+            User id -> (whether the user is a member, when that was recorded as a Unix timestamp)
+        """
+        return await self._db.run_read(self._find_memberships, chat_id, updated_since)
+    
+    def _save(self, conn: sqlite3.Connection, chat_id: int, user_id: int, status: str, is_member: bool) -> None:
+        """Upsert one membership (runs on the database executor)."""
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT INTO channel_members (chat_id, user_id, status, is_member, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (chat_id, user_id) DO UPDATE SET
+                status = excluded.status,
+                is_member = excluded.is_member,
+                updated_at = excluded.updated_at
+        """, (chat_id, user_id, status, int(is_member), datetime.now().isoformat()))
+    
+    def _find_memberships(
+        self,
+        conn: sqlite3.Connection,
+        chat_id: int,
+        updated_since: datetime
+    ) -> Dict[int, Tuple[bool, float]]:
+        """Get a channel's recent memberships (runs on the database executor)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        
+        cursor.execute(
+            "SELECT user_id, is_member, updated_at FROM channel_members WHERE chat_id = ? AND updated_at >= ?",
+            (chat_id, updated_since.isoformat())
+        )
+        
+        return {
+            user_id: (bool(is_member), datetime.fromisoformat(updated_at).timestamp())
+            for user_id, is_member, updated_at in cursor.fetchall()
+        }
@@ -0,0 +1,105 @@
+"""Notification outbox repository used by the notification dispatcher."""
+import sqlite3
+from datetime import datetime
+from typing import List, Optional, Sequence
+from infrastructure.database.notification_outbox import (
+    OUTBOX_FAILED,
+    OUTBOX_PENDING,
+    Notification,
+    OutboxEntry,
+    enqueue_notifications,
+)
+from infrastructure.database.sqlite_connection import SQLiteConnection, get_db_connection
+from shared.utils.construction_counts import count_construction
+
+
+class NotificationOutboxRepository:
+    """Repository for queued Telegram notifications."""
+    
+    def __init__(self, db: Optional[SQLiteConnection] = None):
+        """Initialize repository with database connection."""
+        count_construction(self)
+        self._db = db or get_db_connection()
+    
+    async def enqueue(self, notifications: Sequence[Notification]) -> int:
+        """Queue notifications on their own (not tied to another change)."""
+        return await self._db.run(enqueue_notifications, notifications)
+    
+    async def find_due(self, limit: int) -> List[OutboxEntry]:
+        """
+        Get pending notifications whose next attempt is due, oldest first.
+        
+        Args:
+            limit: Maximum number of notifications
+            
+        Returns:
+            List of OutboxEntry
+        """
+        return await self._db.run_read(self._find_due, datetime.now().isoformat(), limit)
+    
+    async def mark_sent(self, entry_id: int) -> None:
+        """Remove a delivered notification."""
+        await self._db.run(self._execute, "DELETE FROM notification_outbox WHERE id = ?", (entry_id,))
+    
+    async def schedule_retry(
+        self,
+        entry_id: int,
+        attempts: int,
+        next_attempt_at: datetime,
+        error: str,
+        chat_id: Optional[str] = None
+    ) -> None:
+        """
+        Put a notification back in the queue for a later attempt.
+        
+        Args:
+            entry_id: Outbox row ID
+            attempts: Attempts made so far
+            next_attempt_at: Earliest time of the next attempt
+            error: Why the last attempt failed
+            chat_id: New destination, if the chat moved (e.g. a group upgraded to a supergroup)
+        """
+        await self._db.run(
+            self._execute,
+            "UPDATE notification_outbox SET attempts = ?, next_attempt_at = ?, last_error = ?, "
+            "chat_id = COALESCE(?, chat_id) WHERE id = ?",
+            (attempts, next_attempt_at.isoformat(), error, chat_id, entry_id)
+        )
+    
+    async def mark_failed(self, entry_id: int, attempts: int, error: str) -> None:
+        """Stop retrying a notification; the row is kept for inspection."""
+        await self._db.run(
+            self._execute,
+            "UPDATE notification_outbox SET status = ?, attempts = ?, last_error = ? WHERE id = ?",
+            (OUTBOX_FAILED, attempts, error, entry_id)
+        )
+    
+    async def count_pending(self) -> int:
+        """Number of notifications waiting to be delivered."""
+        return await self._db.run_read(self._count_pending)
+    
+    def _find_due(self, conn: sqlite3.Connection, now: str, limit: int) -> List[OutboxEntry]:
+        """Get due notifications (runs on the database executor)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        
+        cursor.execute("""
+            SELECT id, chat_id, text, parse_mode, attempts
+            FROM notification_outbox
+            WHERE status = 'pending' AND next_attempt_at <= ?
+            ORDER BY next_attempt_at, id
+            LIMIT ?
+        """, (now, limit))
+        
+        return [OutboxEntry._make(row) for row in cursor.fetchall()]
+    
+    def _count_pending(self, conn: sqlite3.Connection) -> int:
+        """Count pending notifications (runs on the database executor)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute("SELECT COUNT(*) FROM notification_outbox WHERE status = ?", (OUTBOX_PENDING,))
+        return cursor.fetchone()[0]
+    
+    def _execute(self, conn: sqlite3.Connection, sql: str, params: tuple) -> None:
+        """Run one statement (runs on the database executor)."""
+        conn.execute(sql, params)
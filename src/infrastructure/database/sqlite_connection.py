@@ -1,13 +1,29 @@
 """SQLite database connection and setup."""
+import asyncio
+import functools
+import queue
 import sqlite3
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+from urllib.parse import quote
 from config import Settings
+from infrastructure.database.booking_archive import create_archive_tables
+from infrastructure.database.booking_tables import ARCHIVE_SCHEMA
+from infrastructure.database.migrations import migrate
+from infrastructure.database.pragmas import PragmaProfile, apply_pragma_profile, get_pragma_profile
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+# Pragma profile applied to the read-only pool connections
+READ_POOL_PRAGMA_PROFILE = "readonly-report"
+
 
 class SQLiteConnection:
     """SQLite database connection manager."""
@@ -15,12 +31,29 @@ class SQLiteConnection:
     _instance: Optional['SQLiteConnection'] = None
     _connection: Optional[sqlite3.Connection] = None
     
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        pragma_profile: Optional[str] = None,
+        read_pool_size: Optional[int] = None,
+        group_commit_window_ms: Optional[float] = None,
+        archive_path: Optional[str] = None
+    ):
         """
         Initialize SQLite connection.
         
         Args:
             db_path: Path to database file. If None, uses default location.
+            pragma_profile: Name of the pragma profile to apply. If None, uses
+                Settings.DB_PRAGMA_PROFILE.
+            read_pool_size: Number of read-only connections. If None, uses
+                Settings.DB_READ_POOL_SIZE. 0 sends reads to the writer.
+            group_commit_window_ms: How long writes wait to share a commit. If
+                None, uses Settings.DB_GROUP_COMMIT_WINDOW_MS. 0 commits each
+                write on its own.
+            archive_path: Path to the archive database attached as "archive".
+                If None, uses Settings.DB_ARCHIVE_PATH, or <db>_archive.db next
+                to the database file when that is empty.
         """
         if db_path:
             self.db_path = db_path
@@ -31,8 +64,50 @@ class SQLiteConnection:
             data_dir.mkdir(exist_ok=True)
             self.db_path = str(data_dir / "dopium.db")
         
+        if self.db_path == ":memory:":
+            self.archive_path = ":memory:"
+        else:
+            db_file = Path(self.db_path)
+            self.archive_path = (
+                archive_path
+                or Settings.DB_ARCHIVE_PATH
+                or str(db_file.with_name(f"{db_file.stem}_archive{db_file.suffix}"))
+            )
+        
+        self.pragma_profile: PragmaProfile = get_pragma_profile(
+            pragma_profile or Settings.DB_PRAGMA_PROFILE
+        )
         self._connection = None
-        logger.info(f"SQLite database will be at: {self.db_path}")
+        # Whether connecting created the archive file, which then has no tables yet
+        self._archive_created = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        if read_pool_size is None:
+            read_pool_size = Settings.DB_READ_POOL_SIZE
+        # An in-memory database is private to its connection, so it cannot be shared
+        self.read_pool_size = 0 if self.db_path == ":memory:" else max(0, read_pool_size)
+        self._readers: "queue.Queue[tuple[int, sqlite3.Connection]]" = queue.Queue()
+        self._reader_connections: List[sqlite3.Connection] = []
+        self._read_executor: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._writer_uses = 0
+        self._reader_uses: List[int] = []
+        self._reader_checkouts = 0
+        self._reader_wait_total = 0.0
+        self._reader_wait_max = 0.0
+        self._readers_in_use = 0
+        
+        if group_commit_window_ms is None:
+            group_commit_window_ms = Settings.DB_GROUP_COMMIT_WINDOW_MS
+        self.group_commit_window = max(0.0, group_commit_window_ms) / 1000
+        self._pending_units: List[tuple] = []
+        self._group_commits = 0
+        self._group_commit_units = 0
+        self._group_commit_max_batch = 0
+        self._writes = 0
+        self._write_latency_total = 0.0
+        self._write_latency_max = 0.0
+        logger.info(f"SQLite database will be at: {self.db_path} (archive: {self.archive_path})")
     
     def get_connection(self) -> sqlite3.Connection:
         """Get or create database connection."""
@@ -42,192 +117,269 @@ class SQLiteConnection:
                 check_same_thread=False  # Allow connection to be used across threads
             )
             self._connection.row_factory = sqlite3.Row  # Return rows as dict-like objects
+            # Attached before the pragmas so the archive gets the same journal mode
+            self._archive_created = (
+                self.archive_path == ":memory:"
+                or not Path(self.archive_path).exists()
+                or Path(self.archive_path).stat().st_size == 0
+            )
+            self._connection.execute(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (self.archive_path,))
+            apply_pragma_profile(self._connection, self.pragma_profile)
             logger.info(f"Connected to SQLite database: {self.db_path}")
         return self._connection
     
-    def close(self) -> None:
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
-            logger.info("SQLite connection closed")
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the dedicated writer executor."""
+        if self._executor is None:
+            # A single worker serializes all access to the writer connection
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite")
+        return self._executor
     
-    def initialize_schema(self) -> None:
-        """Initialize database schema (create tables)."""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Create bookings table for recording domain
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS recording_bookings (
-                id TEXT PRIMARY KEY,
-                user_id INTEGER NOT NULL,
-                user_name TEXT NOT NULL,
-                user_contact TEXT NOT NULL,
-                service_tier_id TEXT,
-                service_option_id TEXT,
-                tracking_code TEXT,
-                created_at TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'pending',
-                updated_at TEXT
-            )
-        """)
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a unit of work on the database executor, off the event loop.
         
-        # Add tracking_code column if it doesn't exist (for existing databases)
+        Args:
+            fn: Callable invoked as fn(connection, *args)
+            *args: Extra arguments passed to fn
+            
+        Returns:
+            Whatever fn returns. The transaction is committed when fn returns
+            and rolled back when it raises; either way this only returns once
+            the outcome is durable. With group commit enabled, units arriving
+            within the window share one transaction (see _run_group).
+        """
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
         try:
-            cursor.execute("ALTER TABLE recording_bookings ADD COLUMN tracking_code TEXT")
-            conn.commit()
-        except sqlite3.OperationalError:
-            # Column already exists
-            pass
-        
-        # Create bookings table for music production domain
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS music_production_bookings (
-                id TEXT PRIMARY KEY,
-                user_id INTEGER NOT NULL,
-                user_name TEXT NOT NULL,
-                user_contact TEXT NOT NULL,
-                service_tier_id TEXT NOT NULL,
-                service_option_id TEXT NOT NULL,
-                tracking_code TEXT,
-                created_at TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'pending',
-                updated_at TEXT
+            if self.group_commit_window:
+                future = loop.create_future()
+                self._pending_units.append((fn, args, future))
+                if len(self._pending_units) == 1:
+                    # First unit of a new group: flush whatever has arrived once the window closes
+                    loop.call_later(self.group_commit_window, self._flush_group)
+                return await future
+            
+            return await loop.run_in_executor(
+                self._get_executor(),
+                functools.partial(self._run_unit, fn, *args)
             )
-        """)
-        
-        # Add tracking_code column if it doesn't exist (for existing databases)
-        try:
-            cursor.execute("ALTER TABLE music_production_bookings ADD COLUMN tracking_code TEXT")
-            conn.commit()
-        except sqlite3.OperationalError:
-            # Column already exists
-            pass
-        
-        # Create indexes for better query performance
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_recording_bookings_user_id 
-            ON recording_bookings(user_id)
-        """)
-        
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_recording_bookings_status 
-            ON recording_bookings(status)
-        """)
+        finally:
+            # Latency as seen by the caller: queueing, execution and commit
+            elapsed = time.perf_counter() - started
+            with self._pool_lock:
+                self._writes += 1
+                self._write_latency_total += elapsed
+                self._write_latency_max = max(self._write_latency_max, elapsed)
+    
+    def _flush_group(self) -> None:
+        """Hand the pending units to the writer executor as one group (event loop side)."""
+        units, self._pending_units = self._pending_units, []
+        if not units:
+            return
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_music_production_bookings_user_id 
-            ON music_production_bookings(user_id)
-        """)
+        loop = asyncio.get_running_loop()
+        group = loop.run_in_executor(
+            self._get_executor(),
+            functools.partial(self._run_group, [(fn, args) for fn, args, _ in units])
+        )
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_music_production_bookings_status 
-            ON music_production_bookings(status)
-        """)
+        def resolve(done: "asyncio.Future[list]") -> None:
+            try:
+                outcomes = done.result()
+            except Exception as e:
+                # The shared commit failed, so none of the units are durable
+                outcomes = [(False, e)] * len(units)
+            for (_, _, future), (ok, value) in zip(units, outcomes):
+                if future.cancelled():
+                    continue
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(value)
         
-        # Create bookings table for mix_master domain
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS mix_master_bookings (
-                id TEXT PRIMARY KEY,
-                user_id INTEGER NOT NULL,
-                user_name TEXT NOT NULL,
-                user_contact TEXT NOT NULL,
-                plan_id TEXT,
-                plan_name TEXT,
-                plan_price TEXT,
-                tracking_code TEXT,
-                created_at TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'pending',
-                updated_at TEXT
-            )
-        """)
+        group.add_done_callback(resolve)
+    
+    def _run_group(self, units: List[tuple]) -> List[tuple]:
+        """
+        Execute several units in one transaction on the writer thread.
         
-        # Create bookings table for consultation domain
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS consultation_bookings (
-                id TEXT PRIMARY KEY,
-                user_id INTEGER NOT NULL,
-                user_name TEXT NOT NULL,
-                user_contact TEXT NOT NULL,
-                consultant_id TEXT,
-                consultant_name TEXT,
-                tracking_code TEXT,
-                created_at TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'pending',
-                updated_at TEXT
-            )
-        """)
+        Each unit runs inside its own savepoint, so a unit that raises is rolled
+        back on its own without affecting the others.
         
-        # Create bookings table for distribution domain
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS distribution_bookings (
-                id TEXT PRIMARY KEY,
-                user_id INTEGER NOT NULL,
-                user_name TEXT NOT NULL,
-                user_contact TEXT NOT NULL,
-                pricing_id TEXT,
-                pricing_name TEXT,
-                pricing_price TEXT,
-                platforms TEXT,
-                release_date TEXT,
-                tracking_code TEXT,
-                created_at TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'pending',
-                updated_at TEXT
-            )
-        """)
+        Returns:
+            (True, result) or (False, exception) per unit, in order
+        """
+        conn = self.get_connection()
+        with self._pool_lock:
+            self._writer_uses += len(units)
+            self._group_commits += 1
+            self._group_commit_units += len(units)
+            self._group_commit_max_batch = max(self._group_commit_max_batch, len(units))
         
-        # Add pricing columns if they don't exist (for existing databases)
+        outcomes = []
+        conn.execute("BEGIN")
         try:
-            cursor.execute("ALTER TABLE distribution_bookings ADD COLUMN pricing_id TEXT")
+            for fn, args in units:
+                conn.execute("SAVEPOINT unit")
+                try:
+                    outcomes.append((True, fn(conn, *args)))
+                except Exception as e:
+                    conn.execute("ROLLBACK TO unit")
+                    outcomes.append((False, e))
+                conn.execute("RELEASE unit")
             conn.commit()
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute("ALTER TABLE distribution_bookings ADD COLUMN pricing_name TEXT")
-            conn.commit()
-        except sqlite3.OperationalError:
-            pass
+        except Exception:
+            conn.rollback()
+            raise
+        return outcomes
+    
+    def _run_unit(self, fn: Callable[..., T], *args: Any) -> T:
+        """Execute fn inside a transaction on the current (executor) thread."""
+        conn = self.get_connection()
+        with self._pool_lock:
+            self._writer_uses += 1
         try:
-            cursor.execute("ALTER TABLE distribution_bookings ADD COLUMN pricing_price TEXT")
+            result = fn(conn, *args)
             conn.commit()
-        except sqlite3.OperationalError:
-            pass
-        
-        # Create indexes
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_mix_master_bookings_user_id 
-            ON mix_master_bookings(user_id)
-        """)
+        except Exception:
+            conn.rollback()
+            raise
+        return result
+    
+    async def run_read(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a read-only unit of work on a pooled read connection.
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_mix_master_bookings_status 
-            ON mix_master_bookings(status)
-        """)
+        Reads run in parallel with each other and with the writer. When the
+        pool is disabled they fall back to the writer executor.
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_consultation_bookings_user_id 
-            ON consultation_bookings(user_id)
-        """)
+        Args:
+            fn: Callable invoked as fn(connection, *args); must not write
+            *args: Extra arguments passed to fn
+            
+        Returns:
+            Whatever fn returns
+        """
+        if not self.read_pool_size:
+            return await self.run(fn, *args)
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_consultation_bookings_status 
-            ON consultation_bookings(status)
-        """)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_read_executor(),
+            functools.partial(self._run_read_unit, time.perf_counter(), fn, *args)
+        )
+    
+    def _get_read_executor(self) -> ThreadPoolExecutor:
+        """Get or create the read pool executor."""
+        if self._read_executor is None:
+            # The writer creates the database file (and its WAL) that readers open
+            self.get_connection()
+            self._read_executor = ThreadPoolExecutor(
+                max_workers=self.read_pool_size,
+                thread_name_prefix="sqlite-read"
+            )
+        return self._read_executor
+    
+    def _run_read_unit(self, submitted_at: float, fn: Callable[..., T], *args: Any) -> T:
+        """Check out a read connection, run fn and return the connection."""
+        index, conn = self._checkout_reader()
+        waited = time.perf_counter() - submitted_at
+        with self._pool_lock:
+            self._reader_checkouts += 1
+            self._reader_uses[index] += 1
+            self._reader_wait_total += waited
+            self._reader_wait_max = max(self._reader_wait_max, waited)
+            self._readers_in_use += 1
+        try:
+            return fn(conn, *args)
+        finally:
+            with self._pool_lock:
+                self._readers_in_use -= 1
+            self._readers.put((index, conn))
+    
+    def _checkout_reader(self) -> "tuple[int, sqlite3.Connection]":
+        """Take an idle read connection, opening a new one while below the pool size."""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_distribution_bookings_user_id 
-            ON distribution_bookings(user_id)
-        """)
+        with self._pool_lock:
+            if len(self._reader_connections) < self.read_pool_size:
+                conn = sqlite3.connect(
+                    f"file:{quote(self.db_path)}?mode=ro",
+                    uri=True,
+                    check_same_thread=False  # Pool connections move between reader threads
+                )
+                conn.row_factory = sqlite3.Row
+                conn.execute(
+                    f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}",
+                    (f"file:{quote(self.archive_path)}?mode=ro",)
+                )
+                apply_pragma_profile(conn, get_pragma_profile(READ_POOL_PRAGMA_PROFILE))
+                self._reader_connections.append(conn)
+                self._reader_uses.append(0)
+                return len(self._reader_connections) - 1, conn
         
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_distribution_bookings_status 
-            ON distribution_bookings(status)
-        """)
+        return self._readers.get()
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """
+        Get connection pool metrics.
         
-        conn.commit()
-        logger.info("Database schema initialized")
+        Returns:
+            Pool size, open/in-use read connections, checkout count and wait
+            times (ms), per-connection usage counts, group commit batch sizes
+            and write latency (ms, from run() call to durable commit)
+        """
+        with self._pool_lock:
+            checkouts = self._reader_checkouts
+            return {
+                'read_pool_size': self.read_pool_size,
+                'readers_open': len(self._reader_connections),
+                'readers_in_use': self._readers_in_use,
+                'reader_checkouts': checkouts,
+                'reader_wait_avg_ms': (self._reader_wait_total / checkouts * 1000) if checkouts else 0.0,
+                'reader_wait_max_ms': self._reader_wait_max * 1000,
+                'reader_uses': list(self._reader_uses),
+                'writer_uses': self._writer_uses,
+                'group_commits': self._group_commits,
+                'group_commit_avg_batch': (self._group_commit_units / self._group_commits) if self._group_commits else 0.0,
+                'group_commit_max_batch': self._group_commit_max_batch,
+                'writes': self._writes,
+                'write_latency_total_ms': self._write_latency_total * 1000,
+                'write_latency_avg_ms': (self._write_latency_total / self._writes * 1000) if self._writes else 0.0,
+                'write_latency_max_ms': self._write_latency_max * 1000,
+            }
+    
+    def close(self) -> None:
+        """Close database connection."""
+        if self._read_executor:
+            self._read_executor.shutdown(wait=True)
+            self._read_executor = None
+            logger.info(f"SQLite pool metrics: {self.get_pool_metrics()}")
+        while self._reader_connections:
+            self._reader_connections.pop().close()
+        self._reader_uses = []
+        self._readers = queue.Queue()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+            logger.info("SQLite connection closed")
+    
+    def initialize_schema(self) -> None:
+        """Bring the database schema up to date by applying pending migrations."""
+        applied = migrate(self.get_connection())
+        # The archive mirrors the booking tables; only a migration or a new archive file can change them,
+        # so a current schema still costs a single version read
+        if applied or self._archive_created:
+            create_archive_tables(self.get_connection())
+            self._archive_created = False
+        logger.info(f"Database schema initialized ({len(applied)} migrations applied)")
     
     def execute_query(self, query: str, params: tuple = ()) -> list:
         """Execute a SELECT query and return results."""
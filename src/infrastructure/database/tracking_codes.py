@@ -0,0 +1,151 @@
+"""Global tracking-code registry shared by every booking table."""
+import sqlite3
+import logging
+from typing import Callable, Optional
+from infrastructure.database.booking_projection import PROJECTED_TABLES
+from shared.utils.tracking_code import generate_tracking_code
+
+logger = logging.getLogger(__name__)
+
+# Fresh codes drawn before giving up on a booking insert
+TRACKING_CODE_ATTEMPTS = 5
+
+
+class DuplicateTrackingCodeError(ValueError):
+    """Raised when no unused tracking code could be found for a booking."""
+
+
+def create_tracking_code_registry(cursor: sqlite3.Cursor) -> None:
+    """
+    Create the tracking_codes registry and the triggers that fill it.
+    
+    Every booking insert registers its code in the same transaction; a code
+    that is already taken aborts the insert with an IntegrityError. The
+    registry is backfilled from the domain tables the first time it is created.
+    """
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tracking_codes'")
+    exists = cursor.fetchone() is not None
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS tracking_codes (
+            code TEXT PRIMARY KEY,
+            domain TEXT NOT NULL,
+            booking_id TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        ) WITHOUT ROWID
+    """)
+    
+    for domain, (table, _, _) in PROJECTED_TABLES.items():
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_tracking_code
+            AFTER INSERT ON {table}
+            WHEN NEW.tracking_code IS NOT NULL
+            BEGIN
+                INSERT INTO tracking_codes (code, domain, booking_id, created_at)
+                VALUES (NEW.tracking_code, '{domain}', NEW.id, NEW.created_at);
+            END
+        """)
+    
+    if not exists:
+        # Oldest booking keeps a code that was (before the registry) handed out twice
+        cursor.execute(
+            "INSERT OR IGNORE INTO tracking_codes (code, domain, booking_id, created_at) "
+            + " UNION ALL ".join(
+                f"SELECT tracking_code, '{domain}', id, created_at FROM {table} "
+                f"WHERE tracking_code IS NOT NULL"
+                for domain, (table, _, _) in PROJECTED_TABLES.items()
+            )
+            + " ORDER BY 4"
+        )
+        logger.info(f"Tracking code registry backfilled with {cursor.rowcount} codes")
+
+
+def create_tracking_code_update_triggers(cursor: sqlite3.Cursor) -> None:
+    """
+    Keep the registry in step with saves that change a booking's tracking code.
+    
+    The booking upserts also set tracking_code, so a changed code moves its
+    registry row in the same statement; a code that is already taken aborts
+    the save with an IntegrityError, as on insert. Registry rows left stale by
+    earlier code changes are repaired once.
+    """
+    for domain, (table, _, _) in PROJECTED_TABLES.items():
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_tracking_code_update
+            AFTER UPDATE OF tracking_code ON {table}
+            WHEN NEW.tracking_code IS NOT OLD.tracking_code
+            BEGIN
+                DELETE FROM tracking_codes
+                WHERE code = OLD.tracking_code AND domain = '{domain}' AND booking_id = OLD.id;
+                INSERT INTO tracking_codes (code, domain, booking_id, created_at)
+                SELECT NEW.tracking_code, '{domain}', NEW.id, NEW.created_at
+                WHERE NEW.tracking_code IS NOT NULL;
+            END
+        """)
+        
+        cursor.execute(f"""
+            DELETE FROM tracking_codes
+            WHERE domain = '{domain}' AND EXISTS (
+                SELECT 1 FROM {table} b
+                WHERE b.id = tracking_codes.booking_id AND b.tracking_code IS NOT tracking_codes.code
+            )
+        """)
+        repaired = cursor.rowcount
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO tracking_codes (code, domain, booking_id, created_at)
+            SELECT tracking_code, '{domain}', id, created_at FROM {table} WHERE tracking_code IS NOT NULL
+        """)
+        if repaired or cursor.rowcount:
+            logger.info(f"Tracking code registry repaired for {table}: {repaired} stale, {cursor.rowcount} added")
+
+
+def is_tracking_code_conflict(error: sqlite3.IntegrityError) -> bool:
+    """Whether an IntegrityError comes from the tracking_codes unique key."""
+    return "tracking_codes.code" in str(error)
+
+
+def raise_if_tracking_code_conflict(error: sqlite3.IntegrityError) -> None:
+    """
+    Translate a tracking-code collision into DuplicateTrackingCodeError.
+    
+    Raises:
+        DuplicateTrackingCodeError: If error is a tracking-code collision
+    """
+    if is_tracking_code_conflict(error):
+        raise DuplicateTrackingCodeError(str(error)) from error
+
+
+def insert_with_unique_tracking_code(
+    cursor: sqlite3.Cursor,
+    sql: str,
+    build_params: Callable[[Optional[str]], tuple],
+    tracking_code: Optional[str]
+) -> Optional[str]:
+    """
+    Run a booking INSERT, drawing a new tracking code while the current one is taken.
+    
+    Args:
+        cursor: Cursor of the saving transaction
+        sql: INSERT statement for the booking table
+        build_params: Builds the statement parameters for a given tracking code
+        tracking_code: Code generated by the caller
+        
+    Returns:
+        The tracking code actually stored
+        
+    Raises:
+        DuplicateTrackingCodeError: If every attempted code was already taken
+    """
+    for attempt in range(TRACKING_CODE_ATTEMPTS):
+        try:
+            cursor.execute(sql, build_params(tracking_code))
+            return tracking_code
+        except sqlite3.IntegrityError as e:
+            if not is_tracking_code_conflict(e):
+                raise
+            logger.warning(f"Tracking code {tracking_code} already in use (attempt {attempt + 1})")
+            tracking_code = generate_tracking_code(len(tracking_code))
+    
+    raise DuplicateTrackingCodeError(
+        f"No unused tracking code found after {TRACKING_CODE_ATTEMPTS} attempts"
+    )
@@ -1,5 +1,5 @@
 """Flow manager - Routes to domain handlers."""
-from typing import Dict, Optional, Callable
+from typing import Any, Dict, Optional, Callable
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 import sys
@@ -10,6 +10,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
 from shared.services.channel_validator import ChannelMembershipValidator
 
+# Reply keyboards a chat can be showing, tracked in chat_data under SHOWN_REPLY_KEYBOARD_KEY
+REPLY_KEYBOARD_MAIN = "main"
+REPLY_KEYBOARD_CANCEL = "cancel"
+SHOWN_REPLY_KEYBOARD_KEY = "shown_reply_keyboard"
+
+# Bot API calls made for the user's current flow, kept in user_data
+FLOW_API_CALLS_KEY = "flow_api_calls"
+
+CANCEL_PROMPT = "برای لغو عملیات، دکمه 'لغو' را فشار دهید:"
+
 
 class FlowManager:
     """Manages flows and routes to domain handlers."""
@@ -28,6 +38,11 @@ class FlowManager:
     _create_reply_keyboard_fn: Optional[Callable] = None
     _create_cancel_keyboard_fn: Optional[Callable] = None
     
+    # Metrics
+    _completed_bookings: int = 0
+    _completed_booking_api_calls: int = 0
+    _reply_keyboard_sends_saved: int = 0
+    
     @classmethod
     def register_handler(cls, state: str, handler):
         """Register a handler for a flow state."""
@@ -53,6 +68,75 @@ class FlowManager:
         """Get flow state by button text."""
         return cls.BUTTON_TO_STATE.get(button_text)
     
+    @staticmethod
+    def set_shown_reply_keyboard(context: ContextTypes.DEFAULT_TYPE, keyboard: Optional[str]) -> None:
+        """
+        Record which reply keyboard the chat is showing.
+        
+        Call this after sending a reply keyboard outside FlowManager (None if it
+        is unknown), so flow steps know whether the cancel keyboard must be sent again.
+        """
+        if context.chat_data is None:
+            return
+        if keyboard is None:
+            context.chat_data.pop(SHOWN_REPLY_KEYBOARD_KEY, None)
+        else:
+            context.chat_data[SHOWN_REPLY_KEYBOARD_KEY] = keyboard
+    
+    @classmethod
+    def get_metrics(cls) -> Dict[str, Any]:
+        """
+        Get flow messaging metrics.
+        
+        Returns:
+            Dictionary with completed bookings, the Bot API calls their flows made
+            (messages, edits and callback answers), calls per completed booking
+            and cancel-keyboard messages skipped because the chat already showed it
+        """
+        return {
+            'completed_bookings': cls._completed_bookings,
+            'api_calls': cls._completed_booking_api_calls,
+            'api_calls_per_booking': (
+                cls._completed_booking_api_calls / cls._completed_bookings if cls._completed_bookings else 0.0
+            ),
+            'reply_keyboard_sends_saved': cls._reply_keyboard_sends_saved,
+        }
+    
+    @staticmethod
+    def _count_api_calls(context: ContextTypes.DEFAULT_TYPE, calls: int) -> None:
+        """Add Bot API calls to the user's current flow."""
+        context.user_data[FLOW_API_CALLS_KEY] = context.user_data.get(FLOW_API_CALLS_KEY, 0) + calls
+    
+    @classmethod
+    async def _send_step(
+        cls,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        message: str,
+        inline_keyboard: Optional[InlineKeyboardMarkup],
+        cancel_keyboard
+    ) -> None:
+        """
+        Send a flow step, making sure the chat shows the cancel keyboard.
+        
+        A message carries a single reply_markup, so a step with an inline
+        keyboard needs a second message to switch the reply keyboard. That
+        message is only sent when the chat is not already showing the cancel
+        keyboard, i.e. on the first step of a flow.
+        """
+        if not inline_keyboard:
+            await update.message.reply_text(message, reply_markup=cancel_keyboard, parse_mode='Markdown')
+            cls._count_api_calls(context, 1)
+        elif context.chat_data is not None and context.chat_data.get(SHOWN_REPLY_KEYBOARD_KEY) == REPLY_KEYBOARD_CANCEL:
+            await update.message.reply_text(message, reply_markup=inline_keyboard, parse_mode='Markdown')
+            cls._count_api_calls(context, 1)
+            cls._reply_keyboard_sends_saved += 1
+        else:
+            await update.message.reply_text(message, reply_markup=inline_keyboard, parse_mode='Markdown')
+            await update.message.reply_text(CANCEL_PROMPT, reply_markup=cancel_keyboard)
+            cls._count_api_calls(context, 2)
+        cls.set_shown_reply_keyboard(context, REPLY_KEYBOARD_CANCEL)
+    
     @classmethod
     def _add_back_button_to_keyboard(cls, keyboard: Optional[InlineKeyboardMarkup], context: ContextTypes.DEFAULT_TYPE) -> Optional[InlineKeyboardMarkup]:
         """Add back button to inline keyboard if there's step history."""
@@ -84,8 +168,9 @@ class FlowManager:
         
         handler = cls.get_handler_by_state(state)
         if handler:
-            # Initialize step history
+            # Initialize step history and the flow's API call count
             context.user_data["flow_step_history"] = []
+            context.user_data[FLOW_API_CALLS_KEY] = 0
             
             result = await handler.start_flow(update, context)
             
@@ -112,13 +197,8 @@ class FlowManager:
             # Don't show back button on first step
             cancel_keyboard = cls._create_cancel_keyboard_fn(show_back=False)
             
-            if inline_keyboard:
-                # Send message with inline keyboard and reply keyboard showing only cancel
-                sent_message = await update.message.reply_text(message, reply_markup=inline_keyboard, parse_mode='Markdown')
-                # Update reply keyboard to show only cancel button
-                await update.message.reply_text("برای لغو عملیات، دکمه 'لغو' را فشار دهید:", reply_markup=cancel_keyboard)
-            else:
-                await update.message.reply_text(message, reply_markup=cancel_keyboard, parse_mode='Markdown')
+            # Send message with inline keyboard (if any), switching the reply keyboard to cancel
+            await cls._send_step(update, context, message, inline_keyboard, cancel_keyboard)
         else:
             await update.message.reply_text("❌ این سرویس در حال حاضر در دسترس نیست.")
     
@@ -161,6 +241,7 @@ class FlowManager:
                 await query.edit_message_text(message, parse_mode='Markdown')
             
             await query.answer()
+            cls._count_api_calls(context, 2)
         else:
             query = update.callback_query
             await query.answer("❌ خطا در پردازش")
@@ -204,6 +285,8 @@ class FlowManager:
                 # Flow completed - restore main keyboard
                 keyboard = cls._create_reply_keyboard_fn()
                 await update.message.reply_text(message, reply_markup=keyboard, parse_mode='Markdown')
+                cls._count_api_calls(context, 1)
+                cls.set_shown_reply_keyboard(context, REPLY_KEYBOARD_MAIN)
             else:
                 # Still in flow - show cancel button (back button will be inline on message)
                 cancel_keyboard = cls._create_cancel_keyboard_fn(show_back=False)
@@ -214,14 +297,12 @@ class FlowManager:
                 if len(step_history) > 0:
                     inline_keyboard = cls._add_back_button_to_keyboard(None, context)
                 
-                if inline_keyboard:
-                    await update.message.reply_text(message, reply_markup=inline_keyboard, parse_mode='Markdown')
-                    await update.message.reply_text("برای لغو عملیات، دکمه 'لغو' را فشار دهید:", reply_markup=cancel_keyboard)
-                else:
-                    await update.message.reply_text(message, reply_markup=cancel_keyboard, parse_mode='Markdown')
+                await cls._send_step(update, context, message, inline_keyboard, cancel_keyboard)
             
             # Clear state if completed
             if result.get("completed"):
+                cls._completed_bookings += 1
+                cls._completed_booking_api_calls += context.user_data.pop(FLOW_API_CALLS_KEY, 0)
                 context.user_data["flow_state"] = None
                 context.user_data["current_step"] = None
                 context.user_data["flow_data"] = {}
@@ -364,18 +445,12 @@ class FlowManager:
                     else:
                         await query.edit_message_text(message, parse_mode='Markdown')
                 await query.answer()
+                cls._count_api_calls(context, 2)
             else:
-                if keyboard:
-                    await update.message.reply_text(message, reply_markup=keyboard, parse_mode='Markdown')
-                    await update.message.reply_text("برای لغو عملیات، دکمه 'لغو' را فشار دهید:", reply_markup=cancel_keyboard)
-                else:
+                if not keyboard and len(step_history) > 0:
                     # Create inline keyboard with just back button if there's more history
-                    if len(step_history) > 0:
-                        keyboard = cls._add_back_button_to_keyboard(None, context)
-                        await update.message.reply_text(message, reply_markup=keyboard, parse_mode='Markdown')
-                        await update.message.reply_text("برای لغو عملیات، دکمه 'لغو' را فشار دهید:", reply_markup=cancel_keyboard)
-                    else:
-                        await update.message.reply_text(message, reply_markup=cancel_keyboard, parse_mode='Markdown')
+                    keyboard = cls._add_back_button_to_keyboard(None, context)
+                await cls._send_step(update, context, message, keyboard, cancel_keyboard)
         else:
             await update.message.reply_text("❌ خطا در بازگشت به مرحله قبلی.")
 
@@ -1,13 +1,21 @@
 """Channel membership validator - Shared service interface and implementation."""
 from abc import ABC, abstractmethod
-from typing import Optional
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from telegram import Bot, ChatMember, Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from config import Settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached users; the longest-cached entry is dropped beyond it
+MEMBERSHIP_CACHE_MAX_USERS = 50000
+
+# Chat member statuses that count as being in the channel
+VALID_MEMBER_STATUSES = ('member', 'administrator', 'creator')
+
 
 class IChannelMembershipValidator(ABC):
     """Interface for channel membership validation."""
@@ -36,9 +44,31 @@ class IChannelMembershipValidator(ABC):
 class ChannelMembershipValidator(IChannelMembershipValidator):
     """Implementation of channel membership validator."""
     
+    # user id -> (is_member, monotonic expiry); members are trusted for
+    # CHANNEL_MEMBER_CACHE_TTL_SECONDS, non-members only for the short
+    # CHANNEL_NON_MEMBER_CACHE_TTL_SECONDS so joining takes effect quickly
+    _membership_cache: Dict[int, Tuple[bool, float]] = {}
+    _cache_hits = 0
+    _cache_misses = 0
+    # Numeric chat id of the channel, resolved by resolve_channel
+    _channel_chat_id: Optional[int] = None
+    # user id -> (is_member, Unix time it was learned), kept current by the channel's
+    # chat_member updates (see record_member_update); consulted before the cache and
+    # the Bot API while younger than CHANNEL_MEMBER_UPDATE_MAX_AGE_SECONDS, since
+    # leaves are missed while the bot is down or not a channel admin
+    _channel_members: Dict[int, Tuple[bool, float]] = {}
+    _member_update_hits = 0
+    # user id -> the membership check currently waiting on the Bot API; concurrent
+    # checks of the same user (double taps, a reply plus a callback) await it
+    # instead of making their own calls
+    _in_flight: Dict[int, "asyncio.Task[Tuple[bool, int]]"] = {}
+    _api_calls = 0
+    _shared_checks = 0
+    _api_calls_saved = 0
+    
     @staticmethod
     async def check_membership(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
-        """Check if user is a member of the channel."""
+        """Check if user is a member of the channel, answering from the cache when fresh."""
         channel_identifier = Settings.get_channel_identifier_for_validation()
         
         if not channel_identifier:
@@ -50,7 +80,120 @@ class ChannelMembershipValidator(IChannelMembershipValidator):
             logger.warning("No user in update, cannot check membership")
             return False
         
-        # Try different formats for channel identifier
+        known = ChannelMembershipValidator._channel_members.get(user.id)
+        if known is not None:
+            if time.time() - known[1] <= Settings.CHANNEL_MEMBER_UPDATE_MAX_AGE_SECONDS:
+                ChannelMembershipValidator._member_update_hits += 1
+                return known[0]
+            # Too old to trust: re-check through the cache / Bot API
+            del ChannelMembershipValidator._channel_members[user.id]
+        
+        cache = ChannelMembershipValidator._membership_cache
+        cached = cache.get(user.id)
+        if cached is not None and cached[1] > time.monotonic():
+            ChannelMembershipValidator._cache_hits += 1
+            return cached[0]
+        
+        in_flight = ChannelMembershipValidator._in_flight
+        check = in_flight.get(user.id)
+        if check is not None:
+            # Shielded so a cancelled caller does not cancel the check the others wait on
+            is_member, api_calls = await asyncio.shield(check)
+            ChannelMembershipValidator._shared_checks += 1
+            ChannelMembershipValidator._api_calls_saved += api_calls
+            return is_member
+        
+        ChannelMembershipValidator._cache_misses += 1
+        check = asyncio.ensure_future(
+            ChannelMembershipValidator._fetch_and_cache(context, user.id, channel_identifier)
+        )
+        in_flight[user.id] = check
+        check.add_done_callback(lambda _: in_flight.pop(user.id, None))
+        is_member, _ = await asyncio.shield(check)
+        return is_member
+    
+    @staticmethod
+    async def _fetch_and_cache(
+        context: ContextTypes.DEFAULT_TYPE,
+        user_id: int,
+        channel_identifier: str
+    ) -> Tuple[bool, int]:
+        """Fetch a user's membership from the Bot API and cache it for its TTL."""
+        is_member, api_calls = await ChannelMembershipValidator._fetch_membership(context, user_id, channel_identifier)
+        
+        ttl = Settings.CHANNEL_MEMBER_CACHE_TTL_SECONDS if is_member else Settings.CHANNEL_NON_MEMBER_CACHE_TTL_SECONDS
+        if ttl > 0:
+            # Re-insert so the dict stays in check order and the oldest entry is evicted first
+            cache = ChannelMembershipValidator._membership_cache
+            cache.pop(user_id, None)
+            if len(cache) >= MEMBERSHIP_CACHE_MAX_USERS:
+                cache.pop(next(iter(cache)))
+            cache[user_id] = (is_member, time.monotonic() + ttl)
+        return is_member, api_calls
+    
+    @staticmethod
+    def is_member_status(member: ChatMember) -> bool:
+        """Whether a chat member status counts as being in the channel."""
+        if member.status == ChatMember.RESTRICTED:
+            return bool(getattr(member, 'is_member', False))
+        return member.status in VALID_MEMBER_STATUSES
+    
+    @staticmethod
+    def get_channel_chat_id() -> Optional[int]:
+        """Numeric chat id of the channel, or None until resolve_channel succeeds."""
+        return ChannelMembershipValidator._channel_chat_id
+    
+    @staticmethod
+    def load_channel_members(members: Dict[int, Tuple[bool, float]]) -> None:
+        """Replace the membership map, e.g. with the one persisted from earlier member updates."""
+        ChannelMembershipValidator._channel_members = dict(members)
+        logger.info(f"Loaded {len(members)} known channel memberships")
+    
+    @staticmethod
+    def record_member_update(user_id: int, is_member: bool) -> None:
+        """Apply a join/leave seen in a chat_member update of the channel."""
+        ChannelMembershipValidator._channel_members[user_id] = (is_member, time.time())
+        ChannelMembershipValidator._membership_cache.pop(user_id, None)
+    
+    @staticmethod
+    def invalidate_membership(user_id: Optional[int] = None) -> None:
+        """Forget the cached membership of one user, or of everyone if user_id is None."""
+        if user_id is None:
+            ChannelMembershipValidator._membership_cache.clear()
+        else:
+            ChannelMembershipValidator._membership_cache.pop(user_id, None)
+    
+    @staticmethod
+    def get_cache_metrics() -> Dict[str, Any]:
+        """
+        Get membership cache metrics.
+        
+        Returns:
+            Dictionary with member update hits (answered from the chat_member map),
+            cache hits, misses (each miss is one API check), checks that shared
+            another caller's in-flight check, Bot API calls made and saved by
+            sharing, hit rate and map/cache sizes
+        """
+        member_update_hits = ChannelMembershipValidator._member_update_hits
+        hits = ChannelMembershipValidator._cache_hits
+        misses = ChannelMembershipValidator._cache_misses
+        shared_checks = ChannelMembershipValidator._shared_checks
+        checks = member_update_hits + hits + misses + shared_checks
+        return {
+            'member_update_hits': member_update_hits,
+            'hits': hits,
+            'misses': misses,
+            'shared_checks': shared_checks,
+            'api_calls': ChannelMembershipValidator._api_calls,
+            'api_calls_saved': ChannelMembershipValidator._api_calls_saved,
+            'hit_rate': (member_update_hits + hits + shared_checks) / checks if checks else 0.0,
+            'known_members': len(ChannelMembershipValidator._channel_members),
+            'cached_users': len(ChannelMembershipValidator._membership_cache),
+        }
+    
+    @staticmethod
+    def _channel_identifiers(channel_identifier: str) -> List[str]:
+        """Every format the configured channel may be addressed by, most likely first."""
         identifiers_to_try = []
         
         # If it's a username (without @), try both with and without @
@@ -64,44 +207,102 @@ class ChannelMembershipValidator(IChannelMembershipValidator):
         channel_id = Settings.get_channel_id()
         if channel_id and channel_id not in identifiers_to_try:
             identifiers_to_try.append(channel_id)
+        return identifiers_to_try
+    
+    @staticmethod
+    async def resolve_channel(bot: Bot) -> Optional[int]:
+        """
+        Resolve the configured channel to its numeric chat id.
+        
+        Tries each identifier format with get_chat and keeps the first chat id
+        that resolves, so membership checks make one call against a known-good
+        id. Runs once at startup and again whenever a check against the stored
+        id fails.
         
-        for chat_id in identifiers_to_try:
+        Args:
+            bot: Bot used for the get_chat calls
+            
+        Returns:
+            The channel's chat id, or None if no channel is configured or none of the formats resolve
+        """
+        chat_id, _ = await ChannelMembershipValidator._resolve_channel(bot)
+        return chat_id
+    
+    @staticmethod
+    async def _resolve_channel(bot: Bot) -> Tuple[Optional[int], int]:
+        """Resolve the channel chat id, also returning the number of Bot API calls made."""
+        channel_identifier = Settings.get_channel_identifier_for_validation()
+        if not channel_identifier:
+            return None, 0
+        
+        api_calls = 0
+        for chat_id in ChannelMembershipValidator._channel_identifiers(channel_identifier):
+            api_calls += 1
+            ChannelMembershipValidator._api_calls += 1
             try:
-                logger.info(f"Checking membership for user {user.id} in channel: {chat_id}")
-                member = await context.bot.get_chat_member(
-                    chat_id=chat_id,
-                    user_id=user.id
-                )
-                
-                valid_statuses = ['member', 'administrator', 'creator']
-                is_member = member.status in valid_statuses
-                
-                logger.info(f"User {user.id} membership check in {chat_id}: status={member.status}, is_member={is_member}")
-                
-                if is_member:
-                    return True
-                    
+                chat = await bot.get_chat(chat_id=chat_id)
             except Exception as e:
-                logger.warning(f"Failed to check membership with identifier '{chat_id}': {e}")
+                logger.warning(f"Failed to resolve channel with identifier '{chat_id}': {e}")
                 continue
+            ChannelMembershipValidator._channel_chat_id = chat.id
+            logger.info(f"Resolved channel '{chat_id}' to chat id {chat.id}")
+            return chat.id, api_calls
+        
+        ChannelMembershipValidator._channel_chat_id = None
+        logger.error(f"Could not resolve channel {channel_identifier}. All identifier formats failed.")
+        return None, api_calls
+    
+    @staticmethod
+    async def _fetch_membership(
+        context: ContextTypes.DEFAULT_TYPE,
+        user_id: int,
+        channel_identifier: str
+    ) -> Tuple[bool, int]:
+        """Ask the Bot API whether the user is a member of the channel, also returning the calls made."""
+        api_calls = 0
+        chat_id = ChannelMembershipValidator._channel_chat_id
+        if chat_id is None:
+            chat_id, resolve_calls = await ChannelMembershipValidator._resolve_channel(context.bot)
+            api_calls += resolve_calls
+        
+        while chat_id is not None:
+            api_calls += 1
+            ChannelMembershipValidator._api_calls += 1
+            try:
+                member = await context.bot.get_chat_member(chat_id=chat_id, user_id=user_id)
+            except Exception as e:
+                logger.warning(f"Failed to check membership of user {user_id} in channel {chat_id}: {e}")
+                # The stored id may be stale (e.g. the channel was migrated); retry once if it resolves differently
+                stale_chat_id = chat_id
+                chat_id, resolve_calls = await ChannelMembershipValidator._resolve_channel(context.bot)
+                api_calls += resolve_calls
+                if chat_id != stale_chat_id:
+                    continue
+                break
+            
+            is_member = ChannelMembershipValidator.is_member_status(member)
+            logger.info(f"User {user_id} membership check in {chat_id}: status={member.status}, is_member={is_member}")
+            return is_member, api_calls
         
-        logger.error(f"Could not verify membership for user {user.id} in channel {channel_identifier}. All attempts failed.")
+        logger.error(f"Could not verify membership for user {user_id} in channel {channel_identifier}.")
         
         # Check if bot is admin in the channel (required for membership checks)
+        api_calls += 1
+        ChannelMembershipValidator._api_calls += 1
         try:
             bot_member = await context.bot.get_chat_member(
-                chat_id=identifiers_to_try[0],
+                chat_id=ChannelMembershipValidator._channel_identifiers(channel_identifier)[0],
                 user_id=context.bot.id
             )
             logger.info(f"Bot membership status in channel: {bot_member.status}")
-            if bot_member.status not in ['administrator', 'creator', 'member']:
+            if bot_member.status not in VALID_MEMBER_STATUSES:
                 logger.error("Bot is not a member/admin of the channel! Bot needs to be added as admin to check user memberships.")
         except Exception as bot_error:
             logger.error(f"Could not check bot's own membership: {bot_error}")
         
         # Return False to enforce validation, but log the issue
         # If you want to temporarily allow all users, change this to True
-        return False
+        return False, api_calls
     
     @staticmethod
     def create_join_button() -> Optional[InlineKeyboardMarkup]:
@@ -1,7 +1,8 @@
 """Shared utilities."""
 from shared.utils.tracking_code import generate_tracking_code
+from shared.utils.construction_counts import count_construction, get_construction_counts
 
-__all__ = ['generate_tracking_code']
+__all__ = ['generate_tracking_code', 'count_construction', 'get_construction_counts']
 
 
 
@@ -0,0 +1,22 @@
+"""Process-wide construction counts of the application's components."""
+from collections import Counter
+from typing import Dict
+
+# "<module>.<class>" -> instances constructed since the process started
+_construction_counts: Counter = Counter()
+
+
+def count_construction(component: object) -> None:
+    """Record one construction of the component's class; call first thing in __init__."""
+    cls = type(component)
+    _construction_counts[f"{cls.__module__}.{cls.__qualname__}"] += 1
+
+
+def get_construction_counts() -> Dict[str, int]:
+    """
+    Get the number of instances constructed per component class.
+    
+    Returns:
+        "<module>.<class>" -> constructions (1 for each application-scoped component)
+    """
+    return dict(_construction_counts)